@@ -81,6 +81,51 @@ func (s *AgentServer) EnsureContainer(ctx context.Context, req *pb.EnsureContain
 	}, nil
 }
 
+// maxEnsureBatch bounds the containers started by one EnsureContainers call.
+const maxEnsureBatch = 64
+
+// EnsureContainers starts `count` containers from one template in parallel, so
+// image resolution and network setup overlap instead of costing one round trip
+// each. Containers that started are returned even if others failed.
+func (s *AgentServer) EnsureContainers(ctx context.Context, req *pb.EnsureContainersRequest) (*pb.EnsureContainersResponse, error) {
+	count := int(req.GetCount())
+	if count <= 0 || count > maxEnsureBatch {
+		return nil, status.Errorf(codes.InvalidArgument, "count must be between 1 and %d", maxEnsureBatch)
+	}
+	template := req.GetTemplate()
+	if template == nil {
+		return nil, status.Error(codes.InvalidArgument, "template is required")
+	}
+
+	workers := make([]*pb.WorkerInfo, count)
+	errs := make([]error, count)
+	var wg sync.WaitGroup
+	for i := 0; i < count; i++ {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			workers[i], errs[i] = s.EnsureContainer(ctx, template)
+		}(i)
+	}
+	wg.Wait()
+
+	resp := &pb.EnsureContainersResponse{}
+	var firstErr error
+	for i, worker := range workers {
+		if errs[i] != nil {
+			if firstErr == nil {
+				firstErr = errs[i]
+			}
+			continue
+		}
+		resp.Workers = append(resp.Workers, worker)
+	}
+	if len(resp.Workers) == 0 {
+		return nil, firstErr
+	}
+	return resp, nil
+}
+
 func (s *AgentServer) InvokeWorker(ctx context.Context, req *pb.InvokeWorkerRequest) (*pb.InvokeWorkerResponse, error) {
 	if req.ContainerId == "" {
 		return nil, status.Error(codes.InvalidArgument, "container_id is required")
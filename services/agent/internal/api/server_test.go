@@ -198,6 +198,64 @@ func TestEnsureContainerRequiresOwnerID(t *testing.T) {
 	assert.Equal(t, codes.InvalidArgument, status.Code(err))
 }
 
+func TestEnsureContainers(t *testing.T) {
+	mockRT := new(MockRuntime)
+	conn := initServer(t, mockRT)
+	defer conn.Close()
+
+	client := pb.NewAgentServiceClient(conn)
+
+	ensureReq := runtime.EnsureRequest{
+		FunctionName: "test-func",
+		Image:        "test-image",
+		OwnerID:      testOwnerID,
+	}
+	mockRT.On("Ensure", mock.Anything, ensureReq).Return(&runtime.WorkerInfo{
+		ID:        "container-1",
+		IPAddress: "10.0.0.9",
+		Port:      8080,
+	}, nil).Once()
+	mockRT.On("Ensure", mock.Anything, ensureReq).Return(nil, assert.AnError).Once()
+	mockRT.On("Ensure", mock.Anything, ensureReq).Return(&runtime.WorkerInfo{
+		ID:        "container-3",
+		IPAddress: "10.0.0.10",
+		Port:      8080,
+	}, nil).Once()
+
+	resp, err := client.EnsureContainers(context.Background(), &pb.EnsureContainersRequest{
+		Template: &pb.EnsureContainerRequest{
+			FunctionName: "test-func",
+			Image:        "test-image",
+			OwnerId:      testOwnerID,
+		},
+		Count: 3,
+	})
+
+	// One failure does not discard the containers that started.
+	assert.NoError(t, err)
+	assert.Len(t, resp.Workers, 2)
+	mockRT.AssertExpectations(t)
+}
+
+func TestEnsureContainersValidatesCount(t *testing.T) {
+	mockRT := new(MockRuntime)
+	conn := initServer(t, mockRT)
+	defer conn.Close()
+	client := pb.NewAgentServiceClient(conn)
+
+	_, err := client.EnsureContainers(context.Background(), &pb.EnsureContainersRequest{
+		Template: &pb.EnsureContainerRequest{
+			FunctionName: "test-func",
+			Image:        "test-image",
+			OwnerId:      testOwnerID,
+		},
+		Count: 0,
+	})
+	assert.Error(t, err)
+	assert.Equal(t, codes.InvalidArgument, status.Code(err))
+	mockRT.AssertNotCalled(t, "Ensure", mock.Anything, mock.Anything)
+}
+
 func TestDestroyContainer(t *testing.T) {
 	mockRT := new(MockRuntime)
 	conn := initServer(t, mockRT)
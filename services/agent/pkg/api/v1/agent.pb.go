@@ -1007,6 +1007,104 @@ func (x *ContainerMetrics) GetCollectedAt() int64 {
 	return 0
 }
 
+// Batch provisioning: start `count` containers from one request template.
+type EnsureContainersRequest struct {
+	state         protoimpl.MessageState  `protogen:"open.v1"`
+	Template      *EnsureContainerRequest `protobuf:"bytes,1,opt,name=template,proto3" json:"template,omitempty"`
+	Count         int32                   `protobuf:"varint,2,opt,name=count,proto3" json:"count,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *EnsureContainersRequest) Reset() {
+	*x = EnsureContainersRequest{}
+	mi := &file_agent_proto_msgTypes[16]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *EnsureContainersRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*EnsureContainersRequest) ProtoMessage() {}
+
+func (x *EnsureContainersRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_agent_proto_msgTypes[16]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use EnsureContainersRequest.ProtoReflect.Descriptor instead.
+func (*EnsureContainersRequest) Descriptor() ([]byte, []int) {
+	return file_agent_proto_rawDescGZIP(), []int{16}
+}
+
+func (x *EnsureContainersRequest) GetTemplate() *EnsureContainerRequest {
+	if x != nil {
+		return x.Template
+	}
+	return nil
+}
+
+func (x *EnsureContainersRequest) GetCount() int32 {
+	if x != nil {
+		return x.Count
+	}
+	return 0
+}
+
+// Containers that started; fewer than `count` on partial failure.
+type EnsureContainersResponse struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Workers       []*WorkerInfo          `protobuf:"bytes,1,rep,name=workers,proto3" json:"workers,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *EnsureContainersResponse) Reset() {
+	*x = EnsureContainersResponse{}
+	mi := &file_agent_proto_msgTypes[17]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *EnsureContainersResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*EnsureContainersResponse) ProtoMessage() {}
+
+func (x *EnsureContainersResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_agent_proto_msgTypes[17]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use EnsureContainersResponse.ProtoReflect.Descriptor instead.
+func (*EnsureContainersResponse) Descriptor() ([]byte, []int) {
+	return file_agent_proto_rawDescGZIP(), []int{17}
+}
+
+func (x *EnsureContainersResponse) GetWorkers() []*WorkerInfo {
+	if x != nil {
+		return x.Workers
+	}
+	return nil
+}
+
 var File_agent_proto protoreflect.FileDescriptor
 
 const file_agent_proto_rawDesc = "" +
@@ -1100,9 +1198,15 @@ const file_agent_proto_rawDesc = "" +
 	"\rrestart_count\x18\n" +
 	" \x01(\rR\frestartCount\x12\x1b\n" +
 	"\texit_time\x18\v \x01(\x03R\bexitTime\x12!\n" +
-	"\fcollected_at\x18\f \x01(\x03R\vcollectedAt2\xa1\x05\n" +
+	"\fcollected_at\x18\f \x01(\x03R\vcollectedAt\"q\n" +
+	"\x17EnsureContainersRequest\x12@\n" +
+	"\btemplate\x18\x01 \x01(\v2$.esb.agent.v1.EnsureContainerRequestR\btemplate\x12\x14\n" +
+	"\x05count\x18\x02 \x01(\x05R\x05count\"N\n" +
+	"\x18EnsureContainersResponse\x122\n" +
+	"\aworkers\x18\x01 \x03(\v2\x18.esb.agent.v1.WorkerInfoR\aworkers2\x84\x06\n" +
 	"\fAgentService\x12Q\n" +
 	"\x0fEnsureContainer\x12$.esb.agent.v1.EnsureContainerRequest\x1a\x18.esb.agent.v1.WorkerInfo\x12a\n" +
+	"\x10EnsureContainers\x12%.esb.agent.v1.EnsureContainersRequest\x1a&.esb.agent.v1.EnsureContainersResponse\x12a\n" +
 	"\x10DestroyContainer\x12%.esb.agent.v1.DestroyContainerRequest\x1a&.esb.agent.v1.DestroyContainerResponse\x12[\n" +
 	"\x0ePauseContainer\x12#.esb.agent.v1.PauseContainerRequest\x1a$.esb.agent.v1.PauseContainerResponse\x12^\n" +
 	"\x0fResumeContainer\x12$.esb.agent.v1.ResumeContainerRequest\x1a%.esb.agent.v1.ResumeContainerResponse\x12[\n" +
@@ -1122,7 +1226,7 @@ func file_agent_proto_rawDescGZIP() []byte {
 	return file_agent_proto_rawDescData
 }
 
-var file_agent_proto_msgTypes = make([]protoimpl.MessageInfo, 19)
+var file_agent_proto_msgTypes = make([]protoimpl.MessageInfo, 21)
 var file_agent_proto_goTypes = []any{
 	(*PauseContainerRequest)(nil),       // 0: esb.agent.v1.PauseContainerRequest
 	(*PauseContainerResponse)(nil),      // 1: esb.agent.v1.PauseContainerResponse
@@ -1140,35 +1244,41 @@ var file_agent_proto_goTypes = []any{
 	(*GetContainerMetricsRequest)(nil),  // 13: esb.agent.v1.GetContainerMetricsRequest
 	(*GetContainerMetricsResponse)(nil), // 14: esb.agent.v1.GetContainerMetricsResponse
 	(*ContainerMetrics)(nil),            // 15: esb.agent.v1.ContainerMetrics
-	nil,                                 // 16: esb.agent.v1.EnsureContainerRequest.EnvEntry
-	nil,                                 // 17: esb.agent.v1.InvokeWorkerRequest.HeadersEntry
-	nil,                                 // 18: esb.agent.v1.InvokeWorkerResponse.HeadersEntry
+	(*EnsureContainersRequest)(nil),     // 16: esb.agent.v1.EnsureContainersRequest
+	(*EnsureContainersResponse)(nil),    // 17: esb.agent.v1.EnsureContainersResponse
+	nil,                                 // 18: esb.agent.v1.EnsureContainerRequest.EnvEntry
+	nil,                                 // 19: esb.agent.v1.InvokeWorkerRequest.HeadersEntry
+	nil,                                 // 20: esb.agent.v1.InvokeWorkerResponse.HeadersEntry
 }
 var file_agent_proto_depIdxs = []int32{
-	16, // 0: esb.agent.v1.EnsureContainerRequest.env:type_name -> esb.agent.v1.EnsureContainerRequest.EnvEntry
-	17, // 1: esb.agent.v1.InvokeWorkerRequest.headers:type_name -> esb.agent.v1.InvokeWorkerRequest.HeadersEntry
-	18, // 2: esb.agent.v1.InvokeWorkerResponse.headers:type_name -> esb.agent.v1.InvokeWorkerResponse.HeadersEntry
+	18, // 0: esb.agent.v1.EnsureContainerRequest.env:type_name -> esb.agent.v1.EnsureContainerRequest.EnvEntry
+	19, // 1: esb.agent.v1.InvokeWorkerRequest.headers:type_name -> esb.agent.v1.InvokeWorkerRequest.HeadersEntry
+	20, // 2: esb.agent.v1.InvokeWorkerResponse.headers:type_name -> esb.agent.v1.InvokeWorkerResponse.HeadersEntry
 	12, // 3: esb.agent.v1.ListContainersResponse.containers:type_name -> esb.agent.v1.ContainerState
 	15, // 4: esb.agent.v1.GetContainerMetricsResponse.metrics:type_name -> esb.agent.v1.ContainerMetrics
-	4,  // 5: esb.agent.v1.AgentService.EnsureContainer:input_type -> esb.agent.v1.EnsureContainerRequest
-	5,  // 6: esb.agent.v1.AgentService.DestroyContainer:input_type -> esb.agent.v1.DestroyContainerRequest
-	0,  // 7: esb.agent.v1.AgentService.PauseContainer:input_type -> esb.agent.v1.PauseContainerRequest
-	2,  // 8: esb.agent.v1.AgentService.ResumeContainer:input_type -> esb.agent.v1.ResumeContainerRequest
-	10, // 9: esb.agent.v1.AgentService.ListContainers:input_type -> esb.agent.v1.ListContainersRequest
-	13, // 10: esb.agent.v1.AgentService.GetContainerMetrics:input_type -> esb.agent.v1.GetContainerMetricsRequest
-	8,  // 11: esb.agent.v1.AgentService.InvokeWorker:input_type -> esb.agent.v1.InvokeWorkerRequest
-	7,  // 12: esb.agent.v1.AgentService.EnsureContainer:output_type -> esb.agent.v1.WorkerInfo
-	6,  // 13: esb.agent.v1.AgentService.DestroyContainer:output_type -> esb.agent.v1.DestroyContainerResponse
-	1,  // 14: esb.agent.v1.AgentService.PauseContainer:output_type -> esb.agent.v1.PauseContainerResponse
-	3,  // 15: esb.agent.v1.AgentService.ResumeContainer:output_type -> esb.agent.v1.ResumeContainerResponse
-	11, // 16: esb.agent.v1.AgentService.ListContainers:output_type -> esb.agent.v1.ListContainersResponse
-	14, // 17: esb.agent.v1.AgentService.GetContainerMetrics:output_type -> esb.agent.v1.GetContainerMetricsResponse
-	9,  // 18: esb.agent.v1.AgentService.InvokeWorker:output_type -> esb.agent.v1.InvokeWorkerResponse
-	12, // [12:19] is the sub-list for method output_type
-	5,  // [5:12] is the sub-list for method input_type
-	5,  // [5:5] is the sub-list for extension type_name
-	5,  // [5:5] is the sub-list for extension extendee
-	0,  // [0:5] is the sub-list for field type_name
+	4,  // 5: esb.agent.v1.EnsureContainersRequest.template:type_name -> esb.agent.v1.EnsureContainerRequest
+	7,  // 6: esb.agent.v1.EnsureContainersResponse.workers:type_name -> esb.agent.v1.WorkerInfo
+	4,  // 7: esb.agent.v1.AgentService.EnsureContainer:input_type -> esb.agent.v1.EnsureContainerRequest
+	16, // 8: esb.agent.v1.AgentService.EnsureContainers:input_type -> esb.agent.v1.EnsureContainersRequest
+	5,  // 9: esb.agent.v1.AgentService.DestroyContainer:input_type -> esb.agent.v1.DestroyContainerRequest
+	0,  // 10: esb.agent.v1.AgentService.PauseContainer:input_type -> esb.agent.v1.PauseContainerRequest
+	2,  // 11: esb.agent.v1.AgentService.ResumeContainer:input_type -> esb.agent.v1.ResumeContainerRequest
+	10, // 12: esb.agent.v1.AgentService.ListContainers:input_type -> esb.agent.v1.ListContainersRequest
+	13, // 13: esb.agent.v1.AgentService.GetContainerMetrics:input_type -> esb.agent.v1.GetContainerMetricsRequest
+	8,  // 14: esb.agent.v1.AgentService.InvokeWorker:input_type -> esb.agent.v1.InvokeWorkerRequest
+	7,  // 15: esb.agent.v1.AgentService.EnsureContainer:output_type -> esb.agent.v1.WorkerInfo
+	17, // 16: esb.agent.v1.AgentService.EnsureContainers:output_type -> esb.agent.v1.EnsureContainersResponse
+	6,  // 17: esb.agent.v1.AgentService.DestroyContainer:output_type -> esb.agent.v1.DestroyContainerResponse
+	1,  // 18: esb.agent.v1.AgentService.PauseContainer:output_type -> esb.agent.v1.PauseContainerResponse
+	3,  // 19: esb.agent.v1.AgentService.ResumeContainer:output_type -> esb.agent.v1.ResumeContainerResponse
+	11, // 20: esb.agent.v1.AgentService.ListContainers:output_type -> esb.agent.v1.ListContainersResponse
+	14, // 21: esb.agent.v1.AgentService.GetContainerMetrics:output_type -> esb.agent.v1.GetContainerMetricsResponse
+	9,  // 22: esb.agent.v1.AgentService.InvokeWorker:output_type -> esb.agent.v1.InvokeWorkerResponse
+	15, // [15:23] is the sub-list for method output_type
+	7,  // [7:15] is the sub-list for method input_type
+	7,  // [7:7] is the sub-list for extension type_name
+	7,  // [7:7] is the sub-list for extension extendee
+	0,  // [0:7] is the sub-list for field type_name
 }
 
 func init() { file_agent_proto_init() }
@@ -1182,7 +1292,7 @@ func file_agent_proto_init() {
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_agent_proto_rawDesc), len(file_agent_proto_rawDesc)),
 			NumEnums:      0,
-			NumMessages:   19,
+			NumMessages:   21,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
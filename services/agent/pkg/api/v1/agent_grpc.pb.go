@@ -20,6 +20,7 @@ const _ = grpc.SupportPackageIsVersion9
 
 const (
 	AgentService_EnsureContainer_FullMethodName     = "/esb.agent.v1.AgentService/EnsureContainer"
+	AgentService_EnsureContainers_FullMethodName    = "/esb.agent.v1.AgentService/EnsureContainers"
 	AgentService_DestroyContainer_FullMethodName    = "/esb.agent.v1.AgentService/DestroyContainer"
 	AgentService_PauseContainer_FullMethodName      = "/esb.agent.v1.AgentService/PauseContainer"
 	AgentService_ResumeContainer_FullMethodName     = "/esb.agent.v1.AgentService/ResumeContainer"
@@ -34,6 +35,8 @@ const (
 type AgentServiceClient interface {
 	// Ensure a container and return connection info (start if missing, reuse if present).
 	EnsureContainer(ctx context.Context, in *EnsureContainerRequest, opts ...grpc.CallOption) (*WorkerInfo, error)
+	// Start `count` containers for one function in a single call (batch scale-out).
+	EnsureContainers(ctx context.Context, in *EnsureContainersRequest, opts ...grpc.CallOption) (*EnsureContainersResponse, error)
 	// Explicitly stop and remove a container.
 	DestroyContainer(ctx context.Context, in *DestroyContainerRequest, opts ...grpc.CallOption) (*DestroyContainerResponse, error)
 	// Pause a container (for warm starts).
@@ -66,6 +69,16 @@ func (c *agentServiceClient) EnsureContainer(ctx context.Context, in *EnsureCont
 	return out, nil
 }
 
+func (c *agentServiceClient) EnsureContainers(ctx context.Context, in *EnsureContainersRequest, opts ...grpc.CallOption) (*EnsureContainersResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(EnsureContainersResponse)
+	err := c.cc.Invoke(ctx, AgentService_EnsureContainers_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 func (c *agentServiceClient) DestroyContainer(ctx context.Context, in *DestroyContainerRequest, opts ...grpc.CallOption) (*DestroyContainerResponse, error) {
 	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
 	out := new(DestroyContainerResponse)
@@ -132,6 +145,8 @@ func (c *agentServiceClient) InvokeWorker(ctx context.Context, in *InvokeWorkerR
 type AgentServiceServer interface {
 	// Ensure a container and return connection info (start if missing, reuse if present).
 	EnsureContainer(context.Context, *EnsureContainerRequest) (*WorkerInfo, error)
+	// Start `count` containers for one function in a single call (batch scale-out).
+	EnsureContainers(context.Context, *EnsureContainersRequest) (*EnsureContainersResponse, error)
 	// Explicitly stop and remove a container.
 	DestroyContainer(context.Context, *DestroyContainerRequest) (*DestroyContainerResponse, error)
 	// Pause a container (for warm starts).
@@ -157,6 +172,9 @@ type UnimplementedAgentServiceServer struct{}
 func (UnimplementedAgentServiceServer) EnsureContainer(context.Context, *EnsureContainerRequest) (*WorkerInfo, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method EnsureContainer not implemented")
 }
+func (UnimplementedAgentServiceServer) EnsureContainers(context.Context, *EnsureContainersRequest) (*EnsureContainersResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method EnsureContainers not implemented")
+}
 func (UnimplementedAgentServiceServer) DestroyContainer(context.Context, *DestroyContainerRequest) (*DestroyContainerResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method DestroyContainer not implemented")
 }
@@ -214,6 +232,24 @@ func _AgentService_EnsureContainer_Handler(srv interface{}, ctx context.Context,
 	return interceptor(ctx, in, info, handler)
 }
 
+func _AgentService_EnsureContainers_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(EnsureContainersRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(AgentServiceServer).EnsureContainers(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: AgentService_EnsureContainers_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(AgentServiceServer).EnsureContainers(ctx, req.(*EnsureContainersRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 func _AgentService_DestroyContainer_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(DestroyContainerRequest)
 	if err := dec(in); err != nil {
@@ -333,6 +369,10 @@ var AgentService_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "EnsureContainer",
 			Handler:    _AgentService_EnsureContainer_Handler,
 		},
+		{
+			MethodName: "EnsureContainers",
+			Handler:    _AgentService_EnsureContainers_Handler,
+		},
 		{
 			MethodName: "DestroyContainer",
 			Handler:    _AgentService_DestroyContainer_Handler,
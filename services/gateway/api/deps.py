@@ -12,9 +12,13 @@ from httpx import AsyncClient
 from services.gateway.client import OrchestratorClient
 from services.gateway.config import config
 from services.gateway.core.event_builder import EventBuilder
+from services.gateway.core.loop_lag import EventLoopLagMonitor
+from services.gateway.core.payload_codec import PayloadCodec
 from services.gateway.core.security import verify_token
-from services.gateway.models import TargetFunction
+from services.gateway.models import RouteAffinity, TargetFunction
 from services.gateway.models.context import InputContext
+from services.gateway.services.agent_health import AgentConnectivityMonitor
+from services.gateway.services.cluster import ClusterRouter
 from services.gateway.services.container_cache import ContainerHostCache
 from services.gateway.services.function_registry import FunctionRegistry
 from services.gateway.services.lambda_invoker import LambdaInvoker
@@ -55,6 +59,26 @@ def get_processor(request: Request) -> GatewayRequestProcessor:
     return request.app.state.processor
 
 
+def get_payload_codec(request: Request) -> PayloadCodec:
+    codec = getattr(request.app.state, "payload_codec", None)
+    if codec is None:
+        codec = PayloadCodec()
+        request.app.state.payload_codec = codec
+    return codec
+
+
+def get_loop_lag_monitor(request: Request) -> Optional[EventLoopLagMonitor]:
+    return getattr(request.app.state, "loop_lag_monitor", None)
+
+
+def get_agent_monitor(request: Request) -> Optional[AgentConnectivityMonitor]:
+    return getattr(request.app.state, "agent_monitor", None)
+
+
+def get_cluster_router(request: Request) -> Optional[ClusterRouter]:
+    return getattr(request.app.state, "cluster", None)
+
+
 def get_orchestrator_client(request: Request) -> OrchestratorClient:
     client = getattr(request.app.state, "orchestrator_client", None)
     if client:
@@ -78,6 +102,10 @@ HttpClientDep = Annotated[AsyncClient, Depends(get_http_client)]
 EventBuilderDep = Annotated[EventBuilder, Depends(get_event_builder)]
 PoolManagerDep = Annotated[PoolManager, Depends(get_pool_manager)]
 ProcessorDep = Annotated[GatewayRequestProcessor, Depends(get_processor)]
+PayloadCodecDep = Annotated[PayloadCodec, Depends(get_payload_codec)]
+LoopLagMonitorDep = Annotated[Optional[EventLoopLagMonitor], Depends(get_loop_lag_monitor)]
+AgentMonitorDep = Annotated[Optional[AgentConnectivityMonitor], Depends(get_agent_monitor)]
+ClusterRouterDep = Annotated[Optional[ClusterRouter], Depends(get_cluster_router)]
 
 
 # ==========================================
@@ -130,18 +158,21 @@ async def resolve_lambda_target(request: Request, route_matcher: RouteMatcherDep
     )
 
     if not target_container and method.upper() == "HEAD":
+        method = "GET"
         target_container, path_params, route_path, function_config = route_matcher.match_route(
-            path, "GET"
+            path, method
         )
 
     if not target_container:
         raise HTTPException(status_code=404, detail="Not Found")
 
+    affinity = route_matcher.get_route_affinity(route_path, method) if route_path else None
     return TargetFunction(
         container_name=target_container,
         path_params=path_params,
         route_path=route_path,
         function_config=function_config,
+        affinity=affinity if isinstance(affinity, RouteAffinity) else None,
     )
 
 
@@ -160,11 +191,17 @@ async def resolve_input_context(
     This effectively decouples the route handler from the Request object.
     """
     body = await request.body()
+    headers = dict(request.headers)
+    affinity_key = (
+        target.affinity.resolve_key(headers, target.path_params, user_id)
+        if target.affinity
+        else None
+    )
     return InputContext(
         function_name=target.container_name,
         method=request.method,
         path=str(request.url.path),
-        headers=dict(request.headers),
+        headers=headers,
         multi_headers={k: request.headers.getlist(k) for k in request.headers.keys()},
         query_params=dict(request.query_params),
         multi_query_params={
@@ -174,6 +211,7 @@ async def resolve_input_context(
         user_id=user_id,
         path_params=target.path_params,
         route_path=target.route_path,
+        affinity_key=affinity_key,
         timeout=config.LAMBDA_INVOKE_TIMEOUT,
     )
 
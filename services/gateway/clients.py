@@ -25,8 +25,8 @@ class ProvisionClient:
         self.orchestrator_timeout = orchestrator_timeout
         self.function_registry = function_registry
 
-    async def provision(self, function_name: str) -> List[WorkerInfo]:
-        """Provision a container and return WorkerInfo list"""
+    async def provision(self, function_name: str, count: int = 1) -> List[WorkerInfo]:
+        """Provision `count` containers and return WorkerInfo list"""
         func_config = self.function_registry.get_function_config(function_name)
         env = {}
         if func_config:
@@ -41,7 +41,7 @@ class ProvisionClient:
             f"{self.manager_url}/containers/provision",
             json={
                 "function_name": function_name,
-                "count": 1,
+                "count": count,
                 "env": env,
             },
             timeout=self.orchestrator_timeout,
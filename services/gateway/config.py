@@ -7,8 +7,9 @@ Uses pydantic-settings for type safety and defaults.
 
 import os
 import sys
+from typing import Literal
 
-from pydantic import Field
+from pydantic import Field, model_validator
 
 from services.common.core.config import BaseAppConfig
 
@@ -107,6 +108,159 @@ class GatewayConfig(BaseAppConfig):
     MAX_CONCURRENT_REQUESTS: int = Field(default=10, description="Max concurrent per function")
     QUEUE_TIMEOUT_SECONDS: int = Field(default=10, description="Queue wait timeout")
 
+    # Warm pool (min_capacity / warm-up API)
+    WARM_POOL_INTERVAL: float = Field(
+        default=10.0, description="Interval for topping pools up to min_capacity (seconds)"
+    )
+    WARM_POOL_MAX_PARALLEL: int = Field(
+        default=2, description="Max concurrent provisions for warm-up"
+    )
+    IDLE_HEALTH_CHECK_INTERVAL: float = Field(
+        default=0.0, description="Interval for health-checking idle workers (0 = disabled)"
+    )
+    IDLE_HEALTH_PROBE_TIMEOUT: float = Field(
+        default=1.0, description="Timeout of one idle worker health probe (seconds)"
+    )
+
+    # Gateway-wide container budget (0 = unlimited)
+    CONTAINER_BUDGET_MAX_CONTAINERS: int = Field(
+        default=0, description="Max containers across all functions (0 = unlimited)"
+    )
+    CONTAINER_BUDGET_MAX_MEMORY_MB: int = Field(
+        default=0, description="Max summed memory_size across all containers (0 = unlimited)"
+    )
+    CONTAINER_BUDGET_DEFAULT_MEMORY_MB: int = Field(
+        default=128, description="Memory assumed for functions without memory_size (MB)"
+    )
+
+    # Node-wide pool coordinator shared by uvicorn worker processes
+    POOL_COORDINATOR_SOCKET: str = Field(
+        default="",
+        description="Unix socket of the pool coordinator (unset = process-local pools)",
+    )
+
+    # Cluster mode: gateway replicas share capacity by function ownership
+    CLUSTER_MODE: Literal["off", "static", "file"] = Field(
+        default="off",
+        description="off, static: CLUSTER_MEMBERS, file: heartbeat files in CLUSTER_REGISTRY_DIR",
+    )
+    CLUSTER_MEMBERS: str = Field(
+        default="", description="Static members: 'owner_id=http://host:port,...'"
+    )
+    CLUSTER_REGISTRY_DIR: str = Field(
+        default="", description="Shared directory of member heartbeat files (file mode)"
+    )
+    CLUSTER_ADVERTISE_URL: str = Field(
+        default="", description="Internal URL other replicas forward to (file mode)"
+    )
+    CLUSTER_MEMBER_TTL_SECONDS: float = Field(
+        default=15.0, description="Drop members whose heartbeat file is older than this"
+    )
+    CLUSTER_REFRESH_INTERVAL: float = Field(
+        default=5.0, description="Membership refresh / pool handoff interval (seconds)"
+    )
+    CLUSTER_SHARED_SECRET: str = Field(
+        default="",
+        description="Token required on replica-to-replica requests (required in cluster mode)",
+    )
+
+    # Gateway-wide provisioning scheduler
+    PROVISION_MAX_CONCURRENCY: int = Field(
+        default=0,
+        description="Max concurrent provisions across all functions (0 = unlimited)",
+    )
+    PROVISION_BATCH_SIZE: int = Field(
+        default=1,
+        description="Containers warm-up / scale-ahead request per Agent call (1 = no batching)",
+    )
+
+    # Container readiness after EnsureContainer / ResumeContainer
+    READINESS_MODE: Literal["tcp", "http"] = Field(
+        default="tcp",
+        description="tcp: port accepts connections, http: RIE answers",
+    )
+    READINESS_TIMEOUT_SECONDS: float = Field(
+        default=10.0, description="Default readiness wait before a container start fails"
+    )
+    READINESS_INITIAL_BACKOFF_SECONDS: float = Field(
+        default=0.005, description="Delay after the first failed probe (doubled per retry)"
+    )
+    READINESS_MAX_BACKOFF_SECONDS: float = Field(
+        default=0.1, description="Upper bound of the delay between readiness probes"
+    )
+
+    # Container lifecycle calls (destroy / pause / resume)
+    LIFECYCLE_MAX_PARALLEL: int = Field(
+        default=8, description="Max concurrent destroy/pause/resume calls to the Agent"
+    )
+    LIFECYCLE_RETRIES: int = Field(
+        default=2, description="Retries of a destroy/pause/resume call on transient gRPC errors"
+    )
+    LIFECYCLE_RETRY_BACKOFF_SECONDS: float = Field(
+        default=0.2, description="Delay before the first retry (doubled per retry)"
+    )
+    SHUTDOWN_DRAIN_TIMEOUT: float = Field(
+        default=10.0,
+        description="Max wait for in-flight invocations before containers are torn down",
+    )
+
+    # Warm restart (re-adopt containers across gateway restarts)
+    WARM_RESTART_ENABLED: bool = Field(
+        default=False,
+        description="Keep containers on shutdown and re-adopt them on the next start",
+    )
+    POOL_SNAPSHOT_PATH: str = Field(
+        default="/app/runtime-config/.pool-snapshot.json",
+        description="Pool snapshot written on shutdown and consumed on startup",
+    )
+    WARM_RESTART_PROBE_TIMEOUT: float = Field(
+        default=2.0, description="Readiness probe timeout per re-adopted container (seconds)"
+    )
+
+    # Schedule-aware pre-warming
+    SCHEDULE_PREWARM_LEAD_SECONDS: float = Field(
+        default=0.0,
+        description="Provision/resume a worker this long before each scheduled run (0 disables)",
+    )
+
+    # Predictive scale-ahead
+    SCALE_AHEAD_ENABLED: bool = Field(
+        default=False, description="Provision workers ahead of forecast demand"
+    )
+    SCALE_AHEAD_INTERVAL: float = Field(
+        default=1.0, description="Scale-ahead evaluation interval (seconds)"
+    )
+    FORECAST_WINDOW_SECONDS: float = Field(
+        default=5.0, description="Demand forecaster aggregation window (seconds)"
+    )
+    FORECAST_HORIZON_SECONDS: float = Field(
+        default=10.0, description="How far ahead to provision (about one cold start)"
+    )
+
+    # Agent connectivity tracking
+    AGENT_HEALTH_PROBE_INTERVAL: float = Field(
+        default=5.0, description="Agent health probe interval while reachable (seconds)"
+    )
+    AGENT_HEALTH_PROBE_TIMEOUT: float = Field(
+        default=1.0, description="Agent health probe timeout (seconds)"
+    )
+    AGENT_RECONNECT_BACKOFF_MAX: float = Field(
+        default=30.0, description="Max probe backoff while the Agent is unreachable (seconds)"
+    )
+
+    # Payload serialization offload
+    PAYLOAD_OFFLOAD_THRESHOLD_BYTES: int = Field(
+        default=256 * 1024,
+        description="Payloads at or above this size are (de)serialized in a thread pool",
+    )
+    PAYLOAD_PROCESS_THRESHOLD_BYTES: int = Field(
+        default=0,
+        description="Payloads at or above this size use a process pool (0 disables)",
+    )
+    PAYLOAD_CODEC_MAX_WORKERS: int = Field(
+        default=2, description="Max executor workers for payload (de)serialization"
+    )
+
     # Circuit breaker settings
     CIRCUIT_BREAKER_THRESHOLD: int = Field(default=5, description="Failure threshold")
     CIRCUIT_BREAKER_RECOVERY_TIMEOUT: float = Field(
@@ -117,6 +271,9 @@ class GatewayConfig(BaseAppConfig):
     DEFAULT_MAX_CAPACITY: int = Field(default=1, description="Default max capacity")
     DEFAULT_MIN_CAPACITY: int = Field(default=0, description="Default min capacity")
     POOL_ACQUIRE_TIMEOUT: float = Field(default=30.0, description="Worker acquisition timeout")
+    POOL_PRIORITY_AGING_SECONDS: float = Field(
+        default=10.0, description="Wait time that promotes a pool waiter by one priority class"
+    )
     HEARTBEAT_INTERVAL: int = Field(default=30, description="Heartbeat interval (seconds)")
     GATEWAY_IDLE_TIMEOUT_SECONDS: int = Field(
         default=300, description="Gateway idle timeout (seconds)"
@@ -125,6 +282,10 @@ class GatewayConfig(BaseAppConfig):
         default=False, description="アイドル後にコンテナを一時停止するか"
     )
     PAUSE_IDLE_SECONDS: int = Field(default=30, description="Pauseまでのアイドル秒数")
+    SPECULATIVE_RESUME_LINGER_SECONDS: float = Field(
+        default=10.0,
+        description="Re-pause workers resumed ahead of demand if unused this long (0 = off)",
+    )
     ORPHAN_GRACE_PERIOD_SECONDS: int = Field(
         default=60, description="Grace period before removing orphan containers (seconds)"
     )
@@ -152,6 +313,13 @@ class GatewayConfig(BaseAppConfig):
 
     # model_config is inherited
 
+    @model_validator(mode="after")
+    def _cluster_requires_secret(self) -> "GatewayConfig":
+        # Replicas accept invocations from each other; never leave that open.
+        if self.CLUSTER_MODE != "off" and not self.CLUSTER_SHARED_SECRET:
+            raise ValueError(f"CLUSTER_MODE={self.CLUSTER_MODE} requires CLUSTER_SHARED_SECRET")
+        return self
+
 
 # Load config as a singleton.
 # pydantic-settings reads environment variables during instantiation.
@@ -0,0 +1,167 @@
+"""
+Adaptive concurrency limiters.
+
+Derive an effective per-function concurrency limit from observed invoke latency.
+`ScalingConfig.max_capacity` stays the hard upper bound; the limiter only shrinks
+the limit while a downstream dependency is slow and grows it back afterwards.
+"""
+
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from services.gateway.models.function import AdaptiveConcurrencyConfig
+
+logger = logging.getLogger("gateway.adaptive_limiter")
+
+
+class AdaptiveLimiter(ABC):
+    """Base class for latency-driven concurrency limiters."""
+
+    def __init__(self, initial_limit: int, min_limit: int, max_limit: int):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+
+    @property
+    def limit(self) -> int:
+        """Current effective concurrency limit."""
+        return int(self._limit)
+
+    def _set_limit(self, value: float) -> None:
+        previous = self.limit
+        self._limit = min(max(value, float(self.min_limit)), float(self.max_limit))
+        if self.limit != previous:
+            logger.debug(f"Concurrency limit changed: {previous} -> {self.limit}")
+
+    @abstractmethod
+    def on_sample(self, latency: float, in_flight: int) -> None:
+        """
+        Record a completed invocation.
+
+        Args:
+            latency: invoke duration in seconds
+            in_flight: invocations in flight when the sample completed
+        """
+        pass
+
+
+class AIMDLimiter(AdaptiveLimiter):
+    """
+    Additive-increase / multiplicative-decrease limiter.
+
+    The limit grows by one while latency stays within `latency_tolerance` times the
+    baseline and the limit is actually used, and is multiplied by `backoff_ratio`
+    (at most once per observed latency window) when latency exceeds it.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_tolerance: float = 2.0,
+        backoff_ratio: float = 0.9,
+        baseline_drift: float = 0.01,
+    ):
+        super().__init__(initial_limit, min_limit, max_limit)
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.baseline_drift = baseline_drift
+        self.baseline: Optional[float] = None
+        self._last_decrease_at = 0.0
+
+    def on_sample(self, latency: float, in_flight: int) -> None:
+        if latency <= 0:
+            return
+        if self.baseline is None or latency < self.baseline:
+            self.baseline = latency
+        else:
+            # Let the baseline drift upwards slowly so a permanently slower function
+            # does not stay throttled forever.
+            self.baseline += (latency - self.baseline) * self.baseline_drift
+
+        if latency > self.baseline * self.latency_tolerance:
+            now = time.monotonic()
+            # One decrease per latency window; samples from the same burst are ignored.
+            if now - self._last_decrease_at >= latency:
+                self._last_decrease_at = now
+                self._set_limit(math.floor(self._limit * self.backoff_ratio))
+            return
+
+        if in_flight * 2 >= self.limit:
+            self._set_limit(self._limit + 1)
+
+
+class GradientLimiter(AdaptiveLimiter):
+    """
+    Gradient limiter comparing short-term latency against a long-term average.
+
+    new_limit = limit * clamp(long_rtt / short_rtt, 0.5, 1.0) + sqrt(limit),
+    blended into the current limit with `smoothing`.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        smoothing: float = 0.2,
+        long_window: int = 100,
+        short_window: int = 10,
+    ):
+        super().__init__(initial_limit, min_limit, max_limit)
+        self.smoothing = smoothing
+        self._long_alpha = 2.0 / (long_window + 1)
+        self._short_alpha = 2.0 / (short_window + 1)
+        self.long_rtt: Optional[float] = None
+        self.short_rtt: Optional[float] = None
+
+    def on_sample(self, latency: float, in_flight: int) -> None:
+        if latency <= 0:
+            return
+        if self.long_rtt is None or self.short_rtt is None:
+            self.long_rtt = latency
+            self.short_rtt = latency
+            return
+
+        self.short_rtt += (latency - self.short_rtt) * self._short_alpha
+        self.long_rtt += (latency - self.long_rtt) * self._long_alpha
+
+        # Recover faster once a latency spike has passed.
+        if self.long_rtt / self.short_rtt > 2.0:
+            self.long_rtt *= 0.95
+
+        gradient = max(0.5, min(1.0, self.long_rtt / self.short_rtt))
+        new_limit = self._limit * gradient
+        # Only grow a limit that is actually being used.
+        if in_flight * 2 >= self.limit:
+            new_limit += math.sqrt(self._limit)
+        self._set_limit(self._limit * (1 - self.smoothing) + new_limit * self.smoothing)
+
+
+def create_adaptive_limiter(
+    config: Optional["AdaptiveConcurrencyConfig"], max_capacity: int
+) -> Optional[AdaptiveLimiter]:
+    """Build a limiter from function scaling settings (None when disabled)."""
+    if config is None or not config.enabled:
+        return None
+
+    initial_limit = config.initial_limit or max_capacity
+    if config.algorithm == "gradient":
+        return GradientLimiter(
+            initial_limit=initial_limit,
+            min_limit=config.min_limit,
+            max_limit=max_capacity,
+            smoothing=config.smoothing,
+        )
+    return AIMDLimiter(
+        initial_limit=initial_limit,
+        min_limit=config.min_limit,
+        max_limit=max_capacity,
+        latency_tolerance=config.latency_tolerance,
+        backoff_ratio=config.backoff_ratio,
+    )
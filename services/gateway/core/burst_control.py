@@ -0,0 +1,83 @@
+"""
+Cold-start burst control: queue behind in-flight invocations or provision.
+
+A waiter that finds no free worker is served either by a new container (after
+one cold start) or by the next in-flight invocation that finishes. With `busy`
+slots finishing every `warm` seconds on average, the q-th queued waiter is
+served after about q * warm / busy seconds, so provisioning only pays off when
+the cold start is shorter than that. A per-function cap bounds concurrent
+provisions regardless of the estimate.
+"""
+
+from typing import Dict, Optional
+
+
+class BurstController:
+    """Per-function provision decision from observed warm/cold durations (EWMA)."""
+
+    def __init__(self, max_concurrent_provisions: int = 0, smoothing: float = 0.2):
+        """
+        Args:
+            max_concurrent_provisions: cap on in-flight provisions (0 = unlimited)
+            smoothing: EWMA weight of a new duration sample
+        """
+        self.max_concurrent_provisions = max(0, max_concurrent_provisions)
+        self.smoothing = smoothing
+        self.warm_seconds: Optional[float] = None
+        self.cold_start_seconds: Optional[float] = None
+        self.deferred = 0
+        self.capped = 0
+
+    def _ewma(self, current: Optional[float], sample: float) -> float:
+        if current is None:
+            return sample
+        return current + (sample - current) * self.smoothing
+
+    def observe_warm(self, seconds: float) -> None:
+        """Duration one invocation held a worker slot."""
+        self.warm_seconds = self._ewma(self.warm_seconds, max(0.0, seconds))
+
+    def observe_cold_start(self, seconds: float) -> None:
+        """Duration of one provision (container start + readiness)."""
+        self.cold_start_seconds = self._ewma(self.cold_start_seconds, max(0.0, seconds))
+
+    def at_cap(self, provisioning: int) -> bool:
+        if self.max_concurrent_provisions and provisioning >= self.max_concurrent_provisions:
+            self.capped += 1
+            return True
+        return False
+
+    def queue_wait(self, queued: int, busy_slots: int) -> Optional[float]:
+        """Expected wait of the `queued`-th waiter behind `busy_slots` (None if unknown)."""
+        if self.warm_seconds is None or busy_slots <= 0:
+            return None
+        return queued * self.warm_seconds / busy_slots
+
+    def should_provision(self, queued: int, busy_slots: int, stalled: float) -> bool:
+        """
+        Whether the waiter at position `queued` (not covered by in-flight provisions)
+        is served sooner by a cold start than by queueing.
+
+        `stalled` is how long the waiter has waited without any slot being freed.
+        Once that exceeds a cold start the estimate is clearly wrong (e.g. stuck
+        invocations) and the waiter provisions anyway.
+        """
+        cold = self.cold_start_seconds
+        expected = self.queue_wait(queued, busy_slots)
+        if cold is None or expected is None or cold < expected or stalled >= cold:
+            return True
+        self.deferred += 1
+        return False
+
+    @property
+    def stats(self) -> Dict[str, object]:
+        def _ms(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value * 1000, 3)
+
+        return {
+            "warm_ms": _ms(self.warm_seconds),
+            "cold_start_ms": _ms(self.cold_start_seconds),
+            "max_concurrent_provisions": self.max_concurrent_provisions,
+            "deferred": self.deferred,
+            "capped": self.capped,
+        }
@@ -0,0 +1,127 @@
+"""
+Gateway-wide container budget.
+
+Caps the total number of containers and/or their summed memory across all
+functions. When a provision would exceed the budget, idle workers of other
+functions are reclaimed: the longest idle first, weighted by how expensive the
+victim is to cold start again (idle seconds / mean provision seconds).
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from services.common.models.internal import WorkerInfo
+
+# Assumed provision time until a function has been provisioned once.
+DEFAULT_COLD_START_SECONDS = 1.0
+
+
+class BudgetCandidate:
+    """An idle worker that may be reclaimed."""
+
+    __slots__ = ("function_name", "worker", "memory_mb", "idle_seconds", "cold_start_seconds")
+
+    def __init__(
+        self,
+        function_name: str,
+        worker: WorkerInfo,
+        memory_mb: int,
+        idle_seconds: float,
+        cold_start_seconds: float,
+    ):
+        self.function_name = function_name
+        self.worker = worker
+        self.memory_mb = memory_mb
+        self.idle_seconds = idle_seconds
+        self.cold_start_seconds = cold_start_seconds
+
+    @property
+    def score(self) -> float:
+        """Higher is a better victim: long idle, cheap to bring back."""
+        return self.idle_seconds / max(self.cold_start_seconds, 0.001)
+
+
+class ContainerBudget:
+    """
+    Budget policy (limits of 0 disable the respective check).
+
+    Usage is supplied by the caller (PoolManager derives it from the pools), so the
+    budget holds no per-worker state that could drift.
+    """
+
+    def __init__(
+        self,
+        max_containers: int = 0,
+        max_memory_mb: int = 0,
+        default_memory_mb: int = 128,
+        smoothing: float = 0.3,
+    ):
+        try:
+            self.max_containers = max(0, int(max_containers))
+            self.max_memory_mb = max(0, int(max_memory_mb))
+            self.default_memory_mb = max(1, int(default_memory_mb))
+        except (TypeError, ValueError):
+            self.max_containers, self.max_memory_mb, self.default_memory_mb = 0, 0, 128
+        self.smoothing = smoothing
+        self._cold_start: Dict[str, float] = {}
+        self.evictions = 0
+        self.rejections = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_containers > 0 or self.max_memory_mb > 0
+
+    def memory_of(self, memory_size: Optional[int]) -> int:
+        return memory_size or self.default_memory_mb
+
+    def fits(self, containers: int, memory_mb: int) -> bool:
+        """Whether the given usage (including the pending provision) is within budget."""
+        if self.max_containers and containers > self.max_containers:
+            return False
+        if self.max_memory_mb and memory_mb > self.max_memory_mb:
+            return False
+        return True
+
+    def observe_cold_start(self, function_name: str, seconds: float) -> None:
+        """Record one provision duration (EWMA per function)."""
+        current = self._cold_start.get(function_name)
+        if current is None:
+            self._cold_start[function_name] = seconds
+        else:
+            self._cold_start[function_name] = current + (seconds - current) * self.smoothing
+
+    def cold_start_seconds(self, function_name: str) -> float:
+        return self._cold_start.get(function_name, DEFAULT_COLD_START_SECONDS)
+
+    def select_victims(
+        self,
+        candidates: Iterable[BudgetCandidate],
+        containers: int,
+        memory_mb: int,
+    ) -> Optional[List[BudgetCandidate]]:
+        """
+        Pick the fewest best-scored candidates that bring usage within budget.
+
+        Returns None if reclaiming every candidate would still not be enough.
+        """
+        victims: List[BudgetCandidate] = []
+        for candidate in sorted(candidates, key=lambda c: c.score, reverse=True):
+            if self.fits(containers, memory_mb):
+                break
+            victims.append(candidate)
+            containers -= 1
+            memory_mb -= candidate.memory_mb
+        return victims if self.fits(containers, memory_mb) else None
+
+    def stats(self, usage: Tuple[int, int]) -> dict:
+        containers, memory_mb = usage
+        return {
+            "max_containers": self.max_containers,
+            "max_memory_mb": self.max_memory_mb,
+            "containers": containers,
+            "memory_mb": memory_mb,
+            "evictions": self.evictions,
+            "rejections": self.rejections,
+            "cold_start_ms": {
+                name: round(seconds * 1000, 3) for name, seconds in self._cold_start.items()
+            },
+        }
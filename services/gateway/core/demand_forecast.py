@@ -0,0 +1,160 @@
+"""
+Per-function demand forecasting for scale-ahead provisioning.
+
+Arrivals and peak concurrency are aggregated into fixed windows and smoothed
+with Holt's linear (level + trend) exponential smoothing, so a ramp-up is
+extrapolated a few windows ahead instead of being discovered by cold starts.
+"""
+
+import math
+import time
+from typing import Callable, Dict, Optional
+
+# Idle gaps longer than this many windows reset the estimators instead of
+# replaying every empty window.
+MAX_CATCH_UP_WINDOWS = 120
+
+
+class HoltEstimator:
+    """Holt's double exponential smoothing (level + trend)."""
+
+    def __init__(self, alpha: float = 0.5, beta: float = 0.3):
+        self.alpha = alpha
+        self.beta = beta
+        self.level: Optional[float] = None
+        self.trend = 0.0
+
+    def update(self, value: float) -> None:
+        if self.level is None:
+            self.level = value
+            return
+        previous = self.level
+        self.level = self.alpha * value + (1 - self.alpha) * (self.level + self.trend)
+        self.trend = self.beta * (self.level - previous) + (1 - self.beta) * self.trend
+
+    def forecast(self, steps: int = 1) -> float:
+        if self.level is None:
+            return 0.0
+        return max(0.0, self.level + steps * self.trend)
+
+    def reset(self) -> None:
+        self.level = None
+        self.trend = 0.0
+
+
+class DemandForecaster:
+    """
+    Arrival-rate and concurrency estimator for one function.
+
+    - demand = busy + provisioning + waiting, sampled on every arrival/release
+    - per window: arrival rate (req/s) and peak demand feed two Holt estimators
+    - forecast_concurrency(): max of the peak-demand forecast and
+      forecast rate x mean service time (Little's law), `horizon` seconds ahead
+    - forecast error: EWMA of |one-window-ahead forecast - actual peak|
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 5.0,
+        horizon_seconds: float = 10.0,
+        alpha: float = 0.5,
+        beta: float = 0.3,
+        smoothing: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.window_seconds = max(0.01, float(window_seconds))
+        self.horizon_seconds = max(0.0, float(horizon_seconds))
+        self.smoothing = smoothing
+        self._clock = clock
+        self._rate = HoltEstimator(alpha, beta)
+        self._concurrency = HoltEstimator(alpha, beta)
+
+        self._window_start = clock()
+        self._arrivals = 0
+        self._demand = 0
+        self._peak = 0
+        self._service_time: Optional[float] = None
+        self._abs_error: Optional[float] = None
+        self._windows = 0
+
+    @property
+    def horizon_windows(self) -> int:
+        return max(1, math.ceil(self.horizon_seconds / self.window_seconds))
+
+    def _close_window(self) -> None:
+        expected = self._concurrency.forecast(1) if self._windows else None
+        if expected is not None:
+            error = abs(expected - self._peak)
+            if self._abs_error is None:
+                self._abs_error = error
+            else:
+                self._abs_error += (error - self._abs_error) * self.smoothing
+        self._rate.update(self._arrivals / self.window_seconds)
+        self._concurrency.update(self._peak)
+        self._windows += 1
+        self._arrivals = 0
+        self._peak = self._demand
+
+    def _advance(self) -> None:
+        now = self._clock()
+        elapsed = int((now - self._window_start) // self.window_seconds)
+        if elapsed <= 0:
+            return
+        if elapsed > MAX_CATCH_UP_WINDOWS:
+            # Long idle gap: start over from the current demand.
+            self._rate.reset()
+            self._concurrency.reset()
+            self._arrivals = 0
+            self._peak = self._demand
+            self._windows = 0
+        else:
+            for _ in range(elapsed):
+                self._close_window()
+        self._window_start += elapsed * self.window_seconds
+
+    def _observe(self, demand: int) -> None:
+        self._demand = max(0, demand)
+        self._peak = max(self._peak, self._demand)
+
+    def on_arrival(self, demand: int) -> None:
+        """Record one acquire request and the resulting demand."""
+        self._advance()
+        self._arrivals += 1
+        self._observe(demand)
+
+    def on_release(self, demand: int, service_time: Optional[float] = None) -> None:
+        """Record a release (demand after it) and the observed busy time."""
+        self._advance()
+        self._observe(demand)
+        if service_time is not None and service_time >= 0:
+            if self._service_time is None:
+                self._service_time = service_time
+            else:
+                self._service_time += (service_time - self._service_time) * self.smoothing
+
+    def forecast_rate(self) -> float:
+        """Arrival rate (req/s) expected `horizon` ahead."""
+        self._advance()
+        return self._rate.forecast(self.horizon_windows)
+
+    def forecast_concurrency(self) -> float:
+        """Concurrent workers expected `horizon` ahead."""
+        self._advance()
+        steps = self.horizon_windows
+        by_peak = self._concurrency.forecast(steps)
+        by_rate = self._rate.forecast(steps) * (self._service_time or 0.0)
+        return max(by_peak, by_rate)
+
+    @property
+    def stats(self) -> Dict[str, Optional[float]]:
+        forecast = self.forecast_concurrency()
+        return {
+            "arrival_rate": round(self._rate.level or 0.0, 3),
+            "forecast_rate": round(self._rate.forecast(self.horizon_windows), 3),
+            "forecast_concurrency": round(forecast, 3),
+            "forecast_error": None if self._abs_error is None else round(self._abs_error, 3),
+            "service_time_ms": (
+                None if self._service_time is None else round(self._service_time * 1000, 3)
+            ),
+            "windows": self._windows,
+        }
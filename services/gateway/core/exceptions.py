@@ -38,6 +38,20 @@ class ContainerStartError(LambdaInvokeError):
         super().__init__(f"Failed to start container {function_name}: {cause}")
 
 
+class AgentUnavailableError(ContainerStartError):
+    """Raised without contacting the Agent while it is known to be unreachable."""
+
+    def __init__(self, function_name: str, cause: Union[Exception, str] = "Agent unavailable"):
+        super().__init__(function_name, cause)
+
+
+class ContainerBudgetExceededError(ContainerStartError):
+    """Raised when the gateway-wide container budget is full and nothing can be reclaimed."""
+
+    def __init__(self, function_name: str, cause: Union[Exception, str] = "Container budget full"):
+        super().__init__(function_name, cause)
+
+
 class LambdaExecutionError(LambdaInvokeError):
     """Raised when Lambda execution fails."""
 
@@ -0,0 +1,73 @@
+"""
+Consistent-hash ring for sticky worker affinity.
+
+Each node is placed on the ring at several virtual points, so adding or removing
+a worker only moves the keys that hashed next to it.
+"""
+
+import bisect
+import hashlib
+from typing import Dict, Iterable, Iterator, List, Set
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing:
+    """Ring of node ids with `replicas` virtual points per node."""
+
+    def __init__(self, replicas: int = 64):
+        self.replicas = max(1, replicas)
+        self._points: List[int] = []
+        self._owners: Dict[int, str] = {}
+        self._nodes: Set[str] = set()
+
+    @property
+    def nodes(self) -> Set[str]:
+        return self._nodes
+
+    def add(self, node: str) -> None:
+        if node in self._nodes:
+            return
+        self._nodes.add(node)
+        for i in range(self.replicas):
+            point = _hash(f"{node}#{i}")
+            if point in self._owners:
+                continue
+            self._owners[point] = node
+            bisect.insort(self._points, point)
+
+    def remove(self, node: str) -> None:
+        if node not in self._nodes:
+            return
+        self._nodes.discard(node)
+        for i in range(self.replicas):
+            point = _hash(f"{node}#{i}")
+            if self._owners.get(point) == node:
+                del self._owners[point]
+                index = bisect.bisect_left(self._points, point)
+                del self._points[index]
+
+    def sync(self, nodes: Iterable[str]) -> None:
+        """Add/remove nodes so the ring matches `nodes` (minimal movement)."""
+        wanted = set(nodes)
+        for node in self._nodes - wanted:
+            self.remove(node)
+        for node in wanted - self._nodes:
+            self.add(node)
+
+    def walk(self, key: str) -> Iterator[str]:
+        """Distinct nodes in ring order starting at the key's position."""
+        if not self._points:
+            return
+        start = bisect.bisect(self._points, _hash(key))
+        seen: Set[str] = set()
+        count = len(self._points)
+        for offset in range(count):
+            node = self._owners[self._points[(start + offset) % count]]
+            if node not in seen:
+                seen.add(node)
+                yield node
+                if len(seen) == len(self._nodes):
+                    return
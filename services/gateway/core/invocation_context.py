@@ -0,0 +1,55 @@
+"""
+Invocation context shared across the invoke pipeline.
+
+Uses ContextVar (like services.common.core.request_context) so scheduling hints
+reach ContainerPool without widening the InvocationBackend interface.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Generator, Optional
+
+
+class InvocationPriority(IntEnum):
+    """Priority class of an invocation (lower value is served first)."""
+
+    INTERACTIVE = 0  # HTTP routes and synchronous Invoke API calls
+    SCHEDULED = 1  # SchedulerService cron/rate jobs
+    ASYNC = 2  # InvocationType=Event background tasks
+
+
+_priority_var: ContextVar[InvocationPriority] = ContextVar(
+    "invocation_priority", default=InvocationPriority.INTERACTIVE
+)
+_affinity_var: ContextVar[Optional[str]] = ContextVar("invocation_affinity", default=None)
+
+
+def get_invocation_priority() -> InvocationPriority:
+    """Get the priority class of the current invocation."""
+    return _priority_var.get()
+
+
+@contextmanager
+def invocation_priority(priority: InvocationPriority) -> Generator[None, None, None]:
+    """Set the priority class for the duration of the block."""
+    token = _priority_var.set(priority)
+    try:
+        yield
+    finally:
+        _priority_var.reset(token)
+
+
+def get_invocation_affinity() -> Optional[str]:
+    """Get the sticky-routing key of the current invocation, if any."""
+    return _affinity_var.get()
+
+
+@contextmanager
+def invocation_affinity(key: Optional[str]) -> Generator[None, None, None]:
+    """Prefer the same worker for the same key for the duration of the block."""
+    token = _affinity_var.set(key)
+    try:
+        yield
+    finally:
+        _affinity_var.reset(token)
@@ -0,0 +1,68 @@
+"""
+Event loop lag monitor.
+
+Periodically sleeps for a fixed interval and records how late the loop woke up.
+Lag above a few milliseconds means something is blocking the event loop
+(e.g. inline serialization of a large payload).
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger("gateway.loop_lag")
+
+
+class EventLoopLagMonitor:
+    """Sample event loop scheduling delay in the background."""
+
+    def __init__(self, interval: float = 0.1, smoothing: float = 0.1):
+        self.interval = interval
+        self.smoothing = smoothing
+        self.last_lag = 0.0
+        self.avg_lag = 0.0
+        self.max_lag = 0.0
+        self.samples = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, lag: float) -> None:
+        """Record one lag sample (seconds)."""
+        lag = max(0.0, lag)
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        if self.samples == 0:
+            self.avg_lag = lag
+        else:
+            self.avg_lag += (lag - self.avg_lag) * self.smoothing
+        self.samples += 1
+
+    async def start(self) -> None:
+        """Start sampling."""
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(time.monotonic() - expected)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Lag statistics in milliseconds."""
+        return {
+            "last_lag_ms": round(self.last_lag * 1000, 3),
+            "avg_lag_ms": round(self.avg_lag * 1000, 3),
+            "max_lag_ms": round(self.max_lag * 1000, 3),
+            "samples": self.samples,
+        }
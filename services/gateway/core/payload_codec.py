@@ -0,0 +1,116 @@
+"""
+Size-aware payload encoding/decoding.
+
+Small payloads are encoded/decoded inline on the event loop. Large ones are moved
+to a bounded thread pool (or, optionally, a process pool for very large payloads)
+so a single multi-megabyte request does not stall every other in-flight request.
+"""
+
+import asyncio
+import contextvars
+import functools
+import json
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from services.common.core.request_context import get_request_id
+from services.gateway.core.event_builder import EventBuilder
+from services.gateway.core.utils import parse_lambda_response
+from services.gateway.models.context import InputContext
+from services.gateway.models.result import InvocationResult
+
+logger = logging.getLogger("gateway.payload_codec")
+
+T = TypeVar("T")
+
+
+def encode_event(
+    event_builder: EventBuilder, context: InputContext, request_id: Optional[str] = None
+) -> bytes:
+    """
+    Build the Lambda event for a context and serialize it to JSON bytes.
+
+    request_id is resolved by the caller on the event loop, because a process pool
+    worker does not see the request's ContextVars.
+    """
+    event = event_builder.build(context)
+    if request_id:
+        event.setdefault("requestContext", {})["requestId"] = request_id
+    return json.dumps(event).encode("utf-8")
+
+
+class PayloadCodec:
+    """
+    Dispatch payload (de)serialization by size.
+
+    - size < offload_threshold: inline (no executor hop)
+    - size >= process_threshold (when > 0): process pool
+    - otherwise: bounded thread pool
+    """
+
+    def __init__(
+        self,
+        offload_threshold: int = 256 * 1024,
+        process_threshold: int = 0,
+        max_workers: int = 2,
+    ):
+        self.offload_threshold = int(offload_threshold)
+        self.process_threshold = int(process_threshold)
+        self.max_workers = max(1, int(max_workers))
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._counters: Dict[str, int] = {"inline": 0, "thread": 0, "process": 0}
+
+    def _select_executor(self, size: int) -> Optional[Executor]:
+        if size < self.offload_threshold:
+            return None
+        if self.process_threshold > 0 and size >= self.process_threshold:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._process_pool
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="payload-codec"
+            )
+        return self._thread_pool
+
+    async def run(self, func: Callable[..., T], *args: Any, size: int) -> T:
+        """Run a (de)serialization function inline or in an executor based on size."""
+        executor = self._select_executor(size)
+        if executor is None:
+            self._counters["inline"] += 1
+            return func(*args)
+
+        kind = "process" if executor is self._process_pool else "thread"
+        self._counters[kind] += 1
+        loop = asyncio.get_running_loop()
+        if kind == "thread":
+            # run_in_executor does not propagate ContextVars (request id, trace id).
+            ctx = contextvars.copy_context()
+            return await loop.run_in_executor(executor, functools.partial(ctx.run, func, *args))
+        return await loop.run_in_executor(executor, func, *args)
+
+    async def encode_event(self, event_builder: EventBuilder, context: InputContext) -> bytes:
+        """Build and serialize the Lambda event for an incoming request."""
+        return await self.run(
+            encode_event, event_builder, context, get_request_id(), size=len(context.body)
+        )
+
+    async def decode_response(self, result: InvocationResult) -> Dict[str, Any]:
+        """Parse a Lambda response (JSON + base64 body) into FastAPI response data."""
+        return await self.run(parse_lambda_response, result, size=len(result.payload))
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Dispatch counters per execution mode."""
+        return dict(self._counters)
+
+    def shutdown(self) -> None:
+        """Shut down executors (called on Gateway shutdown)."""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
@@ -0,0 +1,100 @@
+"""
+Gateway-wide provisioning scheduler.
+
+Bounds concurrent EnsureContainer calls across all functions and orders the
+queue with start-time fair queuing: each function's requests get virtual start
+tags spaced 1/weight apart, so a function with a deep queue cannot push back a
+function that needs a single container. Warm-up (background) requests are only
+served while no demand-driven request is waiting.
+"""
+
+import asyncio
+import heapq
+import itertools
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Callable, Dict, List, Tuple
+
+_Entry = Tuple[float, int, str, "asyncio.Future[None]"]
+
+
+class ProvisionScheduler:
+    def __init__(self, max_concurrent: int, weight_of: Callable[[str], float] = lambda _: 1.0):
+        """
+        Args:
+            max_concurrent: max provisions in flight across all functions
+            weight_of: share of a function relative to others (default 1.0)
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.weight_of = weight_of
+        self._active = 0
+        # Virtual time = start tag of the last dispatched request.
+        self._vtime = 0.0
+        # (background, function) -> finish tag of its last queued request.
+        self._finish: Dict[Tuple[bool, str], float] = {}
+        self._demand: List[_Entry] = []
+        self._background: List[_Entry] = []
+        self._seq = itertools.count()
+        self.granted: Dict[str, int] = {}
+
+    def _tag(self, function_name: str, background: bool) -> float:
+        try:
+            weight = float(self.weight_of(function_name))
+        except Exception:
+            weight = 1.0
+        key = (background, function_name)
+        start = max(self._vtime, self._finish.get(key, 0.0))
+        self._finish[key] = start + 1.0 / max(weight, 0.001)
+        return start
+
+    def _dispatch(self) -> None:
+        while self._active < self.max_concurrent:
+            queue = self._demand if self._demand else self._background
+            if not queue:
+                return
+            start, _, function_name, future = heapq.heappop(queue)
+            if future.done():
+                # Cancelled while queued.
+                continue
+            self._vtime = max(self._vtime, start)
+            self._active += 1
+            self.granted[function_name] = self.granted.get(function_name, 0) + 1
+            future.set_result(None)
+
+    def _release(self) -> None:
+        self._active -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(
+        self, function_name: str, background: bool = False
+    ) -> AsyncGenerator[None, None]:
+        """Hold one provisioning slot (waiting in fair order if all are in use)."""
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        queue = self._background if background else self._demand
+        heapq.heappush(
+            queue, (self._tag(function_name, background), next(self._seq), function_name, future)
+        )
+        self._dispatch()
+        try:
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # Granted at the same time as the cancel: give the slot back.
+                self._release()
+            else:
+                future.cancel()
+            raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    @property
+    def stats(self) -> Dict[str, object]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "active": self._active,
+            "queued": sum(1 for e in self._demand if not e[3].done()),
+            "queued_background": sum(1 for e in self._background if not e[3].done()),
+            "granted": dict(self.granted),
+        }
@@ -0,0 +1,191 @@
+"""
+Container readiness after EnsureContainer.
+
+A new worker is handed out only once it can serve. Probes retry with
+exponential backoff starting at a few milliseconds (a fixed 100 ms poll added
+up to 100 ms to every cold start), and every successful wait is recorded in a
+latency histogram.
+
+Modes:
+- tcp: the worker port accepts connections
+- http: the RIE answers an HTTP request (any status line; the port can be open
+  before the RIE serves)
+"""
+
+import asyncio
+import bisect
+import contextlib
+from typing import Any, Dict, Optional, Sequence
+
+from services.gateway.core.exceptions import ContainerStartError
+
+READINESS_MODES = ("tcp", "http")
+RIE_INVOKE_PATH = "/2015-03-31/functions/function/invocations"
+_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (upper bounds in milliseconds)."""
+
+    def __init__(self, buckets_ms: Sequence[float] = _BUCKETS_MS):
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        # counts[i] = samples <= buckets_ms[i] (and > the previous bound); last = overflow.
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, seconds: float) -> None:
+        ms = max(0.0, seconds) * 1000
+        self.counts[bisect.bisect_left(self.buckets_ms, ms)] += 1
+        self.count += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound (ms) of the bucket holding the q-quantile (None if empty)."""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets_ms, self.counts[:-1], strict=True):
+            seen += n
+            if seen >= rank:
+                return min(float(bound), self.max_ms)
+        return self.max_ms
+
+    @property
+    def stats(self) -> Dict[str, object]:
+        buckets = {
+            f"le_{bound:g}ms": n for bound, n in zip(self.buckets_ms, self.counts[:-1], strict=True)
+        }
+        buckets[f"gt_{self.buckets_ms[-1]:g}ms"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.sum_ms / self.count, 3) if self.count else None,
+            "p50_ms": self.quantile(0.5),
+            "p90_ms": self.quantile(0.9),
+            "p99_ms": self.quantile(0.99),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": buckets,
+        }
+
+
+class ReadinessProber:
+    """Wait until a worker can serve, with exponential backoff between probes."""
+
+    def __init__(
+        self,
+        mode: str = "tcp",
+        timeout: float = 10.0,
+        initial_backoff: float = 0.005,
+        max_backoff: float = 0.1,
+        probe_timeout: float = 1.0,
+        http_path: str = RIE_INVOKE_PATH,
+    ):
+        """
+        Args:
+            mode: "tcp" or "http" (see module docstring)
+            timeout: default wait before the container counts as failed (seconds)
+            initial_backoff: delay after the first failed probe, doubled up to max_backoff
+            probe_timeout: cap on a single connect / HTTP exchange
+            http_path: request path of the HTTP probe
+        """
+        if mode not in READINESS_MODES:
+            raise ValueError(f"Unknown readiness mode: {mode}")
+        self.mode = mode
+        self.timeout = timeout
+        self.initial_backoff = max(0.001, initial_backoff)
+        self.max_backoff = max(self.initial_backoff, max_backoff)
+        self.probe_timeout = probe_timeout
+        self.http_path = http_path
+        self.histogram = LatencyHistogram()
+        self.failures = 0
+
+    async def _probe(self, host: str, port: int) -> None:
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            if self.mode == "http":
+                writer.write(
+                    f"GET {self.http_path} HTTP/1.1\r\nHost: {host}:{port}\r\n"
+                    "Connection: close\r\n\r\n".encode()
+                )
+                await writer.drain()
+                status_line = await reader.readline()
+                if not status_line.startswith(b"HTTP/"):
+                    raise ConnectionError(f"No HTTP response from {host}:{port}")
+        finally:
+            writer.close()
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
+
+    async def wait(
+        self,
+        function_name: str,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        observe: bool = True,
+    ) -> None:
+        """
+        Return once the worker at host:port is ready; raise ContainerStartError
+        after `timeout` (default: the prober's). `observe=False` keeps the wait
+        out of the histogram (e.g. re-probing adopted containers).
+        """
+        if timeout is None:
+            timeout = self.timeout
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + timeout
+        delay = self.initial_backoff
+        last_error: Optional[BaseException] = None
+        while True:
+            try:
+                probe_timeout = max(0.001, min(self.probe_timeout, deadline - loop.time()))
+                await asyncio.wait_for(self._probe(host, port), timeout=probe_timeout)
+                if observe:
+                    self.histogram.observe(loop.time() - started)
+                return
+            except (asyncio.TimeoutError, OSError) as e:
+                last_error = e
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.max_backoff)
+
+        if observe:
+            self.failures += 1
+        raise ContainerStartError(
+            function_name,
+            last_error
+            or Exception(f"Port {port} on {host} did not become ready within {timeout}s"),
+        )
+
+    @property
+    def stats(self) -> Dict[str, object]:
+        return {"mode": self.mode, "failures": self.failures, **self.histogram.stats}
+
+
+def create_readiness_prober(config: Any) -> ReadinessProber:
+    """Build a prober from READINESS_* settings (defaults for missing/invalid values)."""
+    mode = getattr(config, "READINESS_MODE", "tcp")
+    if not isinstance(mode, str) or mode not in READINESS_MODES:
+        mode = "tcp"
+    try:
+        timeout = float(config.READINESS_TIMEOUT_SECONDS)
+        initial_backoff = float(config.READINESS_INITIAL_BACKOFF_SECONDS)
+        max_backoff = float(config.READINESS_MAX_BACKOFF_SECONDS)
+    except (AttributeError, TypeError, ValueError):
+        timeout, initial_backoff, max_backoff = 10.0, 0.005, 0.1
+    return ReadinessProber(
+        mode, timeout=timeout, initial_backoff=initial_backoff, max_backoff=max_backoff
+    )
+
+
+def function_readiness_timeout(func_config: Any) -> Optional[float]:
+    """scaling.readiness_timeout of a function, or None to use the prober's default."""
+    timeout = getattr(getattr(func_config, "scaling", None), "readiness_timeout", None)
+    if isinstance(timeout, (int, float)) and not isinstance(timeout, bool) and timeout > 0:
+        return float(timeout)
+    return None
@@ -0,0 +1,190 @@
+"""
+Hierarchical timer wheel for per-worker idle deadlines.
+
+One background task per process replaces one asyncio.Task per pending timer.
+Scheduling, rescheduling and cancelling a timer are O(1): level 0 has
+`wheel_size` slots of `tick_seconds`; each higher level covers `wheel_size`
+slots of the level below and is cascaded down as time reaches it. Deadlines
+beyond the top level wait in an overflow set that is re-placed on each
+top-level cascade.
+"""
+
+import asyncio
+import inspect
+import logging
+import math
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set
+
+logger = logging.getLogger("gateway.timer_wheel")
+
+TimerCallback = Callable[[], Any]
+
+
+class _Timer:
+    __slots__ = ("key", "tick", "callback", "bucket")
+
+    def __init__(self, key: Hashable, tick: int, callback: TimerCallback):
+        self.key = key
+        self.tick = tick
+        self.callback = callback
+        self.bucket: Optional[Set[Hashable]] = None
+
+
+class TimerWheel:
+    """Keyed one-shot timers; scheduling an existing key replaces its timer."""
+
+    def __init__(
+        self,
+        tick_seconds: float = 0.05,
+        wheel_size: int = 256,
+        levels: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.tick_seconds = tick_seconds
+        self.wheel_size = wheel_size
+        self.levels = levels
+        self.clock = clock
+        self._origin = clock()
+        self._current = 0
+        self._wheels: List[List[Set[Hashable]]] = [
+            [set() for _ in range(wheel_size)] for _ in range(levels)
+        ]
+        self._overflow: Set[Hashable] = set()
+        self._timers: Dict[Hashable, _Timer] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running: Set[asyncio.Task] = set()
+        self.fired = 0
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._timers
+
+    def _tick_of(self, now: float) -> int:
+        return math.floor((now - self._origin) / self.tick_seconds)
+
+    def _place(self, timer: _Timer) -> None:
+        for level in range(self.levels):
+            span = self.wheel_size ** (level + 1)
+            if timer.tick // span == self._current // span:
+                slot = (timer.tick // self.wheel_size**level) % self.wheel_size
+                timer.bucket = self._wheels[level][slot]
+                break
+        else:
+            timer.bucket = self._overflow
+        timer.bucket.add(timer.key)
+
+    def schedule(self, key: Hashable, delay: float, callback: TimerCallback) -> None:
+        """Run `callback` after `delay` seconds (replacing any timer for `key`)."""
+        self.cancel(key)
+        if not self._timers:
+            # Idle wheel: jump to the present instead of stepping through idle ticks.
+            self._current = max(self._current, self._tick_of(self.clock()))
+        tick = max(self._tick_of(self.clock() + delay), self._current + 1)
+        timer = _Timer(key, tick, callback)
+        self._timers[key] = timer
+        self._place(timer)
+        self._ensure_running()
+
+    def cancel(self, key: Hashable) -> bool:
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        if timer.bucket is not None:
+            timer.bucket.discard(key)
+        return True
+
+    def advance(self, now: Optional[float] = None) -> List[TimerCallback]:
+        """Move the wheel to `now` and return the callbacks that are due (in order)."""
+        target = self._tick_of(self.clock() if now is None else now)
+        due: List[TimerCallback] = []
+        while self._current < target:
+            if not self._timers:
+                self._current = target
+                break
+            self._current += 1
+            self._cascade()
+            bucket = self._wheels[0][self._current % self.wheel_size]
+            for key in list(bucket):
+                timer = self._timers.pop(key)
+                due.append(timer.callback)
+            bucket.clear()
+        self.fired += len(due)
+        return due
+
+    def _cascade(self) -> None:
+        for level in range(self.levels - 1, 0, -1):
+            span = self.wheel_size**level
+            if self._current % span:
+                continue
+            bucket = self._wheels[level][(self._current // span) % self.wheel_size]
+            keys = list(bucket)
+            if level == self.levels - 1:
+                keys.extend(self._overflow)
+                self._overflow.clear()
+            bucket.clear()
+            for key in keys:
+                self._place(self._timers[key])
+
+    def _ensure_running(self) -> None:
+        if self._task is not None and not self._task.done():
+            if self._wakeup is not None:
+                self._wakeup.set()
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (sync caller): advance() can still be driven manually.
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._loop())
+
+    async def _loop(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            if not self._timers:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            await asyncio.sleep(self.tick_seconds)
+            for callback in self.advance():
+                self._run(callback)
+
+    def _run(self, callback: TimerCallback) -> None:
+        try:
+            result = callback()
+        except Exception as e:
+            logger.error(f"Timer callback failed: {e}")
+            return
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def stop(self) -> None:
+        """Stop the wheel task, drop pending timers and cancel running callbacks."""
+        self._timers.clear()
+        for wheel in self._wheels:
+            for bucket in wheel:
+                bucket.clear()
+        self._overflow.clear()
+        tasks = [t for t in [self._task, *self._running] if t is not None]
+        self._task = None
+        self._running.clear()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._timers),
+            "fired": self.fired,
+            "tick_ms": self.tick_seconds * 1000,
+        }
@@ -164,6 +164,14 @@ start_registry_proxy() {
   haproxy -f "$HAPROXY_CFG" >/dev/null 2>&1 &
 }
 
+start_pool_coordinator() {
+  if [ -z "${POOL_COORDINATOR_SOCKET:-}" ]; then
+    return
+  fi
+  mkdir -p "$(dirname "$POOL_COORDINATOR_SOCKET")"
+  python -m services.gateway.services.pool_coordinator "$POOL_COORDINATOR_SOCKET" &
+}
+
 if ! resolve_runtime_cni_defaults; then
   exit 1
 fi
@@ -191,5 +199,6 @@ fi
 
 apply_worker_routes_override
 start_registry_proxy
+start_pool_coordinator
 
 exec "$@"
@@ -14,16 +14,28 @@ from fastapi import FastAPI
 from services.common.core.http_client import HttpClientFactory
 
 from .config import GatewayConfig
+from .core.container_budget import ContainerBudget
 from .core.event_builder import V1ProxyEventBuilder
+from .core.loop_lag import EventLoopLagMonitor
+from .core.payload_codec import PayloadCodec
+from .core.provision_scheduler import ProvisionScheduler
 from .models.function import FunctionEntity
+from .services.cluster import ClusterRouter, create_cluster_router
 from .services.config_reloader import init_reloader, start_reloader, stop_reloader
+from .services.container_lifecycle import ContainerLifecycleExecutor
 from .services.function_registry import FunctionRegistry
+from .services.idle_health import IdleHealthChecker
 from .services.janitor import HeartbeatJanitor
 from .services.lambda_invoker import LambdaInvoker
+from .services.pool_coordinator import PoolCoordinatorClient
 from .services.pool_manager import PoolManager
+from .services.pool_snapshot import save_pool_snapshot
 from .services.processor import GatewayRequestProcessor
 from .services.route_matcher import RouteMatcher
+from .services.scale_ahead import ScaleAheadAutoscaler
 from .services.scheduler import SchedulerService
+from .services.warm_pool import WarmPoolMaintainer
+from .services.worker_warmup import WorkerWarmer
 
 logger = logging.getLogger("gateway.main")
 
@@ -37,9 +49,19 @@ async def manage_lifespan(app: FastAPI, gateway_config: GatewayConfig) -> AsyncI
 
     channel = None
     janitor: Optional[HeartbeatJanitor] = None
+    warm_pool: Optional[WarmPoolMaintainer] = None
+    idle_health: Optional[IdleHealthChecker] = None
+    scale_ahead: Optional[ScaleAheadAutoscaler] = None
     scheduler: Optional[SchedulerService] = None
     pool_manager: Optional[PoolManager] = None
     reloader = None
+    codec: Optional[PayloadCodec] = None
+    loop_monitor: Optional[EventLoopLagMonitor] = None
+    agent_monitor = None
+    coordinator: Optional[PoolCoordinatorClient] = None
+    cluster: Optional[ClusterRouter] = None
+    warm_restart = False
+    snapshot_path = ""
 
     try:
         function_registry = FunctionRegistry()
@@ -57,26 +79,75 @@ async def manage_lifespan(app: FastAPI, gateway_config: GatewayConfig) -> AsyncI
             gateway_config.AGENT_GRPC_ADDRESS,
         )
 
+        from .core.readiness import create_readiness_prober
         from .pb import agent_pb2_grpc
+        from .services.agent_health import AgentConnectivityMonitor
         from .services.agent_invoke import AgentInvokeClient
         from .services.grpc_channel import create_agent_channel
         from .services.grpc_provision import GrpcProvisionClient
 
         channel = create_agent_channel(gateway_config.AGENT_GRPC_ADDRESS, gateway_config)
         agent_stub = agent_pb2_grpc.AgentServiceStub(channel)
+        agent_monitor = AgentConnectivityMonitor(
+            channel,
+            probe_interval=gateway_config.AGENT_HEALTH_PROBE_INTERVAL,
+            probe_timeout=gateway_config.AGENT_HEALTH_PROBE_TIMEOUT,
+            backoff_max=gateway_config.AGENT_RECONNECT_BACKOFF_MAX,
+        )
 
         grpc_provision_client = GrpcProvisionClient(
             agent_stub,
             function_registry,
             skip_readiness_check=gateway_config.AGENT_INVOKE_PROXY,
             owner_id=gateway_config.GATEWAY_OWNER_ID,
+            readiness=create_readiness_prober(gateway_config),
         )
 
+        coordinator_socket = gateway_config.POOL_COORDINATOR_SOCKET
+        if isinstance(coordinator_socket, str) and coordinator_socket:
+            coordinator = PoolCoordinatorClient(coordinator_socket)
+            await coordinator.connect()
+
+        provision_scheduler = None
+        try:
+            provision_limit = int(gateway_config.PROVISION_MAX_CONCURRENCY)
+        except (TypeError, ValueError):
+            provision_limit = 0
+        if provision_limit > 0:
+            provision_scheduler = ProvisionScheduler(provision_limit)
+
+        agent_invoker = None
+        if gateway_config.AGENT_INVOKE_PROXY:
+            agent_invoker = AgentInvokeClient(agent_stub, owner_id=gateway_config.GATEWAY_OWNER_ID)
+            logger.info("Gateway invoke proxy enabled (L7 via Agent).")
+
         pool_manager = PoolManager(
             provision_client=grpc_provision_client,
             config_loader=config_loader,
             pause_enabled=gateway_config.ENABLE_CONTAINER_PAUSE,
             pause_idle_seconds=gateway_config.PAUSE_IDLE_SECONDS,
+            speculative_resume_linger=gateway_config.SPECULATIVE_RESUME_LINGER_SECONDS,
+            warmer=WorkerWarmer(client, config_loader, agent_invoker=agent_invoker),
+            priority_aging_seconds=gateway_config.POOL_PRIORITY_AGING_SECONDS,
+            agent_monitor=agent_monitor,
+            warm_parallelism=gateway_config.WARM_POOL_MAX_PARALLEL,
+            forecast_window_seconds=gateway_config.FORECAST_WINDOW_SECONDS,
+            forecast_horizon_seconds=gateway_config.FORECAST_HORIZON_SECONDS,
+            budget=ContainerBudget(
+                max_containers=gateway_config.CONTAINER_BUDGET_MAX_CONTAINERS,
+                max_memory_mb=gateway_config.CONTAINER_BUDGET_MAX_MEMORY_MB,
+                default_memory_mb=gateway_config.CONTAINER_BUDGET_DEFAULT_MEMORY_MB,
+            ),
+            coordinator=coordinator,
+            idle_timeout_seconds=gateway_config.GATEWAY_IDLE_TIMEOUT_SECONDS,
+            provision_scheduler=provision_scheduler,
+            provision_batch_size=gateway_config.PROVISION_BATCH_SIZE,
+            lifecycle=ContainerLifecycleExecutor(
+                grpc_provision_client,
+                max_parallel=gateway_config.LIFECYCLE_MAX_PARALLEL,
+                retries=gateway_config.LIFECYCLE_RETRIES,
+                backoff_seconds=gateway_config.LIFECYCLE_RETRY_BACKOFF_SECONDS,
+            ),
         )
         if gateway_config.ENABLE_CONTAINER_PAUSE:
             logger.info(
@@ -84,12 +155,23 @@ async def manage_lifespan(app: FastAPI, gateway_config: GatewayConfig) -> AsyncI
                 gateway_config.PAUSE_IDLE_SECONDS,
             )
 
-        await pool_manager.cleanup_all_containers()
+        snapshot_path = gateway_config.POOL_SNAPSHOT_PATH
+        warm_restart = gateway_config.WARM_RESTART_ENABLED is True and (
+            isinstance(snapshot_path, str) and bool(snapshot_path)
+        )
+        if warm_restart:
+            await pool_manager.warm_restart(
+                snapshot_path,
+                probe_timeout=gateway_config.WARM_RESTART_PROBE_TIMEOUT,
+            )
+        else:
+            await pool_manager.cleanup_all_containers()
+        await agent_monitor.start()
 
-        agent_invoker = None
-        if gateway_config.AGENT_INVOKE_PROXY:
-            agent_invoker = AgentInvokeClient(agent_stub, owner_id=gateway_config.GATEWAY_OWNER_ID)
-            logger.info("Gateway invoke proxy enabled (L7 via Agent).")
+        # Cluster mode: claim function ownership before warm pools fill up.
+        cluster = create_cluster_router(gateway_config, pool_manager, client)
+        if cluster:
+            await cluster.start()
 
         janitor = HeartbeatJanitor(
             pool_manager,
@@ -99,15 +181,46 @@ async def manage_lifespan(app: FastAPI, gateway_config: GatewayConfig) -> AsyncI
         )
         await janitor.start()
 
+        warm_pool = WarmPoolMaintainer(
+            pool_manager,
+            function_registry.get_function_names,
+            interval=gateway_config.WARM_POOL_INTERVAL,
+        )
+        await warm_pool.start()
+
+        try:
+            idle_health_interval = float(gateway_config.IDLE_HEALTH_CHECK_INTERVAL)
+        except (TypeError, ValueError):
+            idle_health_interval = 0.0
+        if idle_health_interval > 0:
+            idle_health = IdleHealthChecker(
+                pool_manager,
+                interval=idle_health_interval,
+                probe_timeout=gateway_config.IDLE_HEALTH_PROBE_TIMEOUT,
+            )
+            await idle_health.start()
+
+        if gateway_config.SCALE_AHEAD_ENABLED:
+            scale_ahead = ScaleAheadAutoscaler(
+                pool_manager, interval=gateway_config.SCALE_AHEAD_INTERVAL
+            )
+            await scale_ahead.start()
+
         lambda_invoker = LambdaInvoker(
             client=client,
             registry=function_registry,
             config=gateway_config,
             backend=pool_manager,  # ty: ignore[invalid-argument-type]  # PoolManager satisfies InvocationBackend protocol
             agent_invoker=agent_invoker,
+            cluster=cluster,
         )
 
-        scheduler = SchedulerService(lambda_invoker)
+        scheduler = SchedulerService(
+            lambda_invoker,
+            pool_manager=pool_manager,
+            prewarm_lead_seconds=gateway_config.SCHEDULE_PREWARM_LEAD_SECONDS,
+        )
+        pool_manager.schedule_lookup = scheduler.next_fire_time
         await scheduler.start()
         scheduler.load_schedules(function_registry._registry)
 
@@ -126,9 +239,23 @@ async def manage_lifespan(app: FastAPI, gateway_config: GatewayConfig) -> AsyncI
         app.state.function_registry = function_registry
         app.state.route_matcher = route_matcher
         app.state.lambda_invoker = lambda_invoker
+        codec = PayloadCodec(
+            offload_threshold=gateway_config.PAYLOAD_OFFLOAD_THRESHOLD_BYTES,
+            process_threshold=gateway_config.PAYLOAD_PROCESS_THRESHOLD_BYTES,
+            max_workers=gateway_config.PAYLOAD_CODEC_MAX_WORKERS,
+        )
+        loop_monitor = EventLoopLagMonitor()
+        await loop_monitor.start()
+
         app.state.event_builder = V1ProxyEventBuilder()
-        app.state.processor = GatewayRequestProcessor(lambda_invoker, app.state.event_builder)
+        app.state.payload_codec = codec
+        app.state.loop_lag_monitor = loop_monitor
+        app.state.agent_monitor = agent_monitor
+        app.state.processor = GatewayRequestProcessor(
+            lambda_invoker, app.state.event_builder, codec=codec
+        )
         app.state.pool_manager = pool_manager
+        app.state.cluster = cluster
         app.state.scheduler = scheduler
 
         logger.info("Gateway initialized with shared resources.")
@@ -137,14 +264,50 @@ async def manage_lifespan(app: FastAPI, gateway_config: GatewayConfig) -> AsyncI
         if reloader:
             stop_reloader()
 
+        if cluster:
+            await cluster.stop()
+
         if janitor:
             await janitor.stop()
 
+        if warm_pool:
+            await warm_pool.stop()
+
+        if idle_health:
+            await idle_health.stop()
+
+        if scale_ahead:
+            await scale_ahead.stop()
+
         if scheduler:
             await scheduler.stop()
 
         if pool_manager:
-            await pool_manager.shutdown_all()
+            try:
+                drain_timeout = float(gateway_config.SHUTDOWN_DRAIN_TIMEOUT)
+            except (TypeError, ValueError):
+                drain_timeout = 0.0
+            if warm_restart:
+                workers, paused_ids = await pool_manager.detach_all(drain_timeout)
+                try:
+                    saved = save_pool_snapshot(snapshot_path, workers, paused_ids)
+                    logger.info(f"Saved {saved} workers to pool snapshot {snapshot_path}")
+                except OSError as e:
+                    logger.error(f"Failed to save pool snapshot {snapshot_path}: {e}")
+            else:
+                await pool_manager.shutdown_all(drain_timeout)
+
+        if coordinator:
+            await coordinator.close()
+
+        if loop_monitor:
+            await loop_monitor.stop()
+
+        if agent_monitor:
+            await agent_monitor.stop()
+
+        if codec:
+            codec.shutdown()
 
         if channel:
             try:
@@ -33,6 +33,7 @@ from .routes import (
     list_routes,
     register_routes,
     sanitize_proxy_headers,
+    warm_function,
 )
 from .routes import (
     health_check as _health_check_impl,
@@ -92,4 +93,5 @@ __all__ = [
     "resource_exhausted_handler",
     "sanitize_proxy_headers",
     "trace_propagation_middleware",
+    "warm_function",
 ]
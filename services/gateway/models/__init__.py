@@ -11,7 +11,7 @@ from .auth import (
     AuthResponse,
 )
 from .aws_v1 import APIGatewayProxyEvent
-from .target_function import TargetFunction
+from .target_function import RouteAffinity, TargetFunction
 
 __all__ = [
     "AuthParameters",
@@ -19,5 +19,6 @@ __all__ = [
     "AuthenticationResult",
     "AuthResponse",
     "APIGatewayProxyEvent",
+    "RouteAffinity",
     "TargetFunction",
 ]
@@ -27,4 +27,6 @@ class InputContext(BaseModel):
     user_id: Optional[str] = None
     path_params: Dict[str, str] = Field(default_factory=dict)
     route_path: Optional[str] = None
+    # Sticky-routing key (routing.yml affinity); same key prefers the same worker.
+    affinity_key: Optional[str] = None
     timeout: float = 30.0
@@ -4,18 +4,62 @@ Function domain models.
 Defines the structure of a Lambda function configuration as a Pydantic model.
 """
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
 
+class AdaptiveConcurrencyConfig(BaseModel):
+    """Latency-driven concurrency limiter settings (bounded by max_capacity)."""
+
+    enabled: bool = True
+    algorithm: Literal["aimd", "gradient"] = "aimd"
+    initial_limit: Optional[int] = None
+    min_limit: int = 1
+    latency_tolerance: float = 2.0
+    backoff_ratio: float = 0.9
+    smoothing: float = 0.2
+
+
 class ScalingConfig(BaseModel):
     """Configuration for auto-scaling and pool management."""
 
     min_capacity: int = 0
     max_capacity: int = 1
-    idle_timeout: int = 300
+    # Lifecycle policy. Idle deadlines left unset use GATEWAY_IDLE_TIMEOUT_SECONDS /
+    # PAUSE_IDLE_SECONDS (pause_idle_seconds 0 = never pause this function);
+    # min_capacity is the keep-warm floor.
+    idle_timeout: Optional[float] = Field(default=None, gt=0)
+    pause_idle_seconds: Optional[float] = Field(default=None, ge=0)
+    # Recycle a worker after this age / number of invocations (bounds leaks).
+    max_worker_age_seconds: Optional[float] = Field(default=None, gt=0)
+    max_worker_invocations: Optional[int] = Field(default=None, ge=1)
     acquire_timeout: float = 30.0
+    # Capacity kept free for interactive (HTTP / sync Invoke) traffic.
+    reserved_interactive_capacity: int = 0
+    # In-flight invocations one container may serve at once (runtimes with
+    # concurrent handlers). Capacity and concurrency limits are counted in slots.
+    per_worker_concurrency: int = Field(default=1, ge=1)
+    # Which idle worker an acquire takes: "mru" lets surplus workers age out after
+    # a spike, "fifo" rotates through all of them, "least_invocations" spreads work.
+    selection_policy: Literal["mru", "fifo", "least_invocations"] = "mru"
+    # Cold-start bursts (opt-in): queue behind in-flight invocations when that is
+    # faster than a cold start, and cap concurrent provisions (0 = unlimited).
+    burst_control: bool = False
+    max_concurrent_provisions: int = Field(default=0, ge=0)
+    # Share of the gateway-wide provisioning capacity relative to other functions.
+    provision_weight: float = Field(default=1.0, gt=0)
+    # Readiness wait after a container starts (None = READINESS_TIMEOUT_SECONDS).
+    readiness_timeout: Optional[float] = Field(default=None, gt=0)
+    adaptive_concurrency: Optional[AdaptiveConcurrencyConfig] = None
+
+
+class WarmupConfig(BaseModel):
+    """Synthetic invocation sent to new workers before they join the idle set."""
+
+    # Event passed to the handler (JSON); handlers can recognise it and return early.
+    payload: Any = Field(default_factory=dict)
+    timeout: float = Field(default=30.0, gt=0)
 
 
 class ScheduleEvent(BaseModel):
@@ -45,6 +89,7 @@ class FunctionEntity(BaseModel):
     environment: Dict[str, str] = Field(default_factory=dict)
     scaling: ScalingConfig = Field(default_factory=ScalingConfig)
     events: List[FunctionEvent] = Field(default_factory=list)
+    warmup: Optional[WarmupConfig] = None
 
     @classmethod
     def from_dict(cls, name: str, data: Dict) -> "FunctionEntity":
@@ -66,4 +111,5 @@ class FunctionEntity(BaseModel):
             environment=data.get("environment", {}),
             scaling=scaling,
             events=data.get("events", []),
+            warmup=data.get("warmup"),
         )
@@ -6,11 +6,40 @@ Data class representing the result of routing resolution.
 
 from typing import Any, Dict, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 
 from services.gateway.models.function import FunctionEntity
 
 
+class RouteAffinity(BaseModel):
+    """
+    Sticky worker affinity of a route (routing.yml `affinity`).
+
+    Exactly one key source: a request header, a path parameter or the JWT subject.
+    """
+
+    header: Optional[str] = None
+    path_param: Optional[str] = None
+    jwt_subject: bool = False
+
+    @model_validator(mode="after")
+    def _single_source(self) -> "RouteAffinity":
+        sources = [self.header is not None, self.path_param is not None, self.jwt_subject]
+        if sum(sources) != 1:
+            raise ValueError("affinity needs exactly one of header, path_param, jwt_subject")
+        return self
+
+    def resolve_key(
+        self, headers: Dict[str, str], path_params: Dict[str, str], user_id: Optional[str]
+    ) -> Optional[str]:
+        """Affinity key of a request (None if the source is missing)."""
+        if self.header is not None:
+            return headers.get(self.header.lower()) or None
+        if self.path_param is not None:
+            return path_params.get(self.path_param) or None
+        return user_id or None
+
+
 class TargetFunction(BaseModel):
     """
     Lambda function information resolved by routing.
@@ -20,3 +49,4 @@ class TargetFunction(BaseModel):
     path_params: Dict[str, str]
     route_path: Optional[str] = None
     function_config: Union[FunctionEntity, Dict[str, Any]]
+    affinity: Optional[RouteAffinity] = None
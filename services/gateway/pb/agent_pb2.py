@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0b\x61gent.proto\x12\x0c\x65sb.agent.v1\"U\n\x15PauseContainerRequest\x12!\n\x0c\x63ontainer_id\x18\x01 \x01(\tR\x0b\x63ontainerId\x12\x19\n\x08owner_id\x18\x02 \x01(\tR\x07ownerId\"2\n\x16PauseContainerResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\"V\n\x16ResumeContainerRequest\x12!\n\x0c\x63ontainer_id\x18\x01 \x01(\tR\x0b\x63ontainerId\x12\x19\n\x08owner_id\x18\x02 \x01(\tR\x07ownerId\"3\n\x17ResumeContainerResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\"\x8c\x02\n\x16\x45nsureContainerRequest\x12#\n\rfunction_name\x18\x01 \x01(\tR\x0c\x66unctionName\x12\x14\n\x05image\x18\x02 \x01(\tR\x05image\x12?\n\x03\x65nv\x18\x03 \x03(\x0b\x32-.esb.agent.v1.EnsureContainerRequest.EnvEntryR\x03\x65nv\x12\x19\n\x08owner_id\x18\x04 \x01(\tR\x07ownerId\x1a\x36\n\x08\x45nvEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01J\x04\x08\x05\x10\x06J\x04\x08\x06\x10\x07R\x0cimage_sourceR\timage_ref\"|\n\x17\x44\x65stroyContainerRequest\x12#\n\rfunction_name\x18\x01 \x01(\tR\x0c\x66unctionName\x12!\n\x0c\x63ontainer_id\x18\x02 \x01(\tR\x0b\x63ontainerId\x12\x19\n\x08owner_id\x18\x03 \x01(\tR\x07ownerId\"4\n\x18\x44\x65stroyContainerResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\"c\n\nWorkerInfo\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12\x12\n\x04name\x18\x02 \x01(\tR\x04name\x12\x1d\n\nip_address\x18\x03 \x01(\tR\tipAddress\x12\x12\n\x04port\x18\x04 \x01(\x05R\x04port\"\xc4\x02\n\x13InvokeWorkerRequest\x12!\n\x0c\x63ontainer_id\x18\x07 \x01(\tR\x0b\x63ontainerId\x12\x12\n\x04path\x18\x03 \x01(\tR\x04path\x12\x18\n\x07payload\x18\x04 \x01(\x0cR\x07payload\x12H\n\x07headers\x18\x05 \x03(\x0b\x32..esb.agent.v1.InvokeWorkerRequest.HeadersEntryR\x07headers\x12\x1d\n\ntimeout_ms\x18\x06 \x01(\x05R\ttimeoutMs\x12\x19\n\x08owner_id\x18\x08 \x01(\tR\x07ownerId\x1a:\n\x0cHeadersEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01J\x04\x08\x01\x10\x02J\x04\x08\x02\x10\x03R\nip_addressR\x04port\"\xd2\x01\n\x14InvokeWorkerResponse\x12\x1f\n\x0bstatus_code\x18\x01 \x01(\x05R\nstatusCode\x12I\n\x07headers\x18\x02 \x03(\x0b\x32/.esb.agent.v1.InvokeWorkerResponse.HeadersEntryR\x07headers\x12\x12\n\x04\x62ody\x18\x03 \x01(\x0cR\x04\x62ody\x1a:\n\x0cHeadersEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01\"2\n\x15ListContainersRequest\x12\x19\n\x08owner_id\x18\x01 \x01(\tR\x07ownerId\"V\n\x16ListContainersResponse\x12<\n\ncontainers\x18\x01 \x03(\x0b\x32\x1c.esb.agent.v1.ContainerStateR\ncontainers\"\xf3\x01\n\x0e\x43ontainerState\x12!\n\x0c\x63ontainer_id\x18\x01 \x01(\tR\x0b\x63ontainerId\x12#\n\rfunction_name\x18\x02 \x01(\tR\x0c\x66unctionName\x12\x16\n\x06status\x18\x03 \x01(\tR\x06status\x12 \n\x0clast_used_at\x18\x04 \x01(\x03R\nlastUsedAt\x12%\n\x0e\x63ontainer_name\x18\x05 \x01(\tR\rcontainerName\x12\x1d\n\ncreated_at\x18\x06 \x01(\x03R\tcreatedAt\x12\x19\n\x08owner_id\x18\x07 \x01(\tR\x07ownerId\"Z\n\x1aGetContainerMetricsRequest\x12!\n\x0c\x63ontainer_id\x18\x01 \x01(\tR\x0b\x63ontainerId\x12\x19\n\x08owner_id\x18\x02 \x01(\tR\x07ownerId\"W\n\x1bGetContainerMetricsResponse\x12\x38\n\x07metrics\x18\x01 \x01(\x0b\x32\x1e.esb.agent.v1.ContainerMetricsR\x07metrics\"\xa0\x03\n\x10\x43ontainerMetrics\x12!\n\x0c\x63ontainer_id\x18\x01 \x01(\tR\x0b\x63ontainerId\x12#\n\rfunction_name\x18\x02 \x01(\tR\x0c\x66unctionName\x12%\n\x0e\x63ontainer_name\x18\x03 \x01(\tR\rcontainerName\x12\x14\n\x05state\x18\x04 \x01(\tR\x05state\x12%\n\x0ememory_current\x18\x05 \x01(\x04R\rmemoryCurrent\x12\x1d\n\nmemory_max\x18\x06 \x01(\x04R\tmemoryMax\x12\x1d\n\noom_events\x18\x07 \x01(\x04R\toomEvents\x12 \n\x0c\x63pu_usage_ns\x18\x08 \x01(\x04R\ncpuUsageNs\x12\x1b\n\texit_code\x18\t \x01(\rR\x08\x65xitCode\x12#\n\rrestart_count\x18\n \x01(\rR\x0crestartCount\x12\x1b\n\texit_time\x18\x0b \x01(\x03R\x08\x65xitTime\x12!\n\x0c\x63ollected_at\x18\x0c \x01(\x03R\x0b\x63ollectedAt2\xa1\x05\n\x0c\x41gentService\x12Q\n\x0f\x45nsureContainer\x12$.esb.agent.v1.EnsureContainerRequest\x1a\x18.esb.agent.v1.WorkerInfo\x12\x61\n\x10\x44\x65stroyContainer\x12%.esb.agent.v1.DestroyContainerRequest\x1a&.esb.agent.v1.DestroyContainerResponse\x12[\n\x0ePauseContainer\x12#.esb.agent.v1.PauseContainerRequest\x1a$.esb.agent.v1.PauseContainerResponse\x12^\n\x0fResumeContainer\x12$.esb.agent.v1.ResumeContainerRequest\x1a%.esb.agent.v1.ResumeContainerResponse\x12[\n\x0eListContainers\x12#.esb.agent.v1.ListContainersRequest\x1a$.esb.agent.v1.ListContainersResponse\x12j\n\x13GetContainerMetrics\x12(.esb.agent.v1.GetContainerMetricsRequest\x1a).esb.agent.v1.GetContainerMetricsResponse\x12U\n\x0cInvokeWorker\x12!.esb.agent.v1.InvokeWorkerRequest\x1a\".esb.agent.v1.InvokeWorkerResponseB6Z4github.com/poruru-code/esb/services/agent/pkg/api/v1b\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0b\x61gent.proto\x12\x0c\x65sb.agent.v1\"U\n\x15PauseContainerRequest\x12!\n\x0c\x63ontainer_id\x18\x01 \x01(\tR\x0b\x63ontainerId\x12\x19\n\x08owner_id\x18\x02 \x01(\tR\x07ownerId\"2\n\x16PauseContainerResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\"V\n\x16ResumeContainerRequest\x12!\n\x0c\x63ontainer_id\x18\x01 \x01(\tR\x0b\x63ontainerId\x12\x19\n\x08owner_id\x18\x02 \x01(\tR\x07ownerId\"3\n\x17ResumeContainerResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\"\x8c\x02\n\x16\x45nsureContainerRequest\x12#\n\rfunction_name\x18\x01 \x01(\tR\x0c\x66unctionName\x12\x14\n\x05image\x18\x02 \x01(\tR\x05image\x12?\n\x03\x65nv\x18\x03 \x03(\x0b\x32-.esb.agent.v1.EnsureContainerRequest.EnvEntryR\x03\x65nv\x12\x19\n\x08owner_id\x18\x04 \x01(\tR\x07ownerId\x1a\x36\n\x08\x45nvEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01J\x04\x08\x05\x10\x06J\x04\x08\x06\x10\x07R\x0cimage_sourceR\timage_ref\"|\n\x17\x44\x65stroyContainerRequest\x12#\n\rfunction_name\x18\x01 \x01(\tR\x0c\x66unctionName\x12!\n\x0c\x63ontainer_id\x18\x02 \x01(\tR\x0b\x63ontainerId\x12\x19\n\x08owner_id\x18\x03 \x01(\tR\x07ownerId\"4\n\x18\x44\x65stroyContainerResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\"c\n\nWorkerInfo\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12\x12\n\x04name\x18\x02 \x01(\tR\x04name\x12\x1d\n\nip_address\x18\x03 \x01(\tR\tipAddress\x12\x12\n\x04port\x18\x04 \x01(\x05R\x04port\"\xc4\x02\n\x13InvokeWorkerRequest\x12!\n\x0c\x63ontainer_id\x18\x07 \x01(\tR\x0b\x63ontainerId\x12\x12\n\x04path\x18\x03 \x01(\tR\x04path\x12\x18\n\x07payload\x18\x04 \x01(\x0cR\x07payload\x12H\n\x07headers\x18\x05 \x03(\x0b\x32..esb.agent.v1.InvokeWorkerRequest.HeadersEntryR\x07headers\x12\x1d\n\ntimeout_ms\x18\x06 \x01(\x05R\ttimeoutMs\x12\x19\n\x08owner_id\x18\x08 \x01(\tR\x07ownerId\x1a:\n\x0cHeadersEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01J\x04\x08\x01\x10\x02J\x04\x08\x02\x10\x03R\nip_addressR\x04port\"\xd2\x01\n\x14InvokeWorkerResponse\x12\x1f\n\x0bstatus_code\x18\x01 \x01(\x05R\nstatusCode\x12I\n\x07headers\x18\x02 \x03(\x0b\x32/.esb.agent.v1.InvokeWorkerResponse.HeadersEntryR\x07headers\x12\x12\n\x04\x62ody\x18\x03 \x01(\x0cR\x04\x62ody\x1a:\n\x0cHeadersEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01\"2\n\x15ListContainersRequest\x12\x19\n\x08owner_id\x18\x01 \x01(\tR\x07ownerId\"V\n\x16ListContainersResponse\x12<\n\ncontainers\x18\x01 \x03(\x0b\x32\x1c.esb.agent.v1.ContainerStateR\ncontainers\"\xf3\x01\n\x0e\x43ontainerState\x12!\n\x0c\x63ontainer_id\x18\x01 \x01(\tR\x0b\x63ontainerId\x12#\n\rfunction_name\x18\x02 \x01(\tR\x0c\x66unctionName\x12\x16\n\x06status\x18\x03 \x01(\tR\x06status\x12 \n\x0clast_used_at\x18\x04 \x01(\x03R\nlastUsedAt\x12%\n\x0e\x63ontainer_name\x18\x05 \x01(\tR\rcontainerName\x12\x1d\n\ncreated_at\x18\x06 \x01(\x03R\tcreatedAt\x12\x19\n\x08owner_id\x18\x07 \x01(\tR\x07ownerId\"Z\n\x1aGetContainerMetricsRequest\x12!\n\x0c\x63ontainer_id\x18\x01 \x01(\tR\x0b\x63ontainerId\x12\x19\n\x08owner_id\x18\x02 \x01(\tR\x07ownerId\"W\n\x1bGetContainerMetricsResponse\x12\x38\n\x07metrics\x18\x01 \x01(\x0b\x32\x1e.esb.agent.v1.ContainerMetricsR\x07metrics\"\xa0\x03\n\x10\x43ontainerMetrics\x12!\n\x0c\x63ontainer_id\x18\x01 \x01(\tR\x0b\x63ontainerId\x12#\n\rfunction_name\x18\x02 \x01(\tR\x0c\x66unctionName\x12%\n\x0e\x63ontainer_name\x18\x03 \x01(\tR\rcontainerName\x12\x14\n\x05state\x18\x04 \x01(\tR\x05state\x12%\n\x0ememory_current\x18\x05 \x01(\x04R\rmemoryCurrent\x12\x1d\n\nmemory_max\x18\x06 \x01(\x04R\tmemoryMax\x12\x1d\n\noom_events\x18\x07 \x01(\x04R\toomEvents\x12 \n\x0c\x63pu_usage_ns\x18\x08 \x01(\x04R\ncpuUsageNs\x12\x1b\n\texit_code\x18\t \x01(\rR\x08\x65xitCode\x12#\n\rrestart_count\x18\n \x01(\rR\x0crestartCount\x12\x1b\n\texit_time\x18\x0b \x01(\x03R\x08\x65xitTime\x12!\n\x0c\x63ollected_at\x18\x0c \x01(\x03R\x0b\x63ollectedAt\"q\n\x17\x45nsureContainersRequest\x12@\n\x08template\x18\x01 \x01(\x0b\x32$.esb.agent.v1.EnsureContainerRequestR\x08template\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\"N\n\x18\x45nsureContainersResponse\x12\x32\n\x07workers\x18\x01 \x03(\x0b\x32\x18.esb.agent.v1.WorkerInfoR\x07workers2\x84\x06\n\x0c\x41gentService\x12Q\n\x0f\x45nsureContainer\x12$.esb.agent.v1.EnsureContainerRequest\x1a\x18.esb.agent.v1.WorkerInfo\x12\x61\n\x10\x45nsureContainers\x12%.esb.agent.v1.EnsureContainersRequest\x1a&.esb.agent.v1.EnsureContainersResponse\x12\x61\n\x10\x44\x65stroyContainer\x12%.esb.agent.v1.DestroyContainerRequest\x1a&.esb.agent.v1.DestroyContainerResponse\x12[\n\x0ePauseContainer\x12#.esb.agent.v1.PauseContainerRequest\x1a$.esb.agent.v1.PauseContainerResponse\x12^\n\x0fResumeContainer\x12$.esb.agent.v1.ResumeContainerRequest\x1a%.esb.agent.v1.ResumeContainerResponse\x12[\n\x0eListContainers\x12#.esb.agent.v1.ListContainersRequest\x1a$.esb.agent.v1.ListContainersResponse\x12j\n\x13GetContainerMetrics\x12(.esb.agent.v1.GetContainerMetricsRequest\x1a).esb.agent.v1.GetContainerMetricsResponse\x12U\n\x0cInvokeWorker\x12!.esb.agent.v1.InvokeWorkerRequest\x1a\".esb.agent.v1.InvokeWorkerResponseB6Z4github.com/poruru-code/esb/services/agent/pkg/api/v1b\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -76,6 +76,10 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GETCONTAINERMETRICSRESPONSE']._serialized_end=1966
   _globals['_CONTAINERMETRICS']._serialized_start=1969
   _globals['_CONTAINERMETRICS']._serialized_end=2385
-  _globals['_AGENTSERVICE']._serialized_start=2388
-  _globals['_AGENTSERVICE']._serialized_end=3061
+  _globals['_ENSURECONTAINERSREQUEST']._serialized_start=2387
+  _globals['_ENSURECONTAINERSREQUEST']._serialized_end=2500
+  _globals['_ENSURECONTAINERSRESPONSE']._serialized_start=2502
+  _globals['_ENSURECONTAINERSRESPONSE']._serialized_end=2580
+  _globals['_AGENTSERVICE']._serialized_start=2583
+  _globals['_AGENTSERVICE']._serialized_end=3355
 # @@protoc_insertion_point(module_scope)
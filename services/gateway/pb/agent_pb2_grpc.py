@@ -19,6 +19,11 @@ class AgentServiceStub(object):
                 request_serializer=agent__pb2.EnsureContainerRequest.SerializeToString,
                 response_deserializer=agent__pb2.WorkerInfo.FromString,
                 _registered_method=True)
+        self.EnsureContainers = channel.unary_unary(
+                '/esb.agent.v1.AgentService/EnsureContainers',
+                request_serializer=agent__pb2.EnsureContainersRequest.SerializeToString,
+                response_deserializer=agent__pb2.EnsureContainersResponse.FromString,
+                _registered_method=True)
         self.DestroyContainer = channel.unary_unary(
                 '/esb.agent.v1.AgentService/DestroyContainer',
                 request_serializer=agent__pb2.DestroyContainerRequest.SerializeToString,
@@ -61,6 +66,13 @@ class AgentServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def EnsureContainers(self, request, context):
+        """Start `count` containers for one function in a single call (batch scale-out).
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def DestroyContainer(self, request, context):
         """Explicitly stop and remove a container.
         """
@@ -111,6 +123,11 @@ def add_AgentServiceServicer_to_server(servicer, server):
                     request_deserializer=agent__pb2.EnsureContainerRequest.FromString,
                     response_serializer=agent__pb2.WorkerInfo.SerializeToString,
             ),
+            'EnsureContainers': grpc.unary_unary_rpc_method_handler(
+                    servicer.EnsureContainers,
+                    request_deserializer=agent__pb2.EnsureContainersRequest.FromString,
+                    response_serializer=agent__pb2.EnsureContainersResponse.SerializeToString,
+            ),
             'DestroyContainer': grpc.unary_unary_rpc_method_handler(
                     servicer.DestroyContainer,
                     request_deserializer=agent__pb2.DestroyContainerRequest.FromString,
@@ -179,6 +196,33 @@ class AgentService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def EnsureContainers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/esb.agent.v1.AgentService/EnsureContainers',
+            agent__pb2.EnsureContainersRequest.SerializeToString,
+            agent__pb2.EnsureContainersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def DestroyContainer(request,
             target,
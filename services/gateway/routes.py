@@ -10,13 +10,17 @@ from dataclasses import asdict
 from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import BackgroundTasks, FastAPI, Header, HTTPException, Request
+from fastapi import BackgroundTasks, FastAPI, Header, HTTPException, Query, Request
 from fastapi.responses import JSONResponse, Response
 
 from .api.deps import (
+    AgentMonitorDep,
+    ClusterRouterDep,
     FunctionRegistryDep,
     InputContextDep,
     LambdaInvokerDep,
+    LoopLagMonitorDep,
+    PayloadCodecDep,
     PoolManagerDep,
     ProcessorDep,
     RouteMatcherDep,
@@ -25,9 +29,19 @@ from .api.deps import (
 from .config import GatewayConfig, config
 from .core.exceptions import ContainerStartError, LambdaExecutionError
 from .core.function_name import normalize_invoke_function_name
+from .core.invocation_context import InvocationPriority, invocation_affinity
 from .core.security import create_access_token
-from .core.utils import parse_lambda_response
 from .models import AuthenticationResult, AuthRequest, AuthResponse
+from .models.result import InvocationResult
+from .services.cluster import (
+    CLUSTER_AFFINITY_HEADER,
+    CLUSTER_HANDOFF_PATH,
+    CLUSTER_INVOKE_PATH,
+    CLUSTER_PRIORITY_HEADER,
+    CLUSTER_RESULT_HEADER,
+    CLUSTER_TIMEOUT_HEADER,
+    CLUSTER_TOKEN_HEADER,
+)
 
 logger = logging.getLogger("gateway.main")
 
@@ -151,12 +165,49 @@ async def list_container_metrics(user_id: UserIdDep, pool_manager: PoolManagerDe
     return {"containers": metrics_list, "failures": failures}
 
 
-async def list_pool_metrics(user_id: UserIdDep, pool_manager: PoolManagerDep):
+async def list_pool_metrics(
+    user_id: UserIdDep,
+    pool_manager: PoolManagerDep,
+    loop_monitor: LoopLagMonitorDep,
+    codec: PayloadCodecDep,
+    agent_monitor: AgentMonitorDep,
+    cluster: ClusterRouterDep,
+):
     """Gateway のプール統計を返す (runtime 非依存)."""
-    return {
+    metrics = {
         "pools": await pool_manager.get_pool_stats(),
         "collected_at": datetime.now(timezone.utc).isoformat(),
+        "payload_codec": codec.stats,
     }
+    if loop_monitor is not None:
+        metrics["event_loop"] = loop_monitor.stats
+    if agent_monitor is not None:
+        metrics["agent"] = agent_monitor.stats
+    if cluster is not None:
+        metrics["cluster"] = cluster.stats
+    budget_stats = getattr(pool_manager, "budget_stats", None)
+    if isinstance(budget_stats, dict):
+        metrics["budget"] = budget_stats
+    resume_stats = getattr(pool_manager, "resume_stats", None)
+    if isinstance(resume_stats, dict):
+        metrics["resume"] = resume_stats
+    warmup_stats = getattr(getattr(pool_manager, "warmer", None), "stats", None)
+    if isinstance(warmup_stats, dict):
+        metrics["warmup"] = warmup_stats
+    lifecycle_stats = getattr(getattr(pool_manager, "lifecycle", None), "stats", None)
+    if isinstance(lifecycle_stats, dict):
+        metrics["lifecycle"] = lifecycle_stats
+    timer_stats = getattr(getattr(pool_manager, "timers", None), "stats", None)
+    if isinstance(timer_stats, dict):
+        metrics["timers"] = timer_stats
+    scheduler_stats = getattr(getattr(pool_manager, "provision_scheduler", None), "stats", None)
+    if isinstance(scheduler_stats, dict):
+        metrics["provisioning"] = scheduler_stats
+    readiness = getattr(getattr(pool_manager, "provision_client", None), "readiness", None)
+    readiness_stats = getattr(readiness, "stats", None)
+    if isinstance(readiness_stats, dict):
+        metrics["readiness"] = readiness_stats
+    return metrics
 
 
 async def invoke_lambda_api(
@@ -206,6 +257,7 @@ async def invoke_lambda_api(
                 resolved_function_name,
                 body,
                 timeout=config.LAMBDA_INVOKE_TIMEOUT,
+                priority=InvocationPriority.ASYNC,
             )
             return Response(status_code=202, content=b"", media_type="application/json")
 
@@ -228,6 +280,114 @@ async def invoke_lambda_api(
         return JSONResponse(status_code=502, content={"message": str(exc)})
 
 
+async def warm_function(
+    function_name: str,
+    user_id: UserIdDep,
+    pool_manager: PoolManagerDep,
+    registry: FunctionRegistryDep,
+    cluster: ClusterRouterDep,
+    count: int = Query(default=1, ge=1),
+):
+    """
+    Pre-provision idle workers (ensures at least `count` idle, up to max_capacity).
+
+    In cluster mode only the owning replica warms a function; others answer 409
+    with the owner's id.
+    """
+    try:
+        function_name = normalize_invoke_function_name(function_name).name
+    except ValueError as exc:
+        return JSONResponse(status_code=400, content={"message": str(exc)})
+
+    if registry.get_function_config(function_name) is None:
+        return JSONResponse(
+            status_code=404,
+            content={"message": f"Function not found: {function_name}"},
+        )
+
+    if cluster is not None and not cluster.owns(function_name):
+        return JSONResponse(
+            status_code=409,
+            content={
+                "message": f"Function is served by another gateway replica: {function_name}",
+                "owner": cluster.owner_of(function_name),
+            },
+        )
+
+    try:
+        provisioned = await pool_manager.warm_up(function_name, count)
+    except ContainerStartError as exc:  # includes AgentUnavailableError
+        logger.error(f"Warm-up failed for {function_name}: {exc}")
+        return JSONResponse(status_code=503, content={"message": str(exc)})
+
+    pool = await pool_manager.get_pool(function_name)
+    return {
+        "function_name": function_name,
+        "requested": count,
+        "provisioned": provisioned,
+        "pool": pool.stats,
+    }
+
+
+def cluster_result_response(result: InvocationResult) -> Response:
+    """Encode an InvocationResult for the replica that forwarded the invocation."""
+    if not result.success:
+        return JSONResponse(
+            status_code=result.status_code,
+            content={"message": result.error},
+            headers={CLUSTER_RESULT_HEADER: "error"},
+        )
+    headers = {k: v for k, v in result.headers.items() if k.lower() not in UNSAFE_PROXY_HEADERS}
+    headers[CLUSTER_RESULT_HEADER] = "ok"
+    return Response(content=result.payload, status_code=result.status_code, headers=headers)
+
+
+async def cluster_invoke(
+    function_name: str,
+    request: Request,
+    invoker: LambdaInvokerDep,
+    cluster: ClusterRouterDep,
+):
+    """Run an invocation forwarded by another gateway replica (cluster mode)."""
+    if cluster is None or not cluster.authorize(request.headers.get(CLUSTER_TOKEN_HEADER)):
+        return JSONResponse(status_code=403, content={"message": "Forbidden"})
+    cluster.counts["received"] += 1
+
+    try:
+        timeout = float(request.headers.get(CLUSTER_TIMEOUT_HEADER, config.LAMBDA_INVOKE_TIMEOUT))
+        priority = InvocationPriority(int(request.headers.get(CLUSTER_PRIORITY_HEADER, "0")))
+    except ValueError as exc:
+        return JSONResponse(
+            status_code=400, content={"message": str(exc)}, headers={CLUSTER_RESULT_HEADER: "error"}
+        )
+    body = await request.body()
+
+    try:
+        with invocation_affinity(request.headers.get(CLUSTER_AFFINITY_HEADER)):
+            result = await invoker.invoke_function(
+                function_name, body, timeout=timeout, priority=priority, forwarded=True
+            )
+    except ContainerStartError as exc:
+        result = InvocationResult(success=False, status_code=503, error=str(exc))
+    except LambdaExecutionError as exc:
+        result = InvocationResult(success=False, status_code=502, error=str(exc))
+    return cluster_result_response(result)
+
+
+async def cluster_handoff(request: Request, cluster: ClusterRouterDep):
+    """Warm workers for a function another replica handed off (cluster mode)."""
+    if cluster is None or not cluster.authorize(request.headers.get(CLUSTER_TOKEN_HEADER)):
+        return JSONResponse(status_code=403, content={"message": "Forbidden"})
+    try:
+        data = await request.json()
+        function_name = str(data["function_name"])
+        count = int(data["count"])
+    except (ValueError, KeyError, TypeError) as exc:
+        return JSONResponse(status_code=400, content={"message": f"Invalid handoff: {exc}"})
+    accepted = count > 0 and cluster.take_over(function_name, count)
+    return JSONResponse(status_code=202, content={"accepted": accepted})
+
+
 async def cors_preflight(request: Request):
     return Response(status_code=204, headers=build_cors_headers(request))
 
@@ -235,13 +395,14 @@ async def cors_preflight(request: Request):
 async def gateway_handler(
     context: InputContextDep,
     processor: ProcessorDep,
+    codec: PayloadCodecDep,
 ):
     """Catch-all route: process request via GatewayRequestProcessor."""
     result = await processor.process_request(context)
     if not result.success:
         return JSONResponse(status_code=result.status_code, content={"message": result.error})
 
-    parsed = parse_lambda_response(result)
+    parsed = await codec.decode_response(result)
     status_code = parsed.get("status_code", 200)
     headers = parsed.get("headers") or {}
     multi_headers = parsed.get("multi_headers") or {}
@@ -289,6 +450,9 @@ def register_routes(app: FastAPI, gateway_config: GatewayConfig) -> None:
     app.get("/metrics/containers", include_in_schema=False)(list_container_metrics)
     app.get("/metrics/pools", include_in_schema=False)(list_pool_metrics)
     app.post("/2015-03-31/functions/{function_name}/invocations")(invoke_lambda_api)
+    app.post("/functions/{function_name}/warm", include_in_schema=False)(warm_function)
+    app.post(CLUSTER_INVOKE_PATH, include_in_schema=False)(cluster_invoke)
+    app.post(CLUSTER_HANDOFF_PATH, include_in_schema=False)(cluster_handoff)
     app.options("/{path:path}", include_in_schema=False)(cors_preflight)
     app.api_route(
         "/{path:path}",
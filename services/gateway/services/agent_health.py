@@ -0,0 +1,193 @@
+"""
+Where: services/gateway/services/agent_health.py
+What: Agent connectivity tracking (gRPC channel state + health probe).
+Why: Fail provisioning fast while the Agent is unreachable instead of letting every
+     request wait for gRPC timeouts, and resume automatically (with backoff) once it
+     is back. Warm workers keep serving because only provisioning is gated.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+import grpc
+import grpc.aio as grpc_aio
+
+from services.gateway.core.exceptions import AgentUnavailableError
+
+logger = logging.getLogger("gateway.agent_health")
+
+# Standard gRPC health service (registered by the Agent). The request with an empty
+# service name serializes to b"" and a SERVING response (status=1) to b"\x08\x01",
+# so no grpcio-health-checking dependency is needed.
+HEALTH_CHECK_METHOD = "/grpc.health.v1.Health/Check"
+HEALTH_SERVING_RESPONSE = b"\x08\x01"
+
+# Channel states that mean the Agent cannot be reached right now.
+_UNREACHABLE_STATES = {
+    grpc.ChannelConnectivity.TRANSIENT_FAILURE,
+    grpc.ChannelConnectivity.SHUTDOWN,
+}
+
+# gRPC status codes that indicate a connectivity problem (not an application error).
+_UNREACHABLE_CODES = {grpc.StatusCode.UNAVAILABLE}
+
+
+class AgentConnectivityMonitor:
+    """
+    Track whether the Agent is reachable.
+
+    - A watcher follows channel connectivity (get_state / wait_for_state_change);
+      TRANSIENT_FAILURE marks the Agent unavailable immediately.
+    - A prober calls the gRPC health service every probe_interval while healthy and
+      with exponential backoff (up to backoff_max) while unavailable. Only a
+      successful probe marks the Agent available again.
+    - Provisioning calls check() first and gets AgentUnavailableError (503) without
+      touching the network while the Agent is down.
+    """
+
+    def __init__(
+        self,
+        channel: grpc_aio.Channel,
+        probe_interval: float = 5.0,
+        probe_timeout: float = 1.0,
+        backoff_initial: float = 0.5,
+        backoff_max: float = 30.0,
+    ):
+        self.channel = channel
+        self.probe_interval = max(0.01, float(probe_interval))
+        self.probe_timeout = max(0.01, float(probe_timeout))
+        self.backoff_initial = max(0.01, float(backoff_initial))
+        self.backoff_max = max(self.backoff_initial, float(backoff_max))
+
+        self._available = True
+        self._channel_state: Optional[grpc.ChannelConnectivity] = None
+        self._consecutive_failures = 0
+        self._last_change = time.time()
+        self._last_error: Optional[str] = None
+        self._wake = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self._health_check = channel.unary_unary(
+            HEALTH_CHECK_METHOD,
+            request_serializer=lambda _: b"",
+            response_deserializer=lambda data: data,
+        )
+
+    @property
+    def available(self) -> bool:
+        return self._available
+
+    def check(self, function_name: str) -> None:
+        """Raise AgentUnavailableError if provisioning should not be attempted."""
+        if not self._available:
+            raise AgentUnavailableError(
+                function_name,
+                f"Agent unavailable ({self._last_error or 'unreachable'})",
+            )
+
+    def observe_error(self, exc: BaseException) -> None:
+        """Feed a provisioning RPC error; connectivity errors mark the Agent down."""
+        if isinstance(exc, grpc_aio.AioRpcError) and exc.code() in _UNREACHABLE_CODES:
+            self._mark_unavailable(f"rpc {exc.code().name}")
+
+    def _mark_available(self) -> None:
+        self._consecutive_failures = 0
+        self._last_error = None
+        if not self._available:
+            self._available = True
+            self._last_change = time.time()
+            logger.info("Agent is reachable again; provisioning resumed")
+
+    def _mark_unavailable(self, reason: str) -> None:
+        self._last_error = reason
+        if self._available:
+            self._available = False
+            self._last_change = time.time()
+            logger.warning("Agent unreachable (%s); failing provisioning fast", reason)
+            # Start backoff probing right away.
+            self._wake.set()
+
+    async def probe(self) -> bool:
+        """Run one health probe and update availability."""
+        try:
+            response = await self._health_check(b"", timeout=self.probe_timeout)
+        except Exception as e:
+            reason = e.code().name if isinstance(e, grpc_aio.AioRpcError) else type(e).__name__
+            self._consecutive_failures += 1
+            self._mark_unavailable(f"health probe {reason}")
+            return False
+
+        if response != HEALTH_SERVING_RESPONSE:
+            self._consecutive_failures += 1
+            self._mark_unavailable("health probe NOT_SERVING")
+            return False
+
+        self._mark_available()
+        return True
+
+    def _next_probe_delay(self) -> float:
+        if self._available:
+            return self.probe_interval
+        exponent = max(0, self._consecutive_failures - 1)
+        return min(self.backoff_max, self.backoff_initial * (2**exponent))
+
+    async def _probe_loop(self) -> None:
+        while True:
+            await self.probe()
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._next_probe_delay())
+            except asyncio.TimeoutError:
+                pass
+
+    def _on_channel_state(self, state: grpc.ChannelConnectivity) -> None:
+        if state == self._channel_state:
+            return
+        logger.debug("Agent channel state: %s", state.name)
+        self._channel_state = state
+        if state in _UNREACHABLE_STATES:
+            self._mark_unavailable(f"channel {state.name}")
+        elif state == grpc.ChannelConnectivity.READY and not self._available:
+            # Reconnected: confirm with a probe instead of waiting for backoff.
+            self._wake.set()
+
+    async def _watch_channel(self) -> None:
+        try:
+            while True:
+                state = self.channel.get_state(try_to_connect=True)
+                self._on_channel_state(state)
+                await self.channel.wait_for_state_change(state)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Health probes keep tracking availability without the watcher.
+            logger.warning("Agent channel watcher stopped: %s", e)
+
+    async def start(self) -> None:
+        """Start the channel watcher and the health prober."""
+        self._tasks = [
+            asyncio.create_task(self._watch_channel()),
+            asyncio.create_task(self._probe_loop()),
+        ]
+
+    async def stop(self) -> None:
+        """Stop background tasks."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "available": self._available,
+            "channel_state": self._channel_state.name if self._channel_state else None,
+            "consecutive_failures": self._consecutive_failures,
+            "last_error": self._last_error,
+            "last_change": self._last_change,
+        }
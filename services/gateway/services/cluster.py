@@ -0,0 +1,413 @@
+"""
+Cluster mode - Gateway replicas sharing capacity by function ownership
+
+Each gateway replica owns its containers on the Agent (GATEWAY_OWNER_ID), so a
+load balancer spreading traffic over N replicas splits warm capacity N ways and
+every replica pays its own cold starts. In cluster mode the replicas place the
+functions on a consistent-hash ring of the members:
+
+- an invocation of a function owned by another replica is forwarded to it
+  (POST /_cluster/invoke/{function}); the owner runs it on its pools, so warm
+  workers are reused whichever replica received the request
+- members come from CLUSTER_MEMBERS (static) or from heartbeat files in a
+  shared directory (file); a change only moves the functions next to the
+  changed member on the ring
+- after a move, the old owner deletes its idle workers of the function and asks
+  the new owner to warm as many (POST /_cluster/handoff). Containers cannot
+  change owner on the Agent, so the capacity is handed off, not the containers.
+
+If the owner cannot be reached the invocation runs locally, and a forwarded
+invocation is never forwarded again, so membership skew between replicas costs
+at most a cold start, never a loop.
+"""
+
+import asyncio
+import hmac
+import json
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Dict, Optional, Protocol, Set
+
+import httpx
+
+from services.gateway.core.hash_ring import ConsistentHashRing
+from services.gateway.core.invocation_context import (
+    InvocationPriority,
+    get_invocation_affinity,
+)
+from services.gateway.models.result import InvocationResult
+
+if TYPE_CHECKING:
+    from .pool_manager import PoolManager
+
+logger = logging.getLogger("gateway.cluster")
+
+CLUSTER_INVOKE_PATH = "/_cluster/invoke/{function_name}"
+CLUSTER_HANDOFF_PATH = "/_cluster/handoff"
+CLUSTER_TOKEN_HEADER = "X-Cluster-Token"
+CLUSTER_FORWARDED_HEADER = "X-Cluster-Forwarded-By"
+CLUSTER_RESULT_HEADER = "X-Cluster-Result"
+CLUSTER_TIMEOUT_HEADER = "X-Cluster-Timeout"
+CLUSTER_PRIORITY_HEADER = "X-Cluster-Priority"
+CLUSTER_AFFINITY_HEADER = "X-Cluster-Affinity"
+
+# Added to the invocation timeout for the replica-to-replica hop.
+FORWARD_TIMEOUT_MARGIN_SECONDS = 5.0
+_DROPPED_HEADERS = {
+    "content-length",
+    "transfer-encoding",
+    "connection",
+    "keep-alive",
+    CLUSTER_RESULT_HEADER.lower(),
+}
+
+
+def parse_cluster_members(spec: str) -> Dict[str, str]:
+    """Parse 'owner_id=http://host:port,...' into {owner id: base URL}."""
+    members: Dict[str, str] = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        member_id, sep, url = item.partition("=")
+        if not sep or not member_id.strip() or not url.strip():
+            raise ValueError(f"Invalid cluster member: {item!r}")
+        members[member_id.strip()] = url.strip().rstrip("/")
+    return members
+
+
+class Membership(Protocol):
+    async def members(self) -> Dict[str, str]:
+        """Current members: {owner id: base URL}."""
+        ...
+
+
+class StaticMembership:
+    """Fixed member list (CLUSTER_MEMBERS)."""
+
+    def __init__(self, members: Dict[str, str]):
+        self._members = dict(members)
+
+    async def members(self) -> Dict[str, str]:
+        return dict(self._members)
+
+
+class FileMembership:
+    """
+    Members are the fresh heartbeat files (<owner id>.json) in a shared directory.
+
+    Every refresh rewrites this replica's own file; a replica that stops
+    refreshing drops out after `ttl` seconds (or at once on a clean shutdown).
+    """
+
+    def __init__(self, directory: str, self_id: str, self_url: str, ttl: float = 15.0):
+        if not self_url:
+            raise ValueError("CLUSTER_ADVERTISE_URL is required for the file registry")
+        self.directory = directory
+        self.self_id = self_id
+        self.self_url = self_url.rstrip("/")
+        self.ttl = float(ttl)
+        self.path = os.path.join(directory, f"{self_id.replace(os.sep, '_')}.json")
+
+    def _heartbeat(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"id": self.self_id, "url": self.self_url}, handle)
+        os.replace(tmp_path, self.path)
+
+    def _scan(self) -> Dict[str, str]:
+        self._heartbeat()
+        oldest = time.time() - self.ttl
+        members: Dict[str, str] = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    if entry.stat().st_mtime < oldest:
+                        continue
+                    with open(entry.path, encoding="utf-8") as handle:
+                        data = json.load(handle)
+                    members[str(data["id"])] = str(data["url"]).rstrip("/")
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    logger.warning(f"Ignoring cluster registry entry {entry.name}: {e}")
+        return members
+
+    async def members(self) -> Dict[str, str]:
+        return await asyncio.to_thread(self._scan)
+
+    def leave(self) -> None:
+        """Remove this replica's heartbeat file."""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class ClusterRouter:
+    """
+    Function ownership over the member ring, invoke forwarding and pool handoff.
+
+    Until the first refresh (or while no member is known) every function is
+    owned locally, i.e. the gateway behaves as without cluster mode.
+    """
+
+    def __init__(
+        self,
+        self_id: str,
+        membership: Membership,
+        pool_manager: "PoolManager",
+        client: httpx.AsyncClient,
+        shared_secret: str = "",
+        interval: float = 5.0,
+    ):
+        """
+        Args:
+            self_id: this replica's member id (GATEWAY_OWNER_ID)
+            membership: StaticMembership or FileMembership
+            pool_manager: local pools (ownership hook and handoff)
+            client: shared httpx client for replica-to-replica requests
+            shared_secret: token sent and required on replica-to-replica requests
+            interval: membership refresh / handoff sweep interval (seconds)
+        """
+        self.self_id = self_id
+        self.membership = membership
+        self.pool_manager = pool_manager
+        self.client = client
+        self.shared_secret = shared_secret
+        self.interval = float(interval)
+        self.ring = ConsistentHashRing()
+        self._urls: Dict[str, str] = {}
+        self._task: asyncio.Task | None = None
+        self._handoff_tasks: Set[asyncio.Task] = set()
+        self.counts = {
+            "forwarded": 0,
+            "forward_failures": 0,
+            "received": 0,
+            "handed_off": 0,
+            "taken_over": 0,
+            "membership_changes": 0,
+        }
+
+    def owner_of(self, function_name: str) -> Optional[str]:
+        return next(self.ring.walk(function_name), None)
+
+    def owns(self, function_name: str) -> bool:
+        owner = self.owner_of(function_name)
+        return owner is None or owner == self.self_id
+
+    def authorize(self, token: Optional[str]) -> bool:
+        """Check the token of a replica-to-replica request (never open without a secret)."""
+        return bool(self.shared_secret) and hmac.compare_digest(token or "", self.shared_secret)
+
+    def _headers(self) -> Dict[str, str]:
+        return {CLUSTER_TOKEN_HEADER: self.shared_secret, CLUSTER_FORWARDED_HEADER: self.self_id}
+
+    async def start(self) -> None:
+        """Load the membership once, then keep refreshing it in the background."""
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.error(f"Initial cluster membership refresh failed: {e}")
+        self.pool_manager.owns = self.owns
+        self._task = asyncio.create_task(self._loop())
+        logger.info(
+            f"Cluster mode started as {self.self_id} "
+            f"(members: {sorted(self.ring.nodes)}, interval: {self.interval}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop refreshing and leave the file registry."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        for task in list(self._handoff_tasks):
+            task.cancel()
+        leave = getattr(self.membership, "leave", None)
+        if leave is not None:
+            await asyncio.to_thread(leave)
+        logger.info("Cluster mode stopped")
+
+    async def _loop(self) -> None:
+        """Periodic execution loop."""
+        while True:
+            try:
+                await asyncio.sleep(self.interval)
+                await self.refresh()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Cluster membership refresh failed: {e}")
+
+    async def refresh(self) -> None:
+        """Sync the ring with the membership and hand off functions that moved away."""
+        members = await self.membership.members()
+        if set(members) != self.ring.nodes:
+            self.ring.sync(members)
+            self.counts["membership_changes"] += 1
+            logger.info(f"Cluster membership changed: {sorted(members)}")
+        self._urls = members
+        await self.hand_off_moved()
+
+    async def hand_off_moved(self) -> Dict[str, int]:
+        """
+        Delete idle workers of functions another replica owns and ask the owner to
+        warm as many. Busy workers are handed off on a later sweep once released.
+        Returns {function_name: handed off}.
+        """
+        result: Dict[str, int] = {}
+        for function_name, names in self.pool_manager.get_all_worker_names().items():
+            if not names or self.owns(function_name):
+                continue
+            count = await self.pool_manager.hand_off(function_name)
+            if count == 0:
+                continue
+            result[function_name] = count
+            self.counts["handed_off"] += count
+            owner = self.owner_of(function_name)
+            if owner is not None:
+                await self._notify_owner(owner, function_name, count)
+        return result
+
+    async def _notify_owner(self, owner: str, function_name: str, count: int) -> None:
+        url = self._urls.get(owner)
+        if url is None:
+            return
+        try:
+            response = await self.client.post(
+                f"{url}{CLUSTER_HANDOFF_PATH}",
+                json={"function_name": function_name, "count": count},
+                headers=self._headers(),
+                timeout=FORWARD_TIMEOUT_MARGIN_SECONDS,
+            )
+            response.raise_for_status()
+            logger.info(f"Handed off {count} workers of {function_name} to {owner}")
+        except httpx.HTTPError as e:
+            logger.warning(f"Handoff of {function_name} to {owner} failed: {e}")
+
+    def take_over(self, function_name: str, count: int) -> bool:
+        """
+        Warm `count` workers for a function handed off by another replica (in the
+        background). Returns False if this replica does not own the function.
+        """
+        if not self.owns(function_name):
+            return False
+        self.counts["taken_over"] += count
+
+        async def _warm() -> None:
+            try:
+                provisioned = await self.pool_manager.warm_up(function_name, count)
+                logger.info(f"Took over {function_name}: provisioned {provisioned} workers")
+            except Exception as e:
+                logger.error(f"Take-over warm-up failed for {function_name}: {e}")
+
+        task = asyncio.create_task(_warm())
+        self._handoff_tasks.add(task)
+        task.add_done_callback(self._handoff_tasks.discard)
+        return True
+
+    async def forward(
+        self,
+        function_name: str,
+        payload: bytes,
+        headers: Dict[str, str],
+        timeout: float,
+        priority: InvocationPriority = InvocationPriority.INTERACTIVE,
+    ) -> Optional[InvocationResult]:
+        """
+        Run the invocation on the owner replica.
+
+        Returns None if the owner could not be reached (the caller runs it locally).
+        """
+        owner = self.owner_of(function_name)
+        url = self._urls.get(owner) if owner is not None else None
+        if url is None:
+            return None
+        request_headers = {
+            **headers,
+            **self._headers(),
+            CLUSTER_TIMEOUT_HEADER: str(timeout),
+            CLUSTER_PRIORITY_HEADER: str(int(priority)),
+        }
+        affinity = get_invocation_affinity()
+        if affinity is not None:
+            request_headers[CLUSTER_AFFINITY_HEADER] = affinity
+        try:
+            response = await self.client.post(
+                f"{url}{CLUSTER_INVOKE_PATH.format(function_name=function_name)}",
+                content=payload,
+                headers=request_headers,
+                timeout=timeout + FORWARD_TIMEOUT_MARGIN_SECONDS,
+            )
+        except httpx.HTTPError as e:
+            self.counts["forward_failures"] += 1
+            logger.warning(f"Forwarding {function_name} to {owner} failed, running locally: {e}")
+            return None
+
+        outcome = response.headers.get(CLUSTER_RESULT_HEADER)
+        if outcome not in ("ok", "error"):
+            # Not answered by a cluster endpoint (token mismatch, cluster mode off).
+            self.counts["forward_failures"] += 1
+            logger.warning(
+                f"Owner {owner} rejected forwarded {function_name} "
+                f"({response.status_code}), running locally"
+            )
+            return None
+
+        self.counts["forwarded"] += 1
+        if outcome == "error":
+            try:
+                error = response.json().get("message")
+            except ValueError:
+                error = response.text
+            return InvocationResult(
+                success=False, status_code=response.status_code, error=str(error)
+            )
+        kept = [k for k in response.headers.keys() if k.lower() not in _DROPPED_HEADERS]
+        return InvocationResult(
+            success=True,
+            status_code=response.status_code,
+            payload=response.content,
+            headers={k: response.headers[k] for k in kept},
+            multi_headers={k: response.headers.get_list(k) for k in kept},
+        )
+
+    @property
+    def stats(self) -> Dict[str, object]:
+        return {
+            "self": self.self_id,
+            "members": sorted(self.ring.nodes),
+            **self.counts,
+        }
+
+
+def create_cluster_router(
+    config, pool_manager: "PoolManager", client: httpx.AsyncClient
+) -> Optional[ClusterRouter]:
+    """Build the ClusterRouter from GatewayConfig (None unless CLUSTER_MODE is set)."""
+    mode = getattr(config, "CLUSTER_MODE", "off")
+    if mode not in ("static", "file"):
+        return None
+    self_id = config.GATEWAY_OWNER_ID
+    if mode == "static":
+        membership: Membership = StaticMembership(parse_cluster_members(config.CLUSTER_MEMBERS))
+    else:
+        membership = FileMembership(
+            config.CLUSTER_REGISTRY_DIR,
+            self_id,
+            config.CLUSTER_ADVERTISE_URL,
+            ttl=config.CLUSTER_MEMBER_TTL_SECONDS,
+        )
+    return ClusterRouter(
+        self_id,
+        membership,
+        pool_manager,
+        client,
+        shared_secret=config.CLUSTER_SHARED_SECRET,
+        interval=config.CLUSTER_REFRESH_INTERVAL,
+    )
@@ -0,0 +1,159 @@
+"""
+ContainerLifecycleExecutor - Bounded-parallel destroy/pause/resume via the Agent
+
+All container lifecycle calls of the PoolManager go through one executor:
+
+- at most `max_parallel` Agent calls run at once (shutdown, janitor prune and
+  reconciliation no longer delete one container per await)
+- the same operation on the same container is deduplicated: a second caller
+  awaits the call already in flight
+- calls failing with a transient gRPC error (UNAVAILABLE / DEADLINE_EXCEEDED) are
+  retried with exponential backoff; other errors fail immediately
+- destroying a container the Agent no longer has (NOT_FOUND) counts as done
+"""
+
+import asyncio
+import logging
+from typing import AbstractSet, Any, Awaitable, Callable, Dict, Iterable, Set, Tuple
+
+from grpc import StatusCode
+from grpc.aio import AioRpcError
+
+from services.common.models.internal import WorkerInfo
+
+logger = logging.getLogger("gateway.container_lifecycle")
+
+# gRPC status codes worth retrying: the Agent may answer the next attempt.
+_RETRYABLE_CODES = {StatusCode.UNAVAILABLE, StatusCode.DEADLINE_EXCEEDED}
+
+
+class ContainerLifecycleExecutor:
+    def __init__(
+        self,
+        provision_client: Any,
+        max_parallel: int = 8,
+        retries: int = 2,
+        backoff_seconds: float = 0.2,
+    ):
+        """
+        Args:
+            provision_client: client with delete_container / pause_container / resume_container
+            max_parallel: max concurrent lifecycle calls to the Agent
+            retries: retries after the first attempt failed with a transient gRPC error
+            backoff_seconds: delay before the first retry (doubled per retry)
+        """
+        self.provision_client = provision_client
+        try:
+            self.max_parallel = max(1, int(max_parallel))
+            self.retries = max(0, int(retries))
+            self.backoff_seconds = max(0.0, float(backoff_seconds))
+        except (TypeError, ValueError):
+            self.max_parallel, self.retries, self.backoff_seconds = 8, 2, 0.2
+        self._semaphore = asyncio.Semaphore(self.max_parallel)
+        self._tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+
+    @property
+    def deleting_ids(self) -> Set[str]:
+        """Container ids with a destroy in flight."""
+        return {container_id for op, container_id in self._tasks if op == "destroy"}
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "max_parallel": self.max_parallel,
+            "in_flight": len(self._tasks),
+            "completed": self.completed,
+            "failed": self.failed,
+            "retried": self.retried,
+        }
+
+    async def _attempt(
+        self,
+        call: Callable[[], Awaitable[Any]],
+        retries: int,
+        done_codes: AbstractSet[StatusCode],
+    ) -> None:
+        delay = self.backoff_seconds
+        for attempt in range(retries + 1):
+            try:
+                async with self._semaphore:
+                    await call()
+                self.completed += 1
+                return
+            except Exception as e:
+                code = e.code() if isinstance(e, AioRpcError) else None
+                if code in done_codes:
+                    self.completed += 1
+                    return
+                if attempt == retries or code not in _RETRYABLE_CODES:
+                    self.failed += 1
+                    raise
+                self.retried += 1
+                await asyncio.sleep(delay)
+                delay *= 2
+
+    async def _run(
+        self,
+        op: str,
+        container_id: str,
+        call: Callable[[], Awaitable[Any]],
+        retries: int,
+        done_codes: AbstractSet[StatusCode] = frozenset(),
+    ) -> None:
+        key = (op, container_id)
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(self._attempt(call, retries, done_codes))
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        # A cancelled caller must not cancel the call other callers share.
+        await asyncio.shield(task)
+
+    async def destroy(self, container_id: str) -> bool:
+        """
+        Destroy a container. A container the Agent does not know (NOT_FOUND) is
+        already gone. Returns False (after logging) if the destroy failed.
+        """
+        try:
+            await self._run(
+                "destroy",
+                container_id,
+                lambda: self.provision_client.delete_container(container_id),
+                self.retries,
+                done_codes={StatusCode.NOT_FOUND},
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to delete container {container_id}: {e}")
+            return False
+
+    async def destroy_many(self, container_ids: Iterable[str]) -> int:
+        """Destroy containers in parallel. Returns how many were deleted."""
+        results = await asyncio.gather(*(self.destroy(cid) for cid in set(container_ids)))
+        return sum(results)
+
+    async def pause(self, function_name: str, worker: WorkerInfo) -> None:
+        """Pause a container (raises if the pause failed)."""
+        await self._run(
+            "pause",
+            worker.id,
+            lambda: self.provision_client.pause_container(function_name, worker),
+            self.retries,
+        )
+
+    async def resume(self, function_name: str, worker: WorkerInfo, retry: bool = True) -> None:
+        """
+        Resume a container (raises if the resume failed).
+
+        retry=False makes a single attempt, for callers on the request path that
+        would rather evict the worker and take another one than wait for backoff.
+        """
+        await self._run(
+            "resume",
+            worker.id,
+            lambda: self.provision_client.resume_container(function_name, worker),
+            self.retries if retry else 0,
+        )
@@ -1,27 +1,142 @@
 """
 ContainerPool - Worker Pool Management for Auto-Scaling
 
-Manages a pool of Lambda containers for a single function using Condition-based
-capacity control. Supports concurrent acquire/release with proper notification of waiters.
+Manages a pool of Lambda containers for a single function. Waiters are queued with
+per-waiter futures and capacity is handed directly to the best-ranked waiter
+(FIFO within a priority class), so a release wakes exactly one acquirer.
+
+A worker may serve up to `per_worker_concurrency` invocations at once (slots).
+Which idle worker an acquire takes is set by the selection policy: "mru" (default)
+reuses the most recently released worker so surplus workers age out after a
+spike, "fifo" rotates through all idle workers, "least_invocations" spreads work.
+Acquires with an affinity key prefer the key's worker on a consistent-hash ring.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import time
-from collections import deque
-from typing import Awaitable, Callable, Deque, Dict, List
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from services.common.models.internal import WorkerInfo
+from services.gateway.core.adaptive_limiter import AdaptiveLimiter
+from services.gateway.core.burst_control import BurstController
+from services.gateway.core.demand_forecast import DemandForecaster
+from services.gateway.core.hash_ring import ConsistentHashRing
+from services.gateway.core.invocation_context import InvocationPriority
 
 logger = logging.getLogger("gateway.container_pool")
 
+# Ring successors tried for an affinity key before falling back to any worker.
+AFFINITY_CANDIDATES = 2
+
+SELECTION_POLICIES = ("mru", "fifo", "least_invocations")
+
+
+class _ProvisionGrant:
+    """Grant handed to a waiter: a provisioning slot was reserved for it."""
+
+
+_PROVISION = _ProvisionGrant()
+
+_Grant = Union[WorkerInfo, _ProvisionGrant]
+
+
+class _IdleIndex:
+    """
+    Idle workers indexed by id, oldest release first.
+
+    Keeps the deque-style API (append/pop/popleft) while making removal and
+    membership checks O(1). Running (not paused) workers are also kept in their
+    own index, so pop/popleft take a running worker first in O(1).
+    """
+
+    def __init__(self) -> None:
+        self._workers: "OrderedDict[str, WorkerInfo]" = OrderedDict()
+        self._running: "OrderedDict[str, WorkerInfo]" = OrderedDict()
+
+    def append(self, worker: WorkerInfo, paused: bool = False) -> None:
+        self._workers.pop(worker.id, None)
+        self._workers[worker.id] = worker
+        self._running.pop(worker.id, None)
+        if not paused:
+            self._running[worker.id] = worker
+
+    def set_paused(self, worker_id: str, paused: bool) -> None:
+        worker = self._workers.get(worker_id)
+        if worker is None:
+            return
+        if paused:
+            self._running.pop(worker_id, None)
+        elif worker_id not in self._running:
+            self._running[worker_id] = worker
+
+    def _take(self, last: bool) -> WorkerInfo:
+        source = self._running or self._workers
+        worker_id, worker = source.popitem(last=last)
+        self._workers.pop(worker_id, None)
+        return worker
+
+    def popleft(self) -> WorkerInfo:
+        return self._take(last=False)
+
+    def pop(self) -> WorkerInfo:
+        return self._take(last=True)
+
+    def preferred(self) -> List[WorkerInfo]:
+        """Running idle workers, or all of them if every one is paused."""
+        return list((self._running or self._workers).values())
+
+    @property
+    def paused_count(self) -> int:
+        return len(self._workers) - len(self._running)
+
+    def remove(self, worker_id: str) -> Optional[WorkerInfo]:
+        self._running.pop(worker_id, None)
+        return self._workers.pop(worker_id, None)
+
+    def clear(self) -> None:
+        self._workers.clear()
+        self._running.clear()
+
+    def __contains__(self, worker_id: object) -> bool:
+        return worker_id in self._workers
+
+    def __len__(self) -> int:
+        return len(self._workers)
+
+    def __iter__(self) -> Iterator[WorkerInfo]:
+        return iter(list(self._workers.values()))
+
+
+class _Waiter:
+    __slots__ = ("key", "priority", "future", "affinity")
+
+    def __init__(
+        self,
+        key: Tuple[float, int],
+        priority: InvocationPriority,
+        future: "asyncio.Future[_Grant]",
+        affinity: Optional[str] = None,
+    ):
+        self.key = key
+        self.priority = priority
+        self.future = future
+        self.affinity = affinity
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return self.key < other.key
+
 
 class ContainerPool:
     """
-    Per-function container pool management (Condition-based).
+    Per-function container pool management (direct handoff).
 
-    Uses asyncio.Condition to resolve semaphore inconsistencies noted in review
-    and a deadlock observed in E2E (waiters not waking on release).
+    All state changes happen synchronously on the event loop, so no lock is held
+    across awaits. Each waiter owns a future; release/evict/provision failure hand
+    the freed capacity to a single waiter instead of waking all of them.
     """
 
     def __init__(
@@ -30,17 +145,64 @@ class ContainerPool:
         max_capacity: int = 1,
         min_capacity: int = 0,
         acquire_timeout: float = 30.0,
+        limiter: Optional[AdaptiveLimiter] = None,
+        reserved_interactive: int = 0,
+        priority_aging_seconds: float = 10.0,
+        forecaster: Optional[DemandForecaster] = None,
+        per_worker_concurrency: int = 1,
+        selection_policy: str = "mru",
+        burst: Optional[BurstController] = None,
+        idle_timeout: Optional[float] = None,
+        pause_idle_seconds: Optional[float] = None,
+        max_worker_age: Optional[float] = None,
+        max_worker_invocations: Optional[int] = None,
+        paused_ids: Optional[Set[str]] = None,
     ):
         self.function_name = function_name
         self.max_capacity = max_capacity
+        # In-flight invocations one worker may serve at once.
+        self.per_worker_concurrency = max(1, per_worker_concurrency)
         self.min_capacity = min_capacity
         self.acquire_timeout = acquire_timeout
-
-        # Condition to guard state changes and send notifications.
-        self._cv = asyncio.Condition()
-
-        # Idle workers (managed efficiently with deque).
-        self._idle_workers: Deque[WorkerInfo] = deque()
+        # Optional adaptive limiter (effective concurrency <= max_capacity).
+        self.limiter = limiter
+        # Capacity that only INTERACTIVE invocations may use.
+        self.reserved_interactive = max(0, min(reserved_interactive, max_capacity - 1))
+        # Waiting this long promotes a waiter by one priority class (anti-starvation).
+        self.priority_aging_seconds = max(0.001, priority_aging_seconds)
+        # Optional arrival-rate / concurrency estimator (scale-ahead).
+        self.forecaster = forecaster
+        # Optional queue-vs-provision decision for waiters (cold-start bursts).
+        self.burst = burst
+        self._burst_recheck: Optional[asyncio.TimerHandle] = None
+        # When a slot was last freed (monotonic); queueing only pays off while it moves.
+        self._last_freed = time.monotonic()
+
+        # Per-function lifecycle policy. Idle deadlines of None fall back to the
+        # gateway-wide settings (applied by PoolManager); a worker past its age or
+        # invocation limit is retired on release instead of going back to idle.
+        self.idle_timeout = idle_timeout
+        self.pause_idle_seconds = pause_idle_seconds
+        self.max_worker_age = max_worker_age
+        self.max_worker_invocations = max_worker_invocations
+        self._recycled = 0
+        # Idle workers found dead by the background health check.
+        self._unhealthy = 0
+
+        # Idle workers (no invocation in flight), indexed by id.
+        self._idle_workers = _IdleIndex()
+        if selection_policy not in SELECTION_POLICIES:
+            raise ValueError(f"Unknown selection policy: {selection_policy}")
+        self.selection_policy = selection_policy
+        # Invocations handed to each worker (least_invocations policy).
+        self._invocations: Dict[str, int] = {}
+        # Ids of paused containers (owned by PoolManager; workers becoming idle are
+        # indexed by it, later changes arrive via set_paused). Running idle workers
+        # are handed out first.
+        self._paused_ids: Set[str] = paused_ids if paused_ids is not None else set()
+
+        # Busy workers that still have free slots (per_worker_concurrency > 1).
+        self._partial_workers: Dict[str, WorkerInfo] = {}
 
         # Ledger of all existing containers (busy + idle).
         self._all_workers: Dict[str, WorkerInfo] = {}
@@ -48,83 +210,491 @@ class ContainerPool:
         # Number of in-flight provisions (for capacity checks).
         self._provisioning_count = 0
 
+        # Hand-out times (monotonic) of the in-flight invocations of each busy worker,
+        # for invoke latency samples.
+        self._busy_since: Dict[str, List[float]] = {}
+        self._in_flight = 0
+
+        # Evicted workers whose other in-flight invocations have not returned yet.
+        self._evicted_slots: Dict[str, int] = {}
+
+        # One heap of waiters per priority class, ordered by (rank, seq).
+        # rank = priority * aging + enqueue time, so an older waiter of a lower class
+        # overtakes newer higher-class waiters once it has waited long enough.
+        # Timed-out/cancelled waiters stay in the heap (future done) and are skipped.
+        self._waiters: Dict[InvocationPriority, List[_Waiter]] = {p: [] for p in InvocationPriority}
+        self._waiting = 0
+        self._waiter_seq = itertools.count()
+
+        # Acquisitions served, and how many of them had to provision (cold starts).
+        self._acquired = 0
+        self._cold_starts = 0
+
+        # Consistent-hash ring over worker ids (synced lazily on affinity acquires).
+        self._ring = ConsistentHashRing()
+        self._affinity_hits = 0
+        self._affinity_misses = 0
+
+    def _demand(self) -> int:
+        """In-flight + provisioning + waiting: invocation slots needed right now."""
+        return self._in_flight + self._provisioning_count + self._waiting
+
+    @property
+    def slot_capacity(self) -> int:
+        """Max concurrent invocations (max_capacity x per_worker_concurrency)."""
+        return self.max_capacity * self.per_worker_concurrency
+
+    def _concurrency_limit(self) -> int:
+        """Effective concurrency limit in slots (adaptive limit capped by slot capacity)."""
+        if self.limiter is None:
+            return self.slot_capacity
+        return min(self.slot_capacity, self.limiter.limit)
+
+    def _has_concurrency_headroom(self) -> bool:
+        if self.limiter is None:
+            return True
+        return self._in_flight + self._provisioning_count < self._concurrency_limit()
+
+    def _can_serve(self, priority: InvocationPriority) -> bool:
+        """Whether a waiter of this class may take capacity right now."""
+        if not self._has_concurrency_headroom():
+            return False
+        if priority == InvocationPriority.INTERACTIVE or self.reserved_interactive == 0:
+            return True
+        in_flight = self._in_flight + self._provisioning_count
+        reserved = self.reserved_interactive * self.per_worker_concurrency
+        return in_flight < self.slot_capacity - reserved
+
+    def _take_slot(self, worker: WorkerInfo) -> None:
+        """Hand out one slot of a worker."""
+        started = self._busy_since.setdefault(worker.id, [])
+        started.append(time.monotonic())
+        self._in_flight += 1
+        self._invocations[worker.id] = self._invocations.get(worker.id, 0) + 1
+        if len(started) < self.per_worker_concurrency:
+            self._partial_workers[worker.id] = worker
+        else:
+            self._partial_workers.pop(worker.id, None)
+
+    def _pop_idle(self) -> WorkerInfo:
+        """Take an idle worker according to the selection policy (running before paused)."""
+        if self.selection_policy == "fifo":
+            return self._idle_workers.popleft()
+        if self.selection_policy == "least_invocations":
+            if len(self._invocations) > 2 * len(self._all_workers) + 16:
+                # Forget counts of workers that are gone.
+                self._invocations = {
+                    wid: n for wid, n in self._invocations.items() if wid in self._all_workers
+                }
+            worker = min(
+                self._idle_workers.preferred(), key=lambda w: self._invocations.get(w.id, 0)
+            )
+            self._idle_workers.remove(worker.id)
+            return worker
+        return self._idle_workers.pop()
+
+    def _free_slot(self, worker: WorkerInfo) -> Optional[float]:
+        """
+        Return one slot of a worker; it becomes idle once nothing is in flight.
+
+        Returns the hand-out time of the freed slot (oldest first), if tracked.
+        """
+        started = self._busy_since.get(worker.id)
+        started_at = None
+        if started:
+            started_at = started.pop(0)
+            self._in_flight -= 1
+        if started:
+            self._partial_workers[worker.id] = worker
+        else:
+            self._busy_since.pop(worker.id, None)
+            self._partial_workers.pop(worker.id, None)
+            self._idle_workers.append(worker, paused=worker.id in self._paused_ids)
+        return started_at
+
+    def _drop_evicted_slot(self, worker_id: str) -> bool:
+        """Account for a slot of an already evicted worker. True if it was one."""
+        remaining = self._evicted_slots.get(worker_id)
+        if remaining is None:
+            return False
+        self._in_flight -= 1
+        if remaining <= 1:
+            del self._evicted_slots[worker_id]
+        else:
+            self._evicted_slots[worker_id] = remaining - 1
+        return True
+
+    def _next_waiter(self) -> Optional[_Waiter]:
+        """Best-ranked live waiter whose class can be served now (not popped)."""
+        best: Optional[_Waiter] = None
+        for priority, heap in self._waiters.items():
+            while heap and heap[0].future.done():
+                heapq.heappop(heap)
+            if heap and (best is None or heap[0].key < best.key) and self._can_serve(priority):
+                best = heap[0]
+        return best
+
+    def _affinity_worker(self, key: str) -> Optional[WorkerInfo]:
+        """The key's worker (or a ring successor) if it has a free slot."""
+        if self._ring.nodes != self._all_workers.keys():
+            self._ring.sync(self._all_workers.keys())
+        for rank, worker_id in enumerate(self._ring.walk(key)):
+            if rank >= AFFINITY_CANDIDATES:
+                break
+            if worker_id in self._idle_workers:
+                return self._idle_workers.remove(worker_id)
+            if worker_id in self._partial_workers:
+                return self._partial_workers[worker_id]
+        return None
+
+    def _take_grant(self, affinity: Optional[str] = None, waited: float = 0.0) -> Optional[_Grant]:
+        """
+        Take a slot (the affinity key's worker, then an idle worker, then the
+        least-loaded busy worker with a free slot) or reserve a provisioning slot.
+
+        `waited` is how long the waiter has been queued (burst control).
+        """
+        missed = False
+        if affinity is not None and self._all_workers:
+            worker = self._affinity_worker(affinity)
+            if worker is not None:
+                self._affinity_hits += 1
+                self._take_slot(worker)
+                return worker
+            missed = True
+
+        if self._idle_workers:
+            worker = self._pop_idle()
+        elif self._partial_workers:
+            worker = min(self._partial_workers.values(), key=lambda w: len(self._busy_since[w.id]))
+        else:
+            worker = None
+        if worker is not None:
+            self._affinity_misses += missed
+            self._take_slot(worker)
+            return worker
+
+        # Waiters that spare slots of in-flight provisions will absorb do not
+        # provision another worker.
+        spare = self._provisioning_count * (self.per_worker_concurrency - 1)
+        if (
+            len(self._all_workers) + self._provisioning_count < self.max_capacity
+            and self._waiting > spare
+            and self._burst_allows_provision(waited)
+        ):
+            self._affinity_misses += missed
+            self._provisioning_count += 1
+            return _PROVISION
+        return None
+
+    def _burst_allows_provision(self, waited: float) -> bool:
+        """Provision for the waiter unless queueing behind in-flight work is faster."""
+        burst = self.burst
+        if burst is None:
+            return True
+        if burst.at_cap(self._provisioning_count):
+            # Re-dispatched when a provision finishes.
+            return False
+        queued = self._waiting - self._provisioning_count * self.per_worker_concurrency
+        stalled = min(waited, time.monotonic() - self._last_freed)
+        if burst.should_provision(queued, self._in_flight, stalled):
+            return True
+        if self._burst_recheck is None and burst.cold_start_seconds is not None:
+            # No release may come in time: re-decide once nothing moved for a cold start.
+            delay = max(0.001, burst.cold_start_seconds - stalled)
+            self._burst_recheck = asyncio.get_running_loop().call_later(delay, self._recheck)
+        return False
+
+    def _recheck(self) -> None:
+        self._burst_recheck = None
+        self._dispatch()
+
+    def _return_grant(self, grant: _Grant) -> None:
+        """Undo a grant whose waiter went away (timeout/cancel race)."""
+        if isinstance(grant, _ProvisionGrant):
+            if self._provisioning_count > 0:
+                self._provisioning_count -= 1
+        elif grant.id in self._all_workers:
+            self._free_slot(grant)
+        else:
+            self._drop_evicted_slot(grant.id)
+
+    def _dispatch(self) -> None:
+        """Hand available capacity to waiters in rank order."""
+        while self._waiting:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            enqueued_at = waiter.key[0] - waiter.priority * self.priority_aging_seconds
+            grant = self._take_grant(waiter.affinity, time.monotonic() - enqueued_at)
+            if grant is None:
+                return
+            heapq.heappop(self._waiters[waiter.priority])
+            self._waiting -= 1
+            waiter.future.set_result(grant)
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Drop a waiter that timed out or was cancelled."""
+        if waiter.future.done():
+            if not waiter.future.cancelled():
+                # Granted at the same time as the timeout/cancel: give it back.
+                self._return_grant(waiter.future.result())
+                self._dispatch()
+            return
+        waiter.future.cancel()
+        self._waiting -= 1
+
     async def acquire(
-        self, provision_callback: Callable[[str], Awaitable[List[WorkerInfo]]]
+        self,
+        provision_callback: Callable[[str], Awaitable[List[WorkerInfo]]],
+        priority: InvocationPriority = InvocationPriority.INTERACTIVE,
+        affinity_key: Optional[str] = None,
     ) -> WorkerInfo:
         """
         Acquire an available worker, provisioning if needed.
+
+        Waiters are served by priority class with aging (see priority_aging_seconds),
+        FIFO within a class. With `affinity_key`, the worker the key hashes to is
+        preferred when it is free; otherwise any free worker is used.
         """
-        async with self._cv:
-            start_time = time.time()
-
-            while True:
-                # 1. Prefer idle workers.
-                if self._idle_workers:
-                    worker = self._idle_workers.popleft()
-                    return worker
-
-                # 2. Provision if capacity is available.
-                if len(self._all_workers) + self._provisioning_count < self.max_capacity:
-                    # Reserve a provisioning slot.
-                    self._provisioning_count += 1
-                    break
-
-                # 3. Wait if full.
-                elapsed = time.time() - start_time
-                remaining = self.acquire_timeout - elapsed
-                if remaining <= 0:
-                    raise asyncio.TimeoutError(f"Pool acquire timeout for {self.function_name}")
-
-                try:
-                    # wait() releases the lock and re-acquires on notify.
-                    await asyncio.wait_for(self._cv.wait(), timeout=remaining)
-                except asyncio.TimeoutError:
-                    raise asyncio.TimeoutError(
-                        f"Pool acquire timeout for {self.function_name}"
-                    ) from None
-
-        # --- Provisioning (I/O, so do it outside the CV lock) ---
+        rank = priority * self.priority_aging_seconds + time.monotonic()
+        waiter = _Waiter(
+            (rank, next(self._waiter_seq)),
+            priority,
+            asyncio.get_running_loop().create_future(),
+            affinity_key,
+        )
+        heapq.heappush(self._waiters[priority], waiter)
+        self._waiting += 1
+        self._dispatch()
+        if self.forecaster is not None:
+            self.forecaster.on_arrival(self._demand())
+
+        if not waiter.future.done():
+            try:
+                await asyncio.wait({waiter.future}, timeout=self.acquire_timeout)
+            except BaseException:
+                self._abandon(waiter)
+                raise
+            if not waiter.future.done():
+                self._abandon(waiter)
+                raise asyncio.TimeoutError(f"Pool acquire timeout for {self.function_name}")
+
+        grant = waiter.future.result()
+        self._acquired += 1
+        if isinstance(grant, WorkerInfo):
+            return grant
+        self._cold_starts += 1
+
+        # --- Provisioning (I/O; the slot is already reserved) ---
+        started_at = time.monotonic()
         try:
             workers: List[WorkerInfo] = await provision_callback(self.function_name)
             worker = workers[0]
-            async with self._cv:
-                # Even if another worker exceeds max_capacity, register and
-                # decrement provision_count (for safety).
-                # Register/Update the authoritative object.
-                self._all_workers[worker.id] = worker
-                self._provisioning_count -= 1
-                return worker
         except BaseException:
-            # On failure/cancel, release reserved slot and wake waiters.
-            async with self._cv:
-                if self._provisioning_count > 0:
-                    self._provisioning_count -= 1
-                self._cv.notify_all()
+            # On failure/cancel, release reserved slot and hand it to the next waiter.
+            if self._provisioning_count > 0:
+                self._provisioning_count -= 1
+            self._dispatch()
             raise
 
-    async def release(self, worker: WorkerInfo) -> None:
+        # Even if another worker exceeds max_capacity, register and
+        # decrement provision_count (for safety).
+        # Register/Update the authoritative object.
+        self._all_workers[worker.id] = worker
+        self._provisioning_count -= 1
+        self._take_slot(worker)
+        # Extra workers of a batch response go to the idle set.
+        extra = self._add_idle(workers[1:])
+        if self.burst is not None:
+            self.burst.observe_cold_start(time.monotonic() - started_at)
+        if self.per_worker_concurrency > 1 or self.burst is not None or extra:
+            # Hand the remaining slots (and provisioning room below a burst cap) to waiters.
+            self._dispatch()
+        return worker
+
+    async def prewarm(
+        self,
+        provision_callback: Callable[..., Awaitable[List[WorkerInfo]]],
+        count: int = 1,
+    ) -> List[WorkerInfo]:
         """
-        Return a worker to the pool.
+        Provision up to `count` extra idle workers in one call if capacity allows
+        (min_capacity / warm-up).
+
+        More than one worker is requested as `provision_callback(name, count=n)`.
+        Returns the new workers ([] without provisioning when the pool is already
+        full). They go to the idle set (or straight to waiters).
         """
-        async with self._cv:
-            worker.last_used_at = time.time()
-            # Ensure the authoritative map has this instance (or update it)
+        count = min(count, self.max_capacity - len(self._all_workers) - self._provisioning_count)
+        if count <= 0:
+            return []
+        self._provisioning_count += count
+        started_at = time.monotonic()
+        try:
+            if count == 1:
+                workers: List[WorkerInfo] = await provision_callback(self.function_name)
+            else:
+                workers = await provision_callback(self.function_name, count=count)
+        except BaseException:
+            self._provisioning_count = max(0, self._provisioning_count - count)
+            self._dispatch()
+            raise
+
+        self._provisioning_count = max(0, self._provisioning_count - count)
+        if self.burst is not None:
+            self.burst.observe_cold_start(time.monotonic() - started_at)
+        added = self._add_idle(workers[:count])
+        self._dispatch()
+        return added
+
+    def _add_idle(self, workers: List[WorkerInfo]) -> List[WorkerInfo]:
+        """Register freshly provisioned workers as idle, up to max_capacity."""
+        added = []
+        now = time.time()
+        for worker in workers:
+            if worker.id in self._all_workers:
+                continue
+            if len(self._all_workers) + self._provisioning_count >= self.max_capacity:
+                # Left to orphan reconciliation.
+                logger.warning(
+                    f"Pool {self.function_name} is full; not adopting extra worker {worker.id}"
+                )
+                continue
+            worker.last_used_at = now
             self._all_workers[worker.id] = worker
-            self._idle_workers.append(worker)
-            # Important: notify waiters that a resource is available.
-            self._cv.notify_all()
+            self._idle_workers.append(worker, paused=worker.id in self._paused_ids)
+            added.append(worker)
+        return added
+
+    @property
+    def idle_count(self) -> int:
+        """Idle workers plus in-flight provisions (capacity that will be warm)."""
+        return len(self._idle_workers) + self._provisioning_count
+
+    @property
+    def provisioning_count(self) -> int:
+        """In-flight provisions."""
+        return self._provisioning_count
+
+    @property
+    def busy_count(self) -> int:
+        """Workers with at least one invocation in flight."""
+        return len(self._all_workers) - len(self._idle_workers)
+
+    @property
+    def in_flight(self) -> int:
+        """Invocations currently in flight (slots handed out)."""
+        return self._in_flight
+
+    def _recycle_due(self, worker: WorkerInfo) -> bool:
+        """True if the worker reached max_worker_age / max_worker_invocations."""
+        if (
+            self.max_worker_invocations is not None
+            and self._invocations.get(worker.id, 0) >= self.max_worker_invocations
+        ):
+            return True
+        return (
+            self.max_worker_age is not None
+            and worker.created_at > 0
+            and time.time() - worker.created_at >= self.max_worker_age
+        )
+
+    async def release(self, worker: WorkerInfo) -> bool:
+        """
+        Return a worker slot to the pool (handed directly to the next waiter, if any).
+
+        Returns True if the worker was retired instead (recycling limits reached);
+        the caller deletes its container. A retired worker with other invocations
+        in flight takes no new ones and is retired on its last release.
+        """
+        worker.last_used_at = time.time()
+        if self._drop_evicted_slot(worker.id):
+            return False
+        # Ensure the authoritative map has this instance (or update it)
+        self._all_workers[worker.id] = worker
+        started_at = self._free_slot(worker)
+        retired = self._recycle_due(worker)
+        if retired:
+            self._partial_workers.pop(worker.id, None)
+            if worker.id in self._idle_workers:
+                self._idle_workers.remove(worker.id)
+                self._all_workers.pop(worker.id, None)
+                self._invocations.pop(worker.id, None)
+                self._recycled += 1
+            else:
+                retired = False
+        self._last_freed = time.monotonic()
+        latency = None if started_at is None else time.monotonic() - started_at
+        if self.limiter is not None and latency is not None:
+            self.limiter.on_sample(latency, in_flight=self._in_flight + 1)
+        if self.burst is not None and latency is not None:
+            self.burst.observe_warm(latency)
+        self._dispatch()
+        if self.forecaster is not None:
+            self.forecaster.on_release(self._demand(), service_time=latency)
+        return retired
 
     async def evict(self, worker: WorkerInfo) -> None:
         """
         Evict a dead worker from the pool (self-healing).
+
+        Other in-flight invocations on the worker still release/evict their slot.
         """
-        async with self._cv:
-            if worker.id in self._all_workers:
-                del self._all_workers[worker.id]
-            if self._idle_workers:
-                self._idle_workers = deque(w for w in self._idle_workers if w.id != worker.id)
-            # Notify because capacity is freed.
-            self._cv.notify_all()
+        if self._drop_evicted_slot(worker.id):
+            return
+        self._all_workers.pop(worker.id, None)
+        self._idle_workers.remove(worker.id)
+        self._partial_workers.pop(worker.id, None)
+        started = self._busy_since.pop(worker.id, None)
+        if started:
+            self._in_flight -= 1
+            if len(started) > 1:
+                self._evicted_slots[worker.id] = len(started) - 1
+        # Capacity is freed: let the next waiter provision.
+        self._dispatch()
+
+    def reclaim_idle(self, worker_id: str) -> Optional[WorkerInfo]:
+        """
+        Remove an idle worker so its container can be deleted (budget eviction).
+
+        Returns None if the worker is not idle or the pool is at min_capacity.
+        """
+        if worker_id not in self._idle_workers or len(self._all_workers) <= self.min_capacity:
+            return None
+        worker = self._idle_workers.remove(worker_id)
+        self._all_workers.pop(worker_id, None)
+        # Capacity is freed.
+        self._dispatch()
+        return worker
+
+    def take_idle_workers(self) -> List[WorkerInfo]:
+        """
+        Remove all idle workers regardless of min_capacity (the function moved to
+        another gateway replica). Busy workers stay until released.
+        """
+        workers = list(self._idle_workers)
+        self._idle_workers.clear()
+        for worker in workers:
+            self._all_workers.pop(worker.id, None)
+            self._invocations.pop(worker.id, None)
+        if workers:
+            self._dispatch()
+        return workers
+
+    def evict_unhealthy(self, worker_id: str) -> Optional[WorkerInfo]:
+        """
+        Remove an idle worker that failed a health check (min_capacity is not kept;
+        the caller replaces it). Returns None if the worker is no longer idle.
+        """
+        if worker_id not in self._idle_workers:
+            return None
+        worker = self._idle_workers.remove(worker_id)
+        self._all_workers.pop(worker_id, None)
+        self._invocations.pop(worker_id, None)
+        self._unhealthy += 1
+        self._dispatch()
+        return worker
 
     def get_all_names(self) -> List[str]:
         """For heartbeat: list of all names (busy + idle)."""
@@ -136,82 +706,115 @@ class ContainerPool:
 
     async def is_idle(self, worker_id: str) -> bool:
         """指定ワーカーがアイドルキューに存在するか確認"""
-        async with self._cv:
-            if not any(w.id == worker_id for w in self._idle_workers):
-                return False
-            return worker_id in self._all_workers
+        return worker_id in self._idle_workers and worker_id in self._all_workers
+
+    def set_paused(self, worker_id: str, paused: bool) -> None:
+        """Record that an idle worker's container was paused / resumed (PoolManager)."""
+        self._idle_workers.set_paused(worker_id, paused)
+
+    @property
+    def paused_idle_count(self) -> int:
+        """Idle workers whose container is paused."""
+        return self._idle_workers.paused_count
+
+    def get_idle_workers(self) -> List[WorkerInfo]:
+        """Idle workers, least recently released first."""
+        return list(self._idle_workers)
 
     @property
     def size(self) -> int:
         """Current total workers (busy + idle)."""
         return len(self._all_workers)
 
-    async def prune_idle_workers(self, idle_timeout: float) -> List[WorkerInfo]:
+    async def prune_idle_workers(self, idle_timeout: float, keep: int = 0) -> List[WorkerInfo]:
         """
-        Remove workers that exceed IDLE_TIMEOUT.
-        """
-        async with self._cv:
-            now = time.time()
-            pruned = []
-            surviving = deque()
+        Remove workers that exceed IDLE_TIMEOUT (or max_worker_age), never going
+        below min_capacity (or `keep`, whichever is larger).
 
-            while self._idle_workers:
-                worker = self._idle_workers.popleft()
-                if now - worker.last_used_at > idle_timeout:
-                    if worker.id in self._all_workers:
-                        del self._all_workers[worker.id]
-                    pruned.append(worker)
-                else:
-                    surviving.append(worker)
+        The least recently released workers are pruned first.
+        """
+        now = time.time()
+        pruned = []
+        floor = max(self.min_capacity, keep)
 
-            self._idle_workers = surviving
+        for worker in self._idle_workers:
+            if len(self._all_workers) <= floor:
+                break
+            if now - worker.last_used_at > idle_timeout or self._recycle_due(worker):
+                self._idle_workers.remove(worker.id)
+                self._all_workers.pop(worker.id, None)
+                pruned.append(worker)
 
-            if pruned:
-                # Notify because capacity is freed.
-                self._cv.notify_all()
+        if pruned:
+            # Capacity is freed.
+            self._dispatch()
 
-            return pruned
+        return pruned
 
     async def adopt(self, worker: WorkerInfo) -> bool:
         """
         Adopt an existing container into the pool.
         Returns True if adopted, False if at capacity.
         """
-        async with self._cv:
-            if len(self._all_workers) >= self.max_capacity:
-                return False
-
-            if worker.id not in self._all_workers:
-                if worker.last_used_at == 0:
-                    worker.last_used_at = time.time()
-                self._all_workers[worker.id] = worker
-                self._idle_workers.append(worker)
-                self._cv.notify_all()
-                return True
+        if len(self._all_workers) >= self.max_capacity:
             return False
 
+        if worker.id not in self._all_workers:
+            if worker.last_used_at == 0:
+                worker.last_used_at = time.time()
+            if worker.created_at == 0:
+                worker.created_at = time.time()
+            self._all_workers[worker.id] = worker
+            self._idle_workers.append(worker, paused=worker.id in self._paused_ids)
+            self._dispatch()
+            return True
+        return False
+
     async def drain(self) -> List[WorkerInfo]:
         """Drain all workers on shutdown."""
-        async with self._cv:
-            workers = list(self._all_workers.values())
-            self._all_workers.clear()
-            self._idle_workers.clear()
-            self._provisioning_count = 0
-            self._cv.notify_all()
-            return workers
+        workers = list(self._all_workers.values())
+        self._all_workers.clear()
+        self._idle_workers.clear()
+        self._partial_workers.clear()
+        self._busy_since.clear()
+        self._evicted_slots.clear()
+        self._in_flight = 0
+        self._provisioning_count = 0
+        self._dispatch()
+        return workers
 
     @property
     def stats(self) -> dict:
         """Pool statistics."""
         total_workers = len(self._all_workers)
         idle_workers = len(self._idle_workers)
-        return {
+        stats = {
             "function_name": self.function_name,
             "total_workers": total_workers,
             "idle": idle_workers,
             "busy": max(0, total_workers - idle_workers),
+            "in_flight": self._in_flight,
+            "per_worker_concurrency": self.per_worker_concurrency,
+            "selection_policy": self.selection_policy,
             "provisioning": self._provisioning_count,
+            "waiting": self._waiting,
             "max_capacity": self.max_capacity,
             "min_capacity": self.min_capacity,
+            "concurrency_limit": self._concurrency_limit(),
+            "reserved_interactive": self.reserved_interactive,
             "acquire_timeout": self.acquire_timeout,
+            "acquired": self._acquired,
+            "cold_starts": self._cold_starts,
+            "cold_start_pct": (
+                round(100.0 * self._cold_starts / self._acquired, 2) if self._acquired else 0.0
+            ),
+            "affinity_hits": self._affinity_hits,
+            "affinity_misses": self._affinity_misses,
+            "recycled": self._recycled,
+            "unhealthy_evicted": self._unhealthy,
         }
+        if self.forecaster is not None:
+            stats["forecast"] = self.forecaster.stats
+        if self.burst is not None:
+            stats["burst"] = self.burst.stats
+        return stats
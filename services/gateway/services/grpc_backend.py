@@ -13,6 +13,7 @@ from services.gateway.core.exceptions import (
     OrchestratorTimeoutError,
     OrchestratorUnreachableError,
 )
+from services.gateway.core.readiness import create_readiness_prober, function_readiness_timeout
 from services.gateway.pb import agent_pb2, agent_pb2_grpc
 from services.gateway.services.function_registry import FunctionRegistry
 from services.gateway.services.grpc_channel import create_agent_channel
@@ -37,6 +38,7 @@ class GrpcBackend:
         self.stub = agent_pb2_grpc.AgentServiceStub(self.channel)
         self.function_registry = function_registry
         self.concurrency_manager = concurrency_manager
+        self.readiness = create_readiness_prober(config)
         if owner_id:
             self.owner_id = owner_id
         elif config:
@@ -70,30 +72,14 @@ class GrpcBackend:
             raise
 
     async def _wait_for_readiness(
-        self, function_name: str, host: str, port: int, timeout: float = 10.0
+        self, function_name: str, host: str, port: int, timeout: Optional[float] = None
     ):
-        """Confirm readiness by attempting to establish a TCP connection."""
-        import asyncio
-        import time
-
-        start_time = time.time()
-        last_error = None
-        while time.time() - start_time < timeout:
-            try:
-                # Check TCP connectivity with asyncio.open_connection.
-                _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=1.0)
-                writer.close()
-                await writer.wait_closed()
-                return
-            except (asyncio.TimeoutError, ConnectionRefusedError, OSError) as e:
-                last_error = e
-                await asyncio.sleep(0.1)
-
-        raise ContainerStartError(
-            function_name,
-            last_error
-            or Exception(f"Port {port} on {host} did not become ready within {timeout}s"),
-        )
+        """Wait until the container serves (per-function timeout, then the global one)."""
+        if timeout is None and self.function_registry:
+            timeout = function_readiness_timeout(
+                self.function_registry.get_function_config(function_name)
+            )
+        await self.readiness.wait(function_name, host, port, timeout=timeout)
 
     async def _ensure_container(self, function_name: str) -> WorkerInfo:
         # Get environment variables from FunctionRegistry
@@ -1,8 +1,12 @@
 import logging
 import os
-from typing import Any, List
+from typing import Any, Dict, List
+
+from grpc import StatusCode
+from grpc.aio import AioRpcError
 
 from services.common.models.internal import ContainerMetrics, WorkerInfo
+from services.gateway.core.readiness import ReadinessProber, function_readiness_timeout
 from services.gateway.pb import agent_pb2  # type: ignore
 
 logger = logging.getLogger("gateway.grpc_provision")
@@ -20,11 +24,15 @@ class GrpcProvisionClient:
         function_registry: Any,
         skip_readiness_check: bool = False,
         owner_id: str | None = None,
+        readiness: ReadinessProber | None = None,
     ):
         self.stub = stub
         self.function_registry = function_registry
         self.skip_readiness_check = bool(skip_readiness_check)
+        self.readiness = readiness or ReadinessProber()
         self._owner_id = owner_id
+        # Cleared once the Agent answers UNIMPLEMENTED for EnsureContainers.
+        self._batch_supported = True
 
     def _get_owner_id(self) -> str:
         if self._owner_id:
@@ -36,8 +44,14 @@ class GrpcProvisionClient:
             raise ValueError("GATEWAY_OWNER_ID is required")
         return owner_id
 
-    async def provision(self, function_name: str) -> List[WorkerInfo]:
-        """Provision a container via gRPC Agent and return WorkerInfo list"""
+    async def provision(self, function_name: str, count: int = 1) -> List[WorkerInfo]:
+        """
+        Provision `count` containers via gRPC Agent and return WorkerInfo list.
+
+        More than one container is requested in a single EnsureContainers call; an
+        Agent without it gets parallel EnsureContainer calls instead. On partial
+        failure the containers that started are returned.
+        """
         func_config = self.function_registry.get_function_config(function_name)
 
         logger.info(f"Provisioning via gRPC Agent: {function_name}")
@@ -123,19 +137,10 @@ class GrpcProvisionClient:
         )
 
         try:
+            if count > 1:
+                return await self._provision_many(function_name, req, count)
             resp = await self.stub.EnsureContainer(req)
-            import time
-
-            now = time.time()
-            worker = WorkerInfo(
-                id=resp.id,
-                name=resp.name,
-                ip_address=resp.ip_address,
-                port=resp.port or 8080,
-                function_name=function_name,
-                created_at=now,
-                last_used_at=now,
-            )
+            worker = self._to_worker(function_name, resp)
 
             # Readiness Check: Wait for port 8080 to be available
             if not self.skip_readiness_check:
@@ -151,32 +156,90 @@ class GrpcProvisionClient:
                 logger.error(f"Failed to provision via Agent: {e}")
             raise
 
-    async def _wait_for_readiness(
-        self, function_name: str, host: str, port: int, timeout: float = 10.0
-    ):
-        """Confirm readiness by attempting to establish a TCP connection."""
-        import asyncio
+    @staticmethod
+    def _to_worker(function_name: str, resp: Any) -> WorkerInfo:
         import time
 
-        from services.gateway.core.exceptions import ContainerStartError
+        now = time.time()
+        return WorkerInfo(
+            id=resp.id,
+            name=resp.name,
+            ip_address=resp.ip_address,
+            port=resp.port or 8080,
+            function_name=function_name,
+            created_at=now,
+            last_used_at=now,
+        )
 
-        start_time = time.time()
-        last_error = None
-        while time.time() - start_time < timeout:
+    async def _provision_many(self, function_name: str, req: Any, count: int) -> List[WorkerInfo]:
+        """Start `count` containers in one round trip and wait for all of them."""
+        import asyncio
+
+        responses: List[Any] = []
+        errors: List[BaseException] = []
+        if self._batch_supported:
+            batch_req = agent_pb2.EnsureContainersRequest(  # type: ignore[attr-defined]
+                template=req, count=count
+            )
             try:
-                _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=1.0)
-                writer.close()
-                await writer.wait_closed()
-                return
-            except (asyncio.TimeoutError, ConnectionRefusedError, OSError) as e:
-                last_error = e
-                await asyncio.sleep(0.1)
-
-        raise ContainerStartError(
-            function_name,
-            last_error
-            or Exception(f"Port {port} on {host} did not become ready within {timeout}s"),
-        )
+                responses = list((await self.stub.EnsureContainers(batch_req)).workers)
+            except AioRpcError as e:
+                if e.code() != StatusCode.UNIMPLEMENTED:
+                    raise
+                logger.warning("Agent does not implement EnsureContainers; using single calls")
+                self._batch_supported = False
+        if not self._batch_supported:
+            results = await asyncio.gather(
+                *(self.stub.EnsureContainer(req) for _ in range(count)), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    errors.append(result)
+                else:
+                    responses.append(result)
+            if not responses:
+                raise errors[0]
+
+        workers = [self._to_worker(function_name, resp) for resp in responses]
+        if not self.skip_readiness_check:
+            ready = await asyncio.gather(
+                *(self._wait_for_readiness(function_name, w.ip_address, w.port) for w in workers),
+                return_exceptions=True,
+            )
+            failed = [
+                w for w, r in zip(workers, ready, strict=True) if isinstance(r, BaseException)
+            ]
+            errors.extend(r for r in ready if isinstance(r, BaseException))
+            if failed:
+                # Not handed out: delete now rather than waiting for orphan reconciliation.
+                await asyncio.gather(
+                    *(self.delete_container(w.id) for w in failed), return_exceptions=True
+                )
+                failed_ids = {w.id for w in failed}
+                workers = [w for w in workers if w.id not in failed_ids]
+            if not workers:
+                raise errors[0]
+        if len(workers) < count:
+            logger.warning(
+                f"Provisioned {len(workers)} of {count} containers for {function_name}"
+                + (f": {errors[0]}" if errors else "")
+            )
+        return workers
+
+    async def _wait_for_readiness(
+        self,
+        function_name: str,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        observe: bool = True,
+    ):
+        """Wait until the container serves (per-function timeout, then the global one)."""
+        if timeout is None:
+            timeout = function_readiness_timeout(
+                self.function_registry.get_function_config(function_name)
+            )
+        await self.readiness.wait(function_name, host, port, timeout=timeout, observe=observe)
 
     async def delete_container(self, container_id: str):
         """Delete a container via gRPC Agent"""
@@ -220,6 +283,26 @@ class GrpcProvisionClient:
             logger.error(f"Failed to resume container {worker.id} via Agent: {e}")
             raise
 
+    async def probe_container(
+        self, function_name: str, worker: WorkerInfo, timeout: float = 2.0
+    ) -> bool:
+        """Check that a (re-adopted) container still accepts connections."""
+        if self.skip_readiness_check:
+            # Containers are only reachable through the Agent; trust ListContainers.
+            return True
+        try:
+            await self._wait_for_readiness(
+                function_name,
+                worker.ip_address,
+                worker.port or 8080,
+                timeout=timeout,
+                observe=False,
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Container {worker.id} for {function_name} failed probe: {e}")
+            return False
+
     async def list_containers(self) -> List[WorkerInfo]:
         """List all containers via gRPC Agent"""
         req = agent_pb2.ListContainersRequest(  # type: ignore[attr-defined]
@@ -243,6 +326,18 @@ class GrpcProvisionClient:
             logger.error(f"Failed to list containers via Agent: {e}")
             return []
 
+    async def container_states(self) -> Dict[str, str] | None:
+        """Runtime status per container id (RUNNING, PAUSED, ...); None if unavailable."""
+        req = agent_pb2.ListContainersRequest(  # type: ignore[attr-defined]
+            owner_id=self._get_owner_id()
+        )
+        try:
+            resp = await self.stub.ListContainers(req)
+        except Exception as e:
+            logger.warning(f"Failed to list container states via Agent: {e}")
+            return None
+        return {c.container_id: c.status for c in resp.containers}
+
     async def get_container_metrics(self, container_id: str) -> ContainerMetrics:
         """Get container metrics via gRPC Agent"""
         req = agent_pb2.GetContainerMetricsRequest(  # type: ignore[attr-defined]
@@ -0,0 +1,76 @@
+"""
+IdleHealthChecker - Finds idle workers whose container died
+
+A container that dies while idle would otherwise only be noticed by the next
+request routed to it (connect error, eviction and a cold-start retry on the
+user's latency). This loop checks idle workers at a low rate, evicts the dead
+ones and tops pools back up to min_capacity.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+    from .pool_manager import PoolManager
+
+logger = logging.getLogger("gateway.idle_health")
+
+
+class IdleHealthChecker:
+    """
+    Background loop around PoolManager.check_idle_health().
+
+    Workers released within the last interval are not probed (the invocation
+    just proved them healthy); the Agent's container status still covers them.
+    """
+
+    def __init__(
+        self,
+        pool_manager: "PoolManager",
+        interval: float = 15.0,
+        probe_timeout: float = 1.0,
+    ):
+        self.pool_manager = pool_manager
+        self.interval = float(interval)
+        self.probe_timeout = float(probe_timeout)
+        self._task: asyncio.Task | None = None
+        self.checks = 0
+        self.evicted = 0
+
+    async def start(self) -> None:
+        """Start the check loop (the first check runs after one interval)."""
+        self._task = asyncio.create_task(self._loop())
+        logger.info(f"Idle health checker started (interval: {self.interval}s)")
+
+    async def stop(self) -> None:
+        """Stop the check loop."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Idle health checker stopped")
+
+    async def _loop(self) -> None:
+        """Periodic execution loop."""
+        while True:
+            try:
+                await asyncio.sleep(self.interval)
+                await self.run_once()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Idle health check failed: {e}")
+
+    async def run_once(self) -> Dict[str, int]:
+        """Check all idle workers once. Returns {function_name: evicted}."""
+        evicted = await self.pool_manager.check_idle_health(
+            probe_timeout=self.probe_timeout, quiet_seconds=self.interval
+        )
+        self.checks += 1
+        for function_name, count in evicted.items():
+            self.evicted += count
+            logger.warning(f"Evicted {count} dead idle workers of {function_name}")
+        return evicted
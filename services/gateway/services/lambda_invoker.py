@@ -9,7 +9,7 @@ import base64
 import json
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Protocol
+from typing import TYPE_CHECKING, Dict, List, Optional, Protocol
 
 import httpx
 from grpc import StatusCode
@@ -20,10 +20,18 @@ from services.common.models.internal import WorkerInfo
 from services.gateway.config import GatewayConfig
 from services.gateway.core.circuit_breaker import CircuitBreaker
 from services.gateway.core.exceptions import ContainerStartError
+from services.gateway.core.invocation_context import (
+    InvocationPriority,
+    get_invocation_priority,
+    invocation_priority,
+)
 from services.gateway.models.result import InvocationResult
 from services.gateway.services.agent_invoke import AgentInvokeClient
 from services.gateway.services.function_registry import FunctionRegistry
 
+if TYPE_CHECKING:
+    from services.gateway.services.cluster import ClusterRouter
+
 logger = logging.getLogger("gateway.lambda_invoker")
 
 
@@ -68,6 +76,7 @@ class LambdaInvoker:
         config: GatewayConfig,
         backend: InvocationBackend,
         agent_invoker: Optional[AgentInvokeClient] = None,
+        cluster: Optional["ClusterRouter"] = None,
     ):
         """
         Args:
@@ -75,21 +84,38 @@ class LambdaInvoker:
             registry: FunctionRegistry instance
             config: GatewayConfig instance
             backend: InvocationBackend implementing Strategy
+            cluster: forwards invocations of functions owned by another replica
         """
         self.client = client
         self.registry = registry
         self.config = config
         self.backend = backend
         self.agent_invoker = agent_invoker
+        self.cluster = cluster
         # Store per-function breakers.
         self.breakers: Dict[str, CircuitBreaker] = {}
 
     async def invoke_function(
-        self, function_name: str, payload: bytes, timeout: int | float = 300
+        self,
+        function_name: str,
+        payload: bytes,
+        timeout: int | float = 300,
+        priority: InvocationPriority = InvocationPriority.INTERACTIVE,
+        forwarded: bool = False,
     ) -> InvocationResult:
         """
         Invoke the specified Lambda using the composed method pattern.
+
+        `priority` orders this invocation against other waiters of the same pool.
+        `forwarded` marks an invocation received from another gateway replica; it
+        always runs locally.
         """
+        with invocation_priority(priority):
+            return await self._invoke_function(function_name, payload, timeout, forwarded)
+
+    async def _invoke_function(
+        self, function_name: str, payload: bytes, timeout: int | float, forwarded: bool = False
+    ) -> InvocationResult:
         func_entity = self.registry.get_function_config(function_name)
         if not func_entity:
             # Fallback for 404
@@ -97,6 +123,18 @@ class LambdaInvoker:
                 success=False, status_code=404, error=f"Function {function_name} not found"
             )
 
+        # 0. Cluster mode: run on the replica that owns the function's pool.
+        if self.cluster is not None and not forwarded and not self.cluster.owns(function_name):
+            result = await self.cluster.forward(
+                function_name,
+                payload,
+                self._prepare_headers(get_trace_id()),
+                timeout,
+                priority=get_invocation_priority(),
+            )
+            if result is not None:
+                return result
+
         breaker = self._get_breaker(function_name)
         trace_id = get_trace_id()
         worker: Optional[WorkerInfo] = None
@@ -145,6 +183,8 @@ class LambdaInvoker:
         """Acquire a worker from the backend."""
         try:
             return await self.backend.acquire_worker(function_name)
+        except ContainerStartError:
+            raise
         except Exception as e:
             raise ContainerStartError(function_name, e) from e
 
@@ -0,0 +1,450 @@
+"""
+Pool coordinator - Node-wide capacity ledger shared by uvicorn worker processes
+
+Every worker process runs its own PoolManager. With POOL_COORDINATOR_SOCKET set,
+they all connect to one coordinator process (started by entrypoint.sh) over a
+Unix socket, which keeps:
+
+- the container count per function across processes (max_capacity is node-wide)
+- which process owns which container (so reconciliation in one process does not
+  delete another process's workers, and startup cleanup runs once per node)
+- idle worker hand-over: a process about to cold start asks the coordinator,
+  which asks the owners of that function's containers to donate an idle one.
+  Donation is two-phase: the donor sets the worker aside ("donate") and only
+  gives it up on "commit"; on "abort" or without an answer it takes it back
+- startup ordering: the first process runs startup cleanup, the others wait
+  until it reports "cleanup_done" before provisioning
+
+Acquire/release of local idle workers never touches the socket; only the cold
+path (provision, delete, reconcile) does.
+
+Protocol: newline-delimited JSON. Requests carry "id" and "op"; responses carry
+"re" (the request id) and the result fields. Both sides may send requests (the
+coordinator sends "donate" to worker processes).
+
+Run: python -m services.gateway.services.pool_coordinator <socket path>
+"""
+
+import asyncio
+import dataclasses
+import itertools
+import json
+import logging
+import os
+import sys
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, Set
+
+from services.common.models.internal import WorkerInfo
+
+logger = logging.getLogger("gateway.pool_coordinator")
+
+# Donate callback of a worker process: give up one idle worker of a function.
+DonateCallback = Callable[[str], Awaitable[Optional[WorkerInfo]]]
+# Restore callback: take back an offered worker whose donation was not committed.
+RestoreCallback = Callable[[str, WorkerInfo], Coroutine[Any, Any, None]]
+
+
+class _Peer:
+    """One JSON-lines connection (either side); matches responses to requests."""
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        handler: Callable[["_Peer", Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    ):
+        self.reader = reader
+        self.writer = writer
+        self.handler = handler
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def request(self, op: str, timeout: float = 5.0, **fields: Any) -> Dict[str, Any]:
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self._send({"id": request_id, "op": op, **fields})
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        self.writer.write(json.dumps(message).encode() + b"\n")
+
+    async def _handle(self, message: Dict[str, Any]) -> None:
+        try:
+            result = await self.handler(self, message)
+        except Exception as e:
+            logger.error(f"Coordinator op {message.get('op')} failed: {e}")
+            result = {"error": str(e)}
+        if not self.writer.is_closing():
+            self._send({"re": message["id"], **result})
+
+    async def serve(self) -> None:
+        """Read messages until the connection closes."""
+        try:
+            while line := await self.reader.readline():
+                message = json.loads(line)
+                if "re" in message:
+                    future = self._pending.get(message["re"])
+                    if future is not None and not future.done():
+                        future.set_result(message)
+                    continue
+                task = asyncio.create_task(self._handle(message))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        finally:
+            error = ConnectionError("Pool coordinator connection closed")
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            for task in list(self._tasks):
+                task.cancel()
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class PoolCoordinatorServer:
+    """Capacity/ownership ledger for all worker processes on this node."""
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self._server: Optional[asyncio.AbstractServer] = None
+        # function -> containers + reservations across all processes
+        self._usage: Dict[str, int] = {}
+        # container id -> (function, owning peer)
+        self._owners: Dict[str, tuple] = {}
+        # peer -> {function: reservations}
+        self._reservations: Dict[_Peer, Dict[str, int]] = {}
+        self._cleanup_claimed: Optional[_Peer] = None
+        self._cleanup_done = asyncio.Event()
+        self.transfers = 0
+
+    async def start(self) -> None:
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._server = await asyncio.start_unix_server(self._on_connect, path=self.socket_path)
+        logger.info(f"Pool coordinator listening on {self.socket_path}")
+
+    async def stop(self) -> None:
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        for peer in list(self._reservations):
+            peer.close()
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _on_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        peer = _Peer(reader, writer, self._dispatch)
+        self._reservations[peer] = {}
+        try:
+            await peer.serve()
+        except (ConnectionError, json.JSONDecodeError) as e:
+            logger.warning(f"Dropping coordinator client: {e}")
+        finally:
+            self._forget(peer)
+            peer.close()
+
+    def _forget(self, peer: _Peer) -> None:
+        """A process went away: its reservations and containers stop counting."""
+        if peer is self._cleanup_claimed and not self._cleanup_done.is_set():
+            logger.warning("Startup cleanup owner went away before finishing")
+            self._cleanup_done.set()
+        for function_name, count in self._reservations.pop(peer, {}).items():
+            self._adjust(function_name, -count)
+        for container_id, (function_name, owner) in list(self._owners.items()):
+            if owner is peer:
+                del self._owners[container_id]
+                self._adjust(function_name, -1)
+
+    def _adjust(self, function_name: str, delta: int) -> None:
+        count = self._usage.get(function_name, 0) + delta
+        if count > 0:
+            self._usage[function_name] = count
+        else:
+            self._usage.pop(function_name, None)
+
+    def _unreserve(self, peer: _Peer, function_name: str) -> None:
+        reservations = self._reservations.get(peer, {})
+        if reservations.get(function_name, 0) > 0:
+            reservations[function_name] -= 1
+            self._adjust(function_name, -1)
+
+    async def _dispatch(self, peer: _Peer, message: Dict[str, Any]) -> Dict[str, Any]:
+        op = message.get("op")
+        function_name = message.get("function_name", "")
+
+        if op == "hello":
+            claimed = self._cleanup_claimed is None
+            if claimed:
+                self._cleanup_claimed = peer
+            return {"startup_cleanup": claimed}
+
+        if op == "cleanup_done":
+            self._cleanup_done.set()
+            return {}
+
+        if op == "wait_cleanup":
+            await self._cleanup_done.wait()
+            return {"done": True}
+
+        if op == "reserve":
+            limit = int(message.get("limit", 1))
+            if self._usage.get(function_name, 0) >= limit:
+                return {"ok": False}
+            self._adjust(function_name, 1)
+            reservations = self._reservations.setdefault(peer, {})
+            reservations[function_name] = reservations.get(function_name, 0) + 1
+            return {"ok": True}
+
+        if op == "unreserve":
+            self._unreserve(peer, function_name)
+            return {}
+
+        if op == "register":
+            # Reservation becomes an owned container.
+            worker_id = message["worker_id"]
+            reservations = self._reservations.get(peer, {})
+            if reservations.get(function_name, 0) > 0:
+                reservations[function_name] -= 1
+            else:
+                self._adjust(function_name, 1)
+            self._owners[worker_id] = (function_name, peer)
+            return {}
+
+        if op == "unregister":
+            owner = self._owners.pop(message["worker_id"], None)
+            if owner is not None:
+                self._adjust(owner[0], -1)
+            return {}
+
+        if op == "steal":
+            return {"worker": await self._steal(peer, function_name)}
+
+        if op == "owned":
+            return {"ids": list(self._owners)}
+
+        if op == "stats":
+            return {
+                "usage": dict(self._usage),
+                "containers": len(self._owners),
+                "processes": len(self._reservations),
+                "transfers": self.transfers,
+            }
+
+        return {"error": f"unknown op {op}"}
+
+    async def _steal(self, thief: _Peer, function_name: str) -> Optional[Dict[str, Any]]:
+        """Ask other owners of the function for an idle worker; move it to `thief`."""
+        donors = []
+        for fname, owner in self._owners.values():
+            if fname == function_name and owner is not thief and owner not in donors:
+                donors.append(owner)
+        for donor in donors:
+            try:
+                reply = await donor.request("donate", timeout=1.0, function_name=function_name)
+                worker = reply.get("worker")
+                if not worker:
+                    continue
+                if worker.get("id") not in self._owners:
+                    await donor.request("abort", timeout=1.0, worker_id=worker.get("id"))
+                    continue
+                # The donor only gives the worker up now; a late or missing
+                # commit makes it take the worker back.
+                ack = await donor.request("commit", timeout=1.0, worker_id=worker["id"])
+            except (ConnectionError, asyncio.TimeoutError):
+                continue
+            if ack.get("ok"):
+                self._owners[worker["id"]] = (function_name, thief)
+                self.transfers += 1
+                return worker
+        return None
+
+
+class PoolCoordinatorClient:
+    """
+    Worker-process side of the coordinator.
+
+    If the coordinator is unreachable, every call degrades to process-local
+    behaviour (reserve succeeds, nothing is owned elsewhere, cleanup runs).
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        connect_timeout: float = 5.0,
+        offer_timeout: float = 5.0,
+        cleanup_wait_timeout: float = 120.0,
+    ):
+        self.socket_path = socket_path
+        self.connect_timeout = float(connect_timeout)
+        self.offer_timeout = float(offer_timeout)
+        self.cleanup_wait_timeout = float(cleanup_wait_timeout)
+        self.on_donate: Optional[DonateCallback] = None
+        self.on_restore: Optional[RestoreCallback] = None
+        self._peer: Optional[_Peer] = None
+        self._task: Optional[asyncio.Task] = None
+        # worker id -> (function, worker, expiry) of uncommitted donations
+        self._offers: Dict[str, tuple] = {}
+        self._restoring: Set[asyncio.Task] = set()
+        self.startup_cleanup = True
+
+    @property
+    def connected(self) -> bool:
+        return self._peer is not None
+
+    async def connect(self) -> bool:
+        """Connect (retrying while the coordinator starts up) and say hello."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.connect_timeout
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.socket_path)
+                break
+            except OSError as e:
+                if loop.time() >= deadline:
+                    logger.warning(
+                        f"Pool coordinator unreachable at {self.socket_path} ({e}); "
+                        "using a process-local pool ledger"
+                    )
+                    return False
+                await asyncio.sleep(0.1)
+
+        peer = _Peer(reader, writer, self._handle)
+        self._peer = peer
+        self._task = asyncio.create_task(self._serve(peer))
+        reply = await self._call("hello", pid=os.getpid())
+        self.startup_cleanup = bool(reply.get("startup_cleanup", True))
+        logger.info(f"Connected to pool coordinator at {self.socket_path}")
+        return True
+
+    async def close(self) -> None:
+        if self._peer:
+            self._peer.close()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._peer = None
+
+    async def _serve(self, peer: _Peer) -> None:
+        try:
+            await peer.serve()
+        except (ConnectionError, json.JSONDecodeError) as e:
+            logger.error(f"Pool coordinator connection failed: {e}")
+        finally:
+            if self._peer is peer:
+                logger.warning("Lost pool coordinator; falling back to a process-local ledger")
+                self._peer = None
+            for worker_id in list(self._offers):
+                self._restore(worker_id)
+
+    async def _handle(self, peer: _Peer, message: Dict[str, Any]) -> Dict[str, Any]:
+        op = message.get("op")
+        if op == "donate" and self.on_donate is not None:
+            function_name = message["function_name"]
+            worker = await self.on_donate(function_name)
+            if worker is None:
+                return {"worker": None}
+            expiry = asyncio.get_running_loop().call_later(
+                self.offer_timeout, self._restore, worker.id
+            )
+            self._offers[worker.id] = (function_name, worker, expiry)
+            return {"worker": dataclasses.asdict(worker)}
+        if op == "commit":
+            offer = self._offers.pop(message.get("worker_id", ""), None)
+            if offer is None:
+                # Already taken back after the offer expired.
+                return {"ok": False}
+            offer[2].cancel()
+            return {"ok": True}
+        if op == "abort":
+            self._restore(message.get("worker_id", ""))
+            return {}
+        return {"worker": None}
+
+    def _restore(self, worker_id: str) -> None:
+        """Take back an offered worker whose donation was not committed."""
+        offer = self._offers.pop(worker_id, None)
+        if offer is None:
+            return
+        function_name, worker, expiry = offer
+        expiry.cancel()
+        if self.on_restore is None:
+            return
+        logger.info(f"Donation of worker {worker_id} was not committed; taking it back")
+        task = asyncio.create_task(self.on_restore(function_name, worker))
+        self._restoring.add(task)
+        task.add_done_callback(self._restoring.discard)
+
+    async def _call(self, op: str, **fields: Any) -> Dict[str, Any]:
+        peer = self._peer
+        if peer is None:
+            return {}
+        try:
+            return await peer.request(op, **fields)
+        except (ConnectionError, asyncio.TimeoutError) as e:
+            logger.error(f"Pool coordinator {op} failed: {e}")
+            return {}
+
+    async def reserve(self, function_name: str, limit: int) -> bool:
+        """Reserve one container of node-wide capacity."""
+        if self._peer is None:
+            return True
+        reply = await self._call("reserve", function_name=function_name, limit=limit)
+        return bool(reply.get("ok", True))
+
+    async def unreserve(self, function_name: str) -> None:
+        await self._call("unreserve", function_name=function_name)
+
+    async def register(self, function_name: str, worker: WorkerInfo) -> None:
+        await self._call("register", function_name=function_name, worker_id=worker.id)
+
+    async def unregister(self, worker_id: str) -> None:
+        await self._call("unregister", worker_id=worker_id)
+
+    async def cleanup_done(self) -> None:
+        """Report that startup cleanup finished (claiming process only)."""
+        await self._call("cleanup_done")
+
+    async def wait_for_cleanup(self) -> None:
+        """Wait until the claiming process has finished startup cleanup."""
+        reply = await self._call("wait_cleanup", timeout=self.cleanup_wait_timeout)
+        if self._peer is not None and not reply.get("done"):
+            logger.warning("Startup cleanup did not finish in time; continuing anyway")
+
+    async def steal(self, function_name: str) -> Optional[WorkerInfo]:
+        """Take over an idle worker of another process, if any."""
+        reply = await self._call("steal", function_name=function_name)
+        worker = reply.get("worker")
+        return WorkerInfo(**worker) if worker else None
+
+    async def owned_ids(self) -> Optional[Set[str]]:
+        """Container ids owned by any connected process (None if unknown)."""
+        reply = await self._call("owned")
+        if "ids" not in reply:
+            return None
+        return set(reply["ids"])
+
+    async def stats(self) -> Dict[str, Any]:
+        return await self._call("stats")
+
+
+def main(argv: List[str]) -> None:
+    logging.basicConfig(level=logging.INFO)
+    socket_path = argv[1] if len(argv) > 1 else os.environ["POOL_COORDINATOR_SOCKET"]
+    asyncio.run(PoolCoordinatorServer(socket_path).serve_forever())
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -7,13 +7,32 @@ capacity management.
 """
 
 import asyncio
+import contextlib
+import functools
 import logging
+import math
+import time
 from typing import Any, Callable, Dict, List, Optional, Set
 
 from services.common.models.internal import WorkerInfo
+from services.gateway.core.adaptive_limiter import create_adaptive_limiter
+from services.gateway.core.burst_control import BurstController
+from services.gateway.core.container_budget import BudgetCandidate, ContainerBudget
+from services.gateway.core.demand_forecast import DemandForecaster
+from services.gateway.core.exceptions import ContainerBudgetExceededError, ContainerStartError
+from services.gateway.core.invocation_context import (
+    get_invocation_affinity,
+    get_invocation_priority,
+)
+from services.gateway.core.provision_scheduler import ProvisionScheduler
+from services.gateway.core.timer_wheel import TimerWheel
 from services.gateway.models.function import FunctionEntity
 
+from .agent_health import AgentConnectivityMonitor
+from .container_lifecycle import ContainerLifecycleExecutor
 from .container_pool import ContainerPool
+from .pool_coordinator import PoolCoordinatorClient
+from .pool_snapshot import load_pool_snapshot, worker_from_snapshot
 
 logger = logging.getLogger("gateway.pool_manager")
 
@@ -32,16 +51,80 @@ class PoolManager:
         config_loader: Callable[[str], Optional[FunctionEntity]],
         pause_enabled: bool = False,
         pause_idle_seconds: float = 0.0,
+        priority_aging_seconds: float = 10.0,
+        agent_monitor: Optional[AgentConnectivityMonitor] = None,
+        warm_parallelism: int = 2,
+        forecast_window_seconds: float = 5.0,
+        forecast_horizon_seconds: float = 10.0,
+        budget: Optional[ContainerBudget] = None,
+        coordinator: Optional[PoolCoordinatorClient] = None,
+        lifecycle: Optional[ContainerLifecycleExecutor] = None,
+        idle_timeout_seconds: float = 0.0,
+        timers: Optional[TimerWheel] = None,
+        provision_scheduler: Optional[ProvisionScheduler] = None,
+        provision_batch_size: int = 1,
+        speculative_resume_linger: float = 10.0,
+        warmer: Optional[Any] = None,
     ):
         """
         Args:
             provision_client: client that sends provision requests to the Manager
             config_loader: callback to fetch config by function name (returns FunctionEntity)
+            priority_aging_seconds: wait time that promotes a waiter by one priority class
+            agent_monitor: Agent connectivity tracker; provisioning fails fast while down
+            warm_parallelism: max concurrent provisions for warm-up / min_capacity
+            forecast_window_seconds: aggregation window of the per-function demand forecaster
+            forecast_horizon_seconds: how far ahead scale_ahead() provisions (~cold start time)
+            budget: gateway-wide container/memory budget (idle workers of other
+                functions are reclaimed when it is full)
+            coordinator: node-wide ledger shared with the other worker processes
+            lifecycle: executor for destroy/pause/resume calls (bounded parallelism,
+                deduplication and retries); a default one is created if omitted
+            idle_timeout_seconds: delete a worker this long after its last release
+                (per-worker deadline; 0 leaves pruning to the Janitor scan only)
+            timers: timer wheel for per-worker pause/prune deadlines
+            provision_scheduler: gateway-wide cap and fair ordering of provisions
+                (warm-up is served after demand-driven provisions)
+            provision_batch_size: containers warm-up / scale-ahead request per provision
+                call (1 = one call per container)
+            speculative_resume_linger: with pause enabled, paused idle workers are
+                resumed ahead of demand and paused again if unused for this long
+                (0 = resume only on acquire)
+            warmer: sends the function's warm-up event to proactively provisioned
+                workers before they join the idle set (WorkerWarmer)
         """
         self._pools: Dict[str, ContainerPool] = {}
         self._lock = asyncio.Lock()
         self.provision_client = provision_client
         self.config_loader = config_loader
+        self.warmer = warmer
+        self.agent_monitor = agent_monitor
+        self.lifecycle = lifecycle or ContainerLifecycleExecutor(provision_client)
+        self.budget = budget if budget is not None and budget.enabled else None
+        # Budget-evicted containers still being deleted: worker id -> memory (MB).
+        self._reclaiming: Dict[str, int] = {}
+        self.coordinator = coordinator
+        if coordinator is not None:
+            coordinator.on_donate = self._donate_idle_worker
+            coordinator.on_restore = self._restore_donated_worker
+        try:
+            warm_parallel_value = max(1, int(warm_parallelism))
+        except (TypeError, ValueError):
+            warm_parallel_value = 2
+        self._warm_semaphore = asyncio.Semaphore(warm_parallel_value)
+        try:
+            self.provision_batch_size = max(1, int(provision_batch_size))
+        except (TypeError, ValueError):
+            self.provision_batch_size = 1
+        try:
+            self.forecast_window_seconds = float(forecast_window_seconds)
+            self.forecast_horizon_seconds = float(forecast_horizon_seconds)
+        except (TypeError, ValueError):
+            self.forecast_window_seconds, self.forecast_horizon_seconds = 5.0, 10.0
+        try:
+            self.priority_aging_seconds = float(priority_aging_seconds)
+        except (TypeError, ValueError):
+            self.priority_aging_seconds = 10.0
         try:
             pause_idle_value = float(pause_idle_seconds)
         except (TypeError, ValueError):
@@ -49,9 +132,29 @@ class PoolManager:
 
         self.pause_enabled = bool(pause_enabled) and pause_idle_value > 0
         self.pause_idle_seconds = pause_idle_value
-        self._pause_tasks: Dict[str, asyncio.Task] = {}
+        try:
+            self.idle_timeout_seconds = max(0.0, float(idle_timeout_seconds))
+        except (TypeError, ValueError):
+            self.idle_timeout_seconds = 0.0
+        # One wheel task for all idle deadlines; keys are ("pause" | "prune", worker id).
+        self.timers = timers or TimerWheel()
+        self.provision_scheduler = provision_scheduler
+        if provision_scheduler is not None:
+            provision_scheduler.weight_of = self.provision_weight
+        self._pausing: Dict[str, asyncio.Task] = {}
         self._paused_ids: Set[str] = set()
-        self._deleting_ids: Set[str] = set()  # Track IDs in process of deletion
+        self._resume_tasks: Dict[str, asyncio.Task] = {}
+        try:
+            self.speculative_resume_linger = max(0.0, float(speculative_resume_linger))
+        except (TypeError, ValueError):
+            self.speculative_resume_linger = 0.0
+        # Workers resumed ahead of demand and not acquired yet.
+        self._speculative: Set[str] = set()
+        self._resume_counts = {"inline": 0, "speculative": 0, "hits": 0, "repaused": 0}
+        # function name -> next scheduled invocation (epoch seconds); set by the scheduler.
+        self.schedule_lookup: Optional[Callable[[str], Optional[float]]] = None
+        # function name -> served by this gateway replica; set by the cluster router.
+        self.owns: Optional[Callable[[str], bool]] = None
 
         if self.pause_enabled and (
             not hasattr(provision_client, "pause_container")
@@ -73,17 +176,53 @@ class PoolManager:
                         # but usually they must be in registry.
                         logger.warning(f"No config found for {function_name}, using defaults")
                         max_cap, min_cap, acq_to = 1, 0, 30.0
+                        limiter = None
+                        reserved = 0
+                        slots = 1
+                        policy = "mru"
+                        burst = None
+                        idle_timeout = pause_idle = max_age = max_invocations = None
                     else:
                         scaling = func_entity.scaling
                         max_cap = scaling.max_capacity
                         min_cap = scaling.min_capacity
                         acq_to = scaling.acquire_timeout
+                        slots = scaling.per_worker_concurrency
+                        policy = scaling.selection_policy
+                        burst = (
+                            BurstController(scaling.max_concurrent_provisions)
+                            if scaling.burst_control
+                            else None
+                        )
+                        limiter = create_adaptive_limiter(
+                            scaling.adaptive_concurrency, max_cap * slots
+                        )
+                        reserved = scaling.reserved_interactive_capacity
+                        idle_timeout = scaling.idle_timeout
+                        pause_idle = scaling.pause_idle_seconds
+                        max_age = scaling.max_worker_age_seconds
+                        max_invocations = scaling.max_worker_invocations
 
                     self._pools[function_name] = ContainerPool(
                         function_name=function_name,
                         max_capacity=max_cap,
                         min_capacity=min_cap,
                         acquire_timeout=acq_to,
+                        limiter=limiter,
+                        reserved_interactive=reserved,
+                        priority_aging_seconds=self.priority_aging_seconds,
+                        forecaster=DemandForecaster(
+                            window_seconds=self.forecast_window_seconds,
+                            horizon_seconds=self.forecast_horizon_seconds,
+                        ),
+                        per_worker_concurrency=slots,
+                        selection_policy=policy,
+                        burst=burst,
+                        paused_ids=self._paused_ids,
+                        idle_timeout=idle_timeout,
+                        pause_idle_seconds=pause_idle,
+                        max_worker_age=max_age,
+                        max_worker_invocations=max_invocations,
                     )
                     logger.info(
                         f"Created pool for {function_name}: "
@@ -91,55 +230,511 @@ class PoolManager:
                     )
         return self._pools[function_name]
 
-    async def _cancel_pause_task(self, worker_id: str) -> None:
-        task = self._pause_tasks.pop(worker_id, None)
-        if task:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+    async def _cancel_idle_timers(self, worker_id: str) -> None:
+        """Cancel a worker's pause/prune deadlines and let an in-flight pause finish."""
+        self._speculative.discard(worker_id)
+        self.timers.cancel(("pause", worker_id))
+        self.timers.cancel(("prune", worker_id))
+        task = self._pausing.get(worker_id)
+        if task is not None:
+            # Finishing (rather than cancelling) keeps _paused_ids accurate for resume.
+            await asyncio.shield(task)
+
+    def _idle_timeout_of(self, pool: ContainerPool, default: float) -> float:
+        """The pool's scaling.idle_timeout, or `default` (gateway-wide) if unset."""
+        value = getattr(pool, "idle_timeout", None)
+        return float(value) if isinstance(value, (int, float)) else default
+
+    def _pause_idle_of(self, pool: ContainerPool) -> float:
+        """The pool's scaling.pause_idle_seconds (0 = never pause), or PAUSE_IDLE_SECONDS."""
+        value = getattr(pool, "pause_idle_seconds", None)
+        return float(value) if isinstance(value, (int, float)) else self.pause_idle_seconds
 
-    async def _schedule_pause(
+    async def _schedule_idle_timers(
         self, function_name: str, pool: ContainerPool, worker: WorkerInfo
     ) -> None:
-        if not self.pause_enabled:
+        """(Re)arm the worker's idle deadlines; O(1) per release."""
+        pause_after = self._pause_idle_of(pool)
+        if self.pause_enabled:
+            await self._cancel_idle_timers(worker.id)
+            if pause_after > 0:
+                self.timers.schedule(
+                    ("pause", worker.id),
+                    pause_after,
+                    functools.partial(self._start_pause, function_name, pool, worker),
+                )
+        idle_timeout = self._idle_timeout_of(pool, self.idle_timeout_seconds)
+        if idle_timeout > 0:
+            self.timers.schedule(
+                ("prune", worker.id),
+                idle_timeout,
+                functools.partial(self._prune_idle, function_name, pool, worker),
+            )
+
+    def _start_pause(self, function_name: str, pool: ContainerPool, worker: WorkerInfo) -> None:
+        task = asyncio.create_task(self._pause_idle(function_name, pool, worker))
+        self._pausing[worker.id] = task
+        task.add_done_callback(lambda _: self._pausing.pop(worker.id, None))
+
+    async def _pause_idle(
+        self, function_name: str, pool: ContainerPool, worker: WorkerInfo
+    ) -> None:
+        if not self.pause_enabled or worker.id in self._paused_ids:
+            return
+        if not await pool.is_idle(worker.id):
             return
+        try:
+            await self.lifecycle.pause(function_name, worker)
+            self._mark_paused(pool, worker.id, True)
+            if worker.id in self._speculative:
+                self._speculative.discard(worker.id)
+                self._resume_counts["repaused"] += 1
+        except Exception as e:
+            logger.error(f"Failed to pause container {worker.id} for {function_name}: {e}")
+
+    async def _prune_idle(
+        self, function_name: str, pool: ContainerPool, worker: WorkerInfo
+    ) -> None:
+        """Idle deadline reached: delete the worker (min_capacity is kept)."""
+        if pool.idle_count <= 1 and self._keep_warm_for_schedule(
+            function_name, self._idle_timeout_of(pool, self.idle_timeout_seconds)
+        ):
+            return
+        if pool.reclaim_idle(worker.id) is None:
+            return
+        await self._cancel_idle_timers(worker.id)
+        self._paused_ids.discard(worker.id)
+        if await self.lifecycle.destroy(worker.id):
+            logger.info(f"Pruned and deleted idle container: {worker.name}")
+        await self._unregister(worker.id)
 
-        await self._cancel_pause_task(worker.id)
+    def _mark_paused(self, pool: ContainerPool, worker_id: str, paused: bool) -> None:
+        """Track a pause / resume here and in the pool's idle index."""
+        if paused:
+            self._paused_ids.add(worker_id)
+        else:
+            self._paused_ids.discard(worker_id)
+        pool.set_paused(worker_id, paused)
 
-        async def _pause_after_delay() -> None:
-            task_ref = asyncio.current_task()
-            try:
-                await asyncio.sleep(self.pause_idle_seconds)
-                if not self.pause_enabled:
-                    return
+    def _start_resume(
+        self, function_name: str, pool: ContainerPool, worker: WorkerInfo, retry: bool = True
+    ) -> Optional[asyncio.Task]:
+        """
+        The worker's resume task (started if needed); None if it is not paused.
+
+        retry=False resumes with a single Agent call (see ContainerLifecycleExecutor.resume).
+        """
+        task = self._resume_tasks.get(worker.id)
+        if task is None:
+            if worker.id not in self._paused_ids:
+                return None
+
+            async def _resume() -> bool:
+                try:
+                    await self.lifecycle.resume(function_name, worker, retry=retry)
+                    return True
+                except Exception as e:
+                    logger.error(f"Failed to resume container {worker.id} for {function_name}: {e}")
+                    await pool.evict(worker)
+                    return False
+                finally:
+                    self._mark_paused(pool, worker.id, False)
+                    self._resume_tasks.pop(worker.id, None)
+
+            task = asyncio.create_task(_resume())
+            self._resume_tasks[worker.id] = task
+        return task
+
+    async def _ensure_resumed(
+        self, function_name: str, pool: ContainerPool, worker: WorkerInfo, retry: bool = True
+    ) -> bool:
+        """
+        Resume a paused worker (shared by concurrent callers).
+
+        Returns False if resume failed and the worker was evicted.
+        """
+        task = self._start_resume(function_name, pool, worker, retry=retry)
+        if task is None:
+            return True
+        return await asyncio.shield(task)
+
+    def _resume_ahead(self, function_name: str, pool: ContainerPool, at_least: int = 0) -> int:
+        """
+        Resume paused idle workers in the background so the next acquires find
+        running ones: `at_least`, or the forecast concurrency not covered by
+        running workers. Unused ones are paused again after the linger time.
+        Returns the number of resumes started.
+        """
+        if not self.pause_enabled or self.speculative_resume_linger <= 0:
+            return 0
+        paused = [
+            w
+            for w in reversed(pool.get_idle_workers())
+            if w.id in self._paused_ids and w.id not in self._resume_tasks
+        ]
+        if not paused:
+            return 0
+        want = at_least
+        if pool.forecaster is not None:
+            target = math.ceil(pool.forecaster.forecast_concurrency() / pool.per_worker_concurrency)
+            running = pool.busy_count + pool.idle_count - pool.paused_idle_count
+            want = max(want, target - running)
+
+        started = 0
+        for worker in paused[: max(0, want)]:
+            task = self._start_resume(function_name, pool, worker)
+            if task is None:
+                continue
+            self._speculative.add(worker.id)
+            self._resume_counts["speculative"] += 1
+            task.add_done_callback(
+                functools.partial(self._after_speculative_resume, function_name, pool, worker)
+            )
+            started += 1
+        return started
+
+    def _after_speculative_resume(
+        self, function_name: str, pool: ContainerPool, worker: WorkerInfo, task: asyncio.Task
+    ) -> None:
+        """Re-pause the worker after the linger time unless it gets acquired."""
+        if task.cancelled() or not task.result() or worker.id not in self._speculative:
+            self._speculative.discard(worker.id)
+            return
+        self.timers.schedule(
+            ("pause", worker.id),
+            self.speculative_resume_linger,
+            functools.partial(self._start_pause, function_name, pool, worker),
+        )
+
+    async def prewarm_for_schedule(self, function_name: str) -> str:
+        """
+        Make sure a scheduled function has a ready worker before it fires.
+
+        Resumes a paused idle worker if there is one, otherwise provisions one.
+        Returns "warm", "resumed", "provisioned" or "remote" (another replica owns it).
+        """
+        if not self._owned(function_name):
+            return "remote"
+        pool = await self.get_pool(function_name)
+        if pool.idle_count == 0:
+            provisioned = await self.warm_up(function_name, 1)
+            return "provisioned" if provisioned else "warm"
+
+        if self.pause_enabled:
+            for worker in pool.get_idle_workers():
                 if worker.id in self._paused_ids:
-                    return
-                if not await pool.is_idle(worker.id):
-                    return
-                await self.provision_client.pause_container(function_name, worker)
-                self._paused_ids.add(worker.id)
-            except asyncio.CancelledError:
-                return
-            except Exception as e:
-                logger.error(f"Failed to pause container {worker.id} for {function_name}: {e}")
-            finally:
-                if task_ref and self._pause_tasks.get(worker.id) is task_ref:
-                    self._pause_tasks.pop(worker.id, None)
+                    await self._cancel_idle_timers(worker.id)
+                    if await self._ensure_resumed(function_name, pool, worker):
+                        # Pause / prune it again like any idle worker if the run misses it.
+                        await self._schedule_idle_timers(function_name, pool, worker)
+                        return "resumed"
+                    return await self.prewarm_for_schedule(function_name)
+        return "warm"
+
+    def _owned(self, function_name: str) -> bool:
+        """False if another gateway replica serves this function (cluster mode)."""
+        return self.owns is None or self.owns(function_name)
+
+    def _keep_warm_for_schedule(self, function_name: str, idle_timeout: float) -> bool:
+        """True if the next scheduled run is due within idle_timeout."""
+        if self.schedule_lookup is None:
+            return False
+        due_at = self.schedule_lookup(function_name)
+        return due_at is not None and due_at - time.time() <= idle_timeout
 
-        task = asyncio.create_task(_pause_after_delay())
-        self._pause_tasks[worker.id] = task
+    def _memory_of(self, function_name: str) -> int:
+        assert self.budget is not None
+        func_entity = self.config_loader(function_name)
+        return self.budget.memory_of(func_entity.memory_size if func_entity else None)
+
+    def _budget_usage(self) -> tuple[int, int]:
+        """(containers, memory MB) including in-flight provisions and deletions."""
+        containers = len(self._reclaiming)
+        memory_mb = sum(self._reclaiming.values())
+        for fname, pool in self._pools.items():
+            count = pool.size + pool.provisioning_count
+            if count:
+                containers += count
+                memory_mb += count * self._memory_of(fname)
+        return containers, memory_mb
+
+    async def _reserve_budget(self, function_name: str, reclaim: bool, count: int = 1) -> int:
+        """
+        Make room in the budget for `count` provisions already counted by their pool.
+
+        Reclaims the best-scored idle workers of other functions, and waits for
+        their containers to be deleted before returning. A batch is trimmed to what
+        fits first; returns the number of provisions that may proceed.
+        """
+        budget = self.budget
+        if budget is None:
+            return count
+        containers, memory_mb = self._budget_usage()
+        memory = self._memory_of(function_name)
+        while count > 1 and not budget.fits(containers, memory_mb):
+            count -= 1
+            containers -= 1
+            memory_mb -= memory
+        if budget.fits(containers, memory_mb):
+            return count
+
+        victims = None
+        if reclaim:
+            now = time.time()
+            candidates = []
+            for fname, pool in self._pools.items():
+                if fname == function_name:
+                    continue
+                reclaimable = max(0, pool.size - pool.min_capacity)
+                memory = self._memory_of(fname)
+                cold_start = budget.cold_start_seconds(fname)
+                for worker in pool.get_idle_workers()[:reclaimable]:
+                    candidates.append(
+                        BudgetCandidate(
+                            fname, worker, memory, now - worker.last_used_at, cold_start
+                        )
+                    )
+            victims = budget.select_victims(candidates, containers, memory_mb)
+
+        if not victims:
+            budget.rejections += 1
+            raise ContainerBudgetExceededError(
+                function_name, f"Container budget full ({containers} containers, {memory_mb} MB)"
+            )
 
-    async def _provision_wrapper(self, function_name: str) -> List[WorkerInfo]:
-        """Provision API wrapper (returns List[WorkerInfo])."""
-        return await self.provision_client.provision(function_name)
+        reclaimed = []
+        for victim in victims:
+            if self._pools[victim.function_name].reclaim_idle(victim.worker.id) is not None:
+                self._reclaiming[victim.worker.id] = victim.memory_mb
+                reclaimed.append(victim)
+        budget.evictions += len(reclaimed)
+        await asyncio.gather(*(self._delete_reclaimed(victim) for victim in reclaimed))
+        return count
+
+    async def _delete_reclaimed(self, victim: BudgetCandidate) -> None:
+        worker = victim.worker
+        await self._cancel_idle_timers(worker.id)
+        self._paused_ids.discard(worker.id)
+        try:
+            if await self.lifecycle.destroy(worker.id):
+                logger.info(
+                    f"Evicted idle container {worker.name} of {victim.function_name} "
+                    "to fit the container budget"
+                )
+        finally:
+            self._reclaiming.pop(worker.id, None)
+            await self._unregister(worker.id)
+
+    async def _donate_idle_worker(self, function_name: str) -> Optional[WorkerInfo]:
+        """Give one idle (not paused) worker to another process (coordinator request)."""
+        pool = self._pools.get(function_name)
+        if pool is None:
+            return None
+        for worker in pool.get_idle_workers():
+            if (
+                worker.id in self._paused_ids
+                or worker.id in self._pausing
+                or worker.id in self._resume_tasks
+            ):
+                continue
+            if pool.reclaim_idle(worker.id) is not None:
+                await self._cancel_idle_timers(worker.id)
+                if worker.id in self._paused_ids:
+                    # A pause finished while we waited; the other process could not use it.
+                    await self._restore_donated_worker(function_name, worker)
+                    continue
+                logger.info(f"Offered idle worker {worker.id} of {function_name} to a process")
+                return worker
+        return None
+
+    async def _restore_donated_worker(self, function_name: str, worker: WorkerInfo) -> None:
+        """Put back a worker whose donation was not committed."""
+        pool = self._pools.get(function_name)
+        if pool is not None and await pool.adopt(worker):
+            await self._schedule_idle_timers(function_name, pool, worker)
+            return
+        # The pool filled up meanwhile: the container is no longer needed.
+        await self.lifecycle.destroy(worker.id)
+        await self._unregister(worker.id)
+
+    async def _reserve_node_capacity(self, function_name: str, wait: bool) -> Optional[WorkerInfo]:
+        """
+        Reserve node-wide capacity through the coordinator.
+
+        While the node is at max_capacity, an idle worker of another process is taken
+        over instead (returned), retrying until the pool's acquire timeout if `wait`.
+        """
+        coordinator = self.coordinator
+        pool = self._pools.get(function_name)
+        if coordinator is None or not coordinator.connected or pool is None:
+            return None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + pool.acquire_timeout
+        delay = 0.05
+        while True:
+            if wait:
+                worker = await coordinator.steal(function_name)
+                if worker is not None:
+                    return worker
+            if await coordinator.reserve(function_name, pool.max_capacity):
+                return None
+            if not wait or loop.time() + delay > deadline:
+                raise ContainerStartError(function_name, "Node-wide max_capacity reached")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+    async def _unregister(self, worker_id: str) -> None:
+        if self.coordinator is not None:
+            await self.coordinator.unregister(worker_id)
+
+    async def _provision_wrapper(
+        self, function_name: str, reclaim: bool = True, count: int = 1
+    ) -> List[WorkerInfo]:
+        """
+        Provision API wrapper (returns List[WorkerInfo]).
+
+        reclaim: evict idle workers of other functions if the budget is full, and
+        take over idle workers of other processes (False for speculative warm-up,
+        which also queues behind demand-driven provisions).
+        count: containers to start in one call (warm-up batches); fewer are returned
+        when the node, the budget or the Agent has room for fewer.
+        """
+        if self.agent_monitor is not None:
+            self.agent_monitor.check(function_name)
+        if count > 1:
+            return await self._provision_batch(function_name, count)
+        stolen = await self._reserve_node_capacity(function_name, wait=reclaim)
+        if stolen is not None:
+            return [stolen]
+        reserved = self.coordinator is not None and self.coordinator.connected
+        try:
+            await self._reserve_budget(function_name, reclaim)
+            async with self._provision_slot(function_name, background=not reclaim):
+                started = time.monotonic()
+                try:
+                    workers = await self.provision_client.provision(function_name)
+                except Exception as e:
+                    if self.agent_monitor is not None:
+                        self.agent_monitor.observe_error(e)
+                    raise
+        except BaseException:
+            if reserved:
+                await self.coordinator.unreserve(function_name)
+            raise
+        if self.budget is not None:
+            self.budget.observe_cold_start(function_name, time.monotonic() - started)
+        if self.coordinator is not None:
+            await self.coordinator.register(function_name, workers[0])
+        return workers
+
+    async def _provision_batch(self, function_name: str, count: int) -> List[WorkerInfo]:
+        """Warm-up batch: one provision call and one scheduler slot for `count` containers."""
+        coordinator = self.coordinator
+        reserved = count
+        node_reserved = coordinator is not None and coordinator.connected
+        if node_reserved:
+            assert coordinator is not None
+            pool = self._pools.get(function_name)
+            max_capacity = pool.max_capacity if pool is not None else count
+            reserved = 0
+            while reserved < count and await coordinator.reserve(function_name, max_capacity):
+                reserved += 1
+            if reserved == 0:
+                raise ContainerStartError(function_name, "Node-wide max_capacity reached")
+
+        async def _unreserve(n: int) -> None:
+            if node_reserved and coordinator is not None:
+                for _ in range(n):
+                    await coordinator.unreserve(function_name)
+
+        try:
+            count = await self._reserve_budget(function_name, reclaim=False, count=reserved)
+            async with self._provision_slot(function_name, background=True):
+                started = time.monotonic()
+                try:
+                    workers = await self.provision_client.provision(function_name, count=count)
+                except Exception as e:
+                    if self.agent_monitor is not None:
+                        self.agent_monitor.observe_error(e)
+                    raise
+        except BaseException:
+            await _unreserve(reserved)
+            raise
+        workers = workers[:count]
+        await _unreserve(reserved - len(workers))
+        if self.budget is not None:
+            self.budget.observe_cold_start(function_name, time.monotonic() - started)
+        if self.coordinator is not None:
+            for worker in workers:
+                await self.coordinator.register(function_name, worker)
+        return workers
+
+    async def _warm_workers(
+        self, function_name: str, workers: List[WorkerInfo]
+    ) -> List[WorkerInfo]:
+        """
+        Run the warm-up invocation on new workers; the ones that fail are deleted.
+
+        Raises the first error if none succeeded.
+        """
+        if self.warmer is None or not workers or self.warmer.config_for(function_name) is None:
+            return workers
+        results = await asyncio.gather(
+            *(self.warmer.warm(function_name, w) for w in workers), return_exceptions=True
+        )
+        outcomes = list(zip(workers, results, strict=True))
+        ready = [w for w, r in outcomes if not isinstance(r, BaseException)]
+        failed = [w for w, r in outcomes if isinstance(r, BaseException)]
+        if failed:
+            errors = [r for r in results if isinstance(r, BaseException)]
+            logger.warning(
+                f"Warm-up invocation failed on {len(failed)} of {len(workers)} workers "
+                f"for {function_name}: {errors[0]}"
+            )
+            await self.lifecycle.destroy_many(w.id for w in failed)
+            for worker in failed:
+                await self._unregister(worker.id)
+            if not ready:
+                raise errors[0]
+        return ready
+
+    async def _provision_warm(self, function_name: str, count: int = 1) -> List[WorkerInfo]:
+        """Warm-up provision: workers are handed to the pool once initialized."""
+        workers = await self._provision_wrapper(function_name, reclaim=False, count=count)
+        return await self._warm_workers(function_name, workers)
+
+    def _provision_slot(self, function_name: str, background: bool):
+        if self.provision_scheduler is None:
+            return contextlib.nullcontext()
+        return self.provision_scheduler.slot(function_name, background=background)
+
+    def provision_weight(self, function_name: str) -> float:
+        """Fair-queuing weight of a function (scaling.provision_weight)."""
+        entity = self.config_loader(function_name)
+        return entity.scaling.provision_weight if entity else 1.0
+
+    @property
+    def resume_stats(self) -> Optional[dict]:
+        """Inline vs speculative resumes (None unless pause is enabled)."""
+        if not self.pause_enabled:
+            return None
+        return {**self._resume_counts, "speculative_idle": len(self._speculative)}
+
+    @property
+    def budget_stats(self) -> Optional[dict]:
+        if self.budget is None:
+            return None
+        return self.budget.stats(self._budget_usage())
 
     async def acquire_worker(self, function_name: str) -> WorkerInfo:
         """Acquire a worker."""
         pool = await self.get_pool(function_name)
+        priority = get_invocation_priority()
+        affinity_key = get_invocation_affinity()
         while True:
-            worker = await pool.acquire(self._provision_wrapper)
+            worker = await pool.acquire(
+                self._provision_wrapper, priority=priority, affinity_key=affinity_key
+            )
             # Observability: Log worker acquisition details
             reuse_status = "REUSED" if worker.last_used_at > worker.created_at else "NEW"
             logger.info(
@@ -153,35 +748,234 @@ class PoolManager:
             )
 
             if self.pause_enabled:
-                await self._cancel_pause_task(worker.id)
-                if worker.id in self._paused_ids:
-                    try:
-                        await self.provision_client.resume_container(function_name, worker)
-                        self._paused_ids.discard(worker.id)
-                        return worker
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to resume container {worker.id} for {function_name}: {e}"
-                        )
-                        self._paused_ids.discard(worker.id)
-                        await pool.evict(worker)
-                        continue
+                if worker.id in self._speculative:
+                    self._resume_counts["hits"] += 1
+                elif worker.id in self._paused_ids:
+                    self._resume_counts["inline"] += 1
+                # Only paused workers were left: get the next ones running meanwhile.
+                paused = worker.id in self._paused_ids and worker.id not in self._speculative
+                self._resume_ahead(function_name, pool, at_least=1 if paused else 0)
+                await self._cancel_idle_timers(worker.id)
+                # No retry backoff on the request path: evict and take the next worker.
+                if not await self._ensure_resumed(function_name, pool, worker, retry=False):
+                    continue
             return worker
 
+    async def warm_up(self, function_name: str, count: int) -> int:
+        """
+        Ensure at least `count` idle (or provisioning) workers, capped by max_capacity.
+
+        The deficit is requested in batches of provision_batch_size containers per
+        provision call; calls run in parallel, bounded by warm_parallelism across
+        all pools. Returns the number of workers provisioned by this call (0 if
+        another gateway replica owns the function).
+        """
+        if not self._owned(function_name):
+            return 0
+        pool = await self.get_pool(function_name)
+        deficit = max(0, count - pool.idle_count)
+        if deficit == 0:
+            return 0
+        batch = self.provision_batch_size
+        sizes = [min(batch, deficit - start) for start in range(0, deficit, batch)]
+
+        async def _provision(size: int) -> int:
+            async with self._warm_semaphore:
+                workers = await pool.prewarm(self._provision_warm, count=size)
+            for worker in workers:
+                await self._schedule_idle_timers(function_name, pool, worker)
+            return len(workers)
+
+        results = await asyncio.gather(*(_provision(n) for n in sizes), return_exceptions=True)
+        errors = [r for r in results if isinstance(r, BaseException)]
+        provisioned = sum(r for r in results if not isinstance(r, BaseException))
+        if errors:
+            logger.warning(
+                f"Warm-up for {function_name}: {len(errors)} of {len(sizes)} provision calls "
+                f"failed: {errors[0]}"
+            )
+            if provisioned == 0:
+                error = errors[0]
+                if isinstance(error, Exception) and not isinstance(error, ContainerStartError):
+                    raise ContainerStartError(function_name, error) from error
+                raise error
+        if provisioned:
+            logger.info(f"Warmed {provisioned} workers for {function_name}")
+        return provisioned
+
+    async def ensure_min_capacity(self, function_names: List[str]) -> Dict[str, int]:
+        """Top up every function with min_capacity > 0 to its idle floor."""
+        result: Dict[str, int] = {}
+        targets = []
+        for function_name in function_names:
+            if not self._owned(function_name):
+                continue
+            func_entity = self.config_loader(function_name)
+            if func_entity and func_entity.scaling.min_capacity > 0:
+                targets.append((function_name, func_entity.scaling.min_capacity))
+
+        outcomes = await asyncio.gather(
+            *(self.warm_up(name, floor) for name, floor in targets), return_exceptions=True
+        )
+        for (function_name, _), outcome in zip(targets, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Failed to keep min_capacity for {function_name}: {outcome}")
+            elif outcome:
+                result[function_name] = outcome
+        return result
+
+    async def check_idle_health(
+        self, probe_timeout: float = 1.0, quiet_seconds: float = 0.0
+    ) -> Dict[str, int]:
+        """
+        Find idle workers whose container died, evict them and top the pool back up
+        to min_capacity before traffic reaches them.
+
+        One ListContainers call checks the runtime status of every idle worker (not
+        listed, or not RUNNING while not paused by us = dead); idle, unpaused workers
+        released more than `quiet_seconds` ago are also probed (TCP / RIE, per
+        READINESS_MODE). Returns {function_name: evicted}.
+        """
+        candidates = [
+            (function_name, pool, worker, worker.last_used_at, worker.id in self._paused_ids)
+            for function_name, pool in self._pools.items()
+            for worker in pool.get_idle_workers()
+            if worker.id not in self._pausing and worker.id not in self._resume_tasks
+        ]
+        if not candidates:
+            return {}
+
+        container_states = getattr(self.provision_client, "container_states", None)
+        states = await container_states() if container_states is not None else None
+        if not isinstance(states, dict):
+            states = None
+        probe = getattr(self.provision_client, "probe_container", None)
+        now = time.time()
+
+        async def _healthy(function_name: str, worker: WorkerInfo) -> bool:
+            paused = worker.id in self._paused_ids
+            if states is not None:
+                status = states.get(worker.id)
+                if status is None or status != ("PAUSED" if paused else "RUNNING"):
+                    logger.warning(
+                        f"Idle container {worker.id} for {function_name} is {status or 'gone'}"
+                    )
+                    return False
+            if paused or probe is None or now - worker.last_used_at < quiet_seconds:
+                return True
+            try:
+                return bool(await probe(function_name, worker, timeout=probe_timeout))
+            except Exception as e:
+                logger.warning(f"Health probe of {worker.id} for {function_name} failed: {e}")
+                return False
+
+        healthy = await asyncio.gather(*(_healthy(fn, w) for fn, _, w, _, _ in candidates))
+        evicted: Dict[str, int] = {}
+        for (function_name, pool, worker, released_at, was_paused), ok in zip(
+            candidates, healthy, strict=True
+        ):
+            # Skip workers handed out (and possibly returned) while the check ran,
+            # and workers whose pause started or finished meanwhile (their state
+            # and probe result no longer match).
+            if (
+                ok
+                or worker.last_used_at != released_at
+                or worker.id in self._pausing
+                or (worker.id in self._paused_ids) != was_paused
+            ):
+                continue
+            if pool.evict_unhealthy(worker.id) is None:
+                continue
+            await self._cancel_idle_timers(worker.id)
+            self._paused_ids.discard(worker.id)
+            await self.lifecycle.destroy(worker.id)
+            await self._unregister(worker.id)
+            evicted[function_name] = evicted.get(function_name, 0) + 1
+
+        if evicted:
+            await self.ensure_min_capacity(list(evicted))
+        return evicted
+
+    async def scale_ahead(self) -> Dict[str, int]:
+        """
+        Provision ahead of forecast demand.
+
+        For each pool, workers (existing + provisioning) are raised to the forecast
+        concurrency `forecast_horizon_seconds` ahead (divided by per_worker_concurrency),
+        capped by max_capacity. Surplus is not removed here; it ages out through the
+        idle timeout.
+        """
+        targets = []
+        for function_name, pool in list(self._pools.items()):
+            if pool.forecaster is None or not self._owned(function_name):
+                continue
+            # Paused idle workers count as capacity; get them running first.
+            self._resume_ahead(function_name, pool)
+            forecast = round(pool.forecaster.forecast_concurrency(), 2)
+            target = min(pool.max_capacity, math.ceil(forecast / pool.per_worker_concurrency))
+            deficit = target - (pool.busy_count + pool.idle_count)
+            if deficit > 0:
+                targets.append((function_name, pool.idle_count + deficit, target))
+
+        result: Dict[str, int] = {}
+        outcomes = await asyncio.gather(
+            *(self.warm_up(name, idle_target) for name, idle_target, _ in targets),
+            return_exceptions=True,
+        )
+        for (function_name, _, target), outcome in zip(targets, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Scale-ahead failed for {function_name}: {outcome}")
+            elif outcome:
+                logger.info(
+                    f"Scale-ahead: provisioned {outcome} workers for {function_name} "
+                    f"(forecast target={target})"
+                )
+                result[function_name] = outcome
+        return result
+
     async def release_worker(self, function_name: str, worker: WorkerInfo) -> None:
         """Release a worker."""
         if function_name in self._pools:
             pool = self._pools[function_name]
-            await pool.release(worker)
-            if self.pause_enabled:
-                await self._schedule_pause(function_name, pool, worker)
+            if await pool.release(worker):
+                # Reached max_worker_age / max_worker_invocations: recycle the container.
+                await self._cancel_idle_timers(worker.id)
+                self._paused_ids.discard(worker.id)
+                if await self.lifecycle.destroy(worker.id):
+                    logger.info(f"Recycled container {worker.name} for {function_name}")
+                await self._unregister(worker.id)
+                return
+            await self._schedule_idle_timers(function_name, pool, worker)
 
     async def evict_worker(self, function_name: str, worker: WorkerInfo) -> None:
         """Evict a dead worker."""
         if function_name in self._pools:
-            await self._cancel_pause_task(worker.id)
+            await self._cancel_idle_timers(worker.id)
             self._paused_ids.discard(worker.id)
             await self._pools[function_name].evict(worker)
+            await self._unregister(worker.id)
+
+    async def hand_off(self, function_name: str) -> int:
+        """
+        Give up a function that another gateway replica now owns (cluster mode).
+
+        Idle workers are deleted now, min_capacity included; busy ones are taken on
+        a later call once released. Returns the number of workers deleted, i.e. the
+        capacity the new owner should warm.
+        """
+        pool = self._pools.get(function_name)
+        if pool is None:
+            return 0
+        workers = pool.take_idle_workers()
+        for worker in workers:
+            await self._cancel_idle_timers(worker.id)
+            self._paused_ids.discard(worker.id)
+        await self.lifecycle.destroy_many(w.id for w in workers)
+        for worker in workers:
+            await self._unregister(worker.id)
+        if workers:
+            logger.info(f"Handed off {function_name}: deleted {len(workers)} idle workers")
+        return len(workers)
 
     def get_all_worker_names(self) -> Dict[str, List[str]]:
         """For heartbeat: collect all worker names across pools (busy + idle)."""
@@ -198,22 +992,37 @@ class PoolManager:
         return sorted(stats, key=lambda item: str(item.get("function_name", "")))
 
     async def cleanup_all_containers(self) -> int:
-        """Fetch all containers from Agent and delete them (startup cleanup)."""
+        """
+        Fetch all containers from Agent and delete them (startup cleanup).
+
+        With a coordinator, only the first worker process on the node cleans up;
+        the others wait until it is done.
+        """
+        if await self._defer_startup_cleanup():
+            return 0
         try:
             containers = await self.provision_client.list_containers()
-            count = 0
-            for worker in containers:
-                try:
-                    await self.provision_client.delete_container(worker.id)
-                    count += 1
-                except Exception as e:
-                    logger.error(f"Failed to delete orphan container {worker.id}: {e}")
+            count = await self.lifecycle.destroy_many(worker.id for worker in containers)
             if count > 0:
                 logger.info(f"Cleanup: Removed {count} orphan containers on startup")
             return count
         except Exception as e:
             logger.error(f"Failed to cleanup all containers: {e}")
             return 0
+        finally:
+            await self._finish_startup_cleanup()
+
+    async def _defer_startup_cleanup(self) -> bool:
+        """True (once it has finished) if another worker process runs startup cleanup."""
+        if self.coordinator is None or self.coordinator.startup_cleanup:
+            return False
+        logger.info("Waiting for startup cleanup by another worker process")
+        await self.coordinator.wait_for_cleanup()
+        return True
+
+    async def _finish_startup_cleanup(self) -> None:
+        if self.coordinator is not None:
+            await self.coordinator.cleanup_done()
 
     async def sync_with_manager(self) -> None:
         """Adopt existing containers from the orchestrator (Phase 1 compatibility)."""
@@ -236,42 +1045,165 @@ class PoolManager:
         except Exception as e:
             logger.error(f"Failed to sync with manager: {e}")
 
-    async def shutdown_all(self) -> None:
-        """Drain all pools and delete containers."""
+    async def warm_restart(self, snapshot_path: str, probe_timeout: float = 2.0) -> Dict[str, int]:
+        """
+        Re-adopt the containers of the pool snapshot at `snapshot_path` (warm-restart startup).
+
+        Only the process that runs startup cleanup consumes the snapshot, and only
+        once the Agent has listed its containers (otherwise the file is kept for
+        the next start). Containers that the Agent still lists and the snapshot
+        knows are probed in parallel; healthy ones rejoin their pools, the rest
+        are deleted like cleanup_all_containers() would. Paused containers stay
+        paused (resumed on acquire) when pausing is enabled, otherwise they are
+        resumed first.
+        """
+        if await self._defer_startup_cleanup():
+            return {"adopted": 0, "destroyed": 0}
+        try:
+            try:
+                containers = await self.provision_client.list_containers()
+            except Exception as e:
+                logger.error(f"Warm restart skipped, keeping {snapshot_path}: {e}")
+                return {"adopted": 0, "destroyed": 0}
+            snapshot = load_pool_snapshot(snapshot_path)
+            return await self._readopt_snapshot(snapshot, containers, probe_timeout)
+        finally:
+            await self._finish_startup_cleanup()
+
+    async def _readopt_snapshot(
+        self, snapshot: Dict[str, dict], containers: List[WorkerInfo], probe_timeout: float
+    ) -> Dict[str, int]:
+        result = {"adopted": 0, "destroyed": 0}
+        try:
+            probe_timeout = float(probe_timeout)
+        except (TypeError, ValueError):
+            probe_timeout = 2.0
+
+        probe = getattr(self.provision_client, "probe_container", None)
+
+        async def _check(worker: WorkerInfo, paused: bool) -> bool:
+            try:
+                if paused:
+                    if self.pause_enabled:
+                        return True
+                    await self.lifecycle.resume(worker.function_name, worker)
+                    return True
+                if probe is None:
+                    return True
+                return await probe(worker.function_name, worker, timeout=probe_timeout)
+            except Exception as e:
+                logger.warning(f"Cannot re-adopt container {worker.id}: {e}")
+                return False
+
+        candidates: List[tuple[WorkerInfo, bool]] = []
+        stale: List[WorkerInfo] = []
+        for container in containers:
+            entry = snapshot.get(container.id)
+            if (
+                entry is None
+                or entry.get("function_name") != container.function_name
+                or self.config_loader(container.function_name) is None
+            ):
+                stale.append(container)
+                continue
+            candidates.append((worker_from_snapshot(entry), bool(entry.get("paused"))))
+
+        healthy = await asyncio.gather(*(_check(w, paused) for w, paused in candidates))
+        for (worker, paused), ok in zip(candidates, healthy, strict=True):
+            pool = await self.get_pool(worker.function_name)
+            if not ok or not await pool.adopt(worker):
+                stale.append(worker)
+                continue
+            result["adopted"] += 1
+            if self.coordinator is not None:
+                await self.coordinator.register(worker.function_name, worker)
+            if paused and self.pause_enabled:
+                self._mark_paused(pool, worker.id, True)
+            await self._schedule_idle_timers(worker.function_name, pool, worker)
+
+        result["destroyed"] = await self.lifecycle.destroy_many(worker.id for worker in stale)
+
+        logger.info(
+            f"Warm restart: re-adopted {result['adopted']} containers, "
+            f"removed {result['destroyed']} stale containers"
+        )
+        return result
+
+    async def wait_for_in_flight(self, timeout: float) -> int:
+        """
+        Wait until no invocation holds a worker (or `timeout` seconds pass).
+
+        Returns the number of invocations still in flight.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, timeout)
+        while True:
+            in_flight = sum(pool.in_flight for pool in self._pools.values())
+            if in_flight == 0 or loop.time() >= deadline:
+                if in_flight:
+                    logger.warning(f"Shutting down with {in_flight} invocations in flight")
+                return in_flight
+            await asyncio.sleep(0.05)
+
+    async def detach_all(self, drain_timeout: float = 0.0) -> tuple[List[WorkerInfo], Set[str]]:
+        """
+        Drain all pools but keep the containers running (warm-restart shutdown).
+
+        Returns the drained workers and the ids of those that are paused.
+        """
+        logger.info("Detaching all pools for warm restart...")
+        await self.wait_for_in_flight(drain_timeout)
+        await self._stop_timers()
+        paused_ids = set(self._paused_ids) - set(self._resume_tasks)
+        self._paused_ids.clear()
+        workers: List[WorkerInfo] = []
+        for pool in self._pools.values():
+            workers.extend(await pool.drain())
+        return workers, paused_ids
+
+    async def shutdown_all(self, drain_timeout: float = 0.0) -> None:
+        """
+        Let in-flight invocations finish (up to `drain_timeout` seconds), then drain
+        all pools and delete their containers in parallel.
+        """
         logger.info("Shutting down all pools...")
-        await self._cancel_all_pause_tasks()
+        await self.wait_for_in_flight(drain_timeout)
+        await self._stop_timers()
         self._paused_ids.clear()
-        for _, pool in self._pools.items():
-            workers = await pool.drain()
-            for w in workers:
-                self._deleting_ids.add(w.id)
-                try:
-                    await self.provision_client.delete_container(w.id)
-                except Exception as e:
-                    logger.error(f"Failed to delete {w.name}: {e}")
-                finally:
-                    self._deleting_ids.discard(w.id)
+        workers: List[WorkerInfo] = []
+        for pool in self._pools.values():
+            workers.extend(await pool.drain())
+        await self.lifecycle.destroy_many(w.id for w in workers)
+        for w in workers:
+            await self._unregister(w.id)
 
     async def prune_all_pools(self, idle_timeout: float) -> Dict[str, List[WorkerInfo]]:
-        """Prune all pools and delete from orchestrator."""
+        """
+        Prune all pools and delete from orchestrator.
+
+        `idle_timeout` applies to functions without scaling.idle_timeout.
+        """
         result = {}
         for fname, pool in self._pools.items():
-            pruned = await pool.prune_idle_workers(idle_timeout)
+            pool_timeout = self._idle_timeout_of(pool, idle_timeout)
+            if self._keep_warm_for_schedule(fname, pool_timeout):
+                # Next scheduled run is due before this worker would be needed again.
+                pruned = await pool.prune_idle_workers(pool_timeout, keep=1)
+            else:
+                pruned = await pool.prune_idle_workers(pool_timeout)
             if pruned:
                 for w in pruned:
-                    await self._cancel_pause_task(w.id)
+                    await self._cancel_idle_timers(w.id)
                     self._paused_ids.discard(w.id)
                 result[fname] = pruned
-                # Delete from orchestrator
-                for w in pruned:
-                    self._deleting_ids.add(w.id)
-                    try:
-                        await self.provision_client.delete_container(w.id)
-                        logger.info(f"Pruned and deleted idle container: {w.name}")
-                    except Exception as e:
-                        logger.error(f"Failed to delete pruned container {w.name}: {e}")
-                    finally:
-                        self._deleting_ids.discard(w.id)
+
+        # Delete from orchestrator (all pools at once, bounded by the executor).
+        async def _delete(w: WorkerInfo) -> None:
+            if await self.lifecycle.destroy(w.id):
+                logger.info(f"Pruned and deleted idle container: {w.name}")
+            await self._unregister(w.id)
+
+        await asyncio.gather(*(_delete(w) for pruned in result.values() for w in pruned))
         return result
 
     async def reconcile_orphans(self) -> int:
@@ -295,8 +1227,14 @@ class PoolManager:
             if not actual_containers:
                 return 0
 
-            # 2. Collect all worker IDs known to the Gateway.
+            # 2. Collect all worker IDs known to the Gateway (all worker processes).
             known_ids = set()
+            if self.coordinator is not None and self.coordinator.connected:
+                owned = await self.coordinator.owned_ids()
+                if owned is None:
+                    logger.warning("Skipping reconciliation: pool coordinator did not answer")
+                    return 0
+                known_ids |= owned
             for pool in self._pools.values():
                 workers = pool.get_all_workers()
                 for w in workers:
@@ -306,11 +1244,11 @@ class PoolManager:
             orphans = [
                 c
                 for c in actual_containers
-                if c.id not in known_ids and c.id not in self._deleting_ids
+                if c.id not in known_ids and c.id not in self.lifecycle.deleting_ids
             ]
 
-            # 4. Delete orphans (respect grace period).
-            removed_count = 0
+            # 4. Delete orphans (respect grace period), in parallel via the executor.
+            expired = []
             for orphan in orphans:
                 # Grace period check: skip containers created within grace_period seconds.
                 container_age = current_time - orphan.created_at
@@ -321,16 +1259,13 @@ class PoolManager:
                     )
                     continue
 
-                try:
-                    logger.warning(
-                        f"Found orphan container {orphan.id} ({orphan.name}). "
-                        f"Age: {container_age:.1f}s. Deleting... (Reconciliation)"
-                    )
-                    await self.provision_client.delete_container(orphan.id)
-                    removed_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to delete orphan {orphan.id}: {e}")
+                logger.warning(
+                    f"Found orphan container {orphan.id} ({orphan.name}). "
+                    f"Age: {container_age:.1f}s. Deleting... (Reconciliation)"
+                )
+                expired.append(orphan.id)
 
+            removed_count = await self.lifecycle.destroy_many(expired)
             if removed_count > 0:
                 logger.info(f"Reconciliation: Removed {removed_count} orphan containers")
 
@@ -340,9 +1275,10 @@ class PoolManager:
             logger.error(f"Reconciliation failed: {e}")
             return 0
 
-    async def _cancel_all_pause_tasks(self) -> None:
-        tasks = list(self._pause_tasks.values())
-        self._pause_tasks.clear()
+    async def _stop_timers(self) -> None:
+        await self.timers.stop()
+        tasks = list(self._pausing.values())
+        self._pausing.clear()
         for task in tasks:
             task.cancel()
         for task in tasks:
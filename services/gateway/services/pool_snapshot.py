@@ -0,0 +1,83 @@
+"""
+Pool snapshot for warm restarts.
+
+On shutdown each worker process merges its workers into one JSON file (under an
+flock, so several uvicorn processes can write it); on startup the process that
+runs startup cleanup consumes it and re-adopts the containers that are still
+alive. The Agent's ListContainers has no addresses, so the snapshot carries them.
+"""
+
+import dataclasses
+import fcntl
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, List, Set
+
+from services.common.models.internal import WorkerInfo
+
+logger = logging.getLogger("gateway.pool_snapshot")
+
+SNAPSHOT_VERSION = 1
+
+
+def _read(handle) -> Dict[str, Dict[str, Any]]:
+    handle.seek(0)
+    raw = handle.read()
+    if not raw:
+        return {}
+    data = json.loads(raw)
+    if data.get("version") != SNAPSHOT_VERSION:
+        return {}
+    return {entry["id"]: entry for entry in data.get("workers", [])}
+
+
+def save_pool_snapshot(path: str, workers: Iterable[WorkerInfo], paused_ids: Set[str]) -> int:
+    """Merge workers into the snapshot file. Returns the number of workers written."""
+    entries: List[Dict[str, Any]] = [
+        {**dataclasses.asdict(worker), "paused": worker.id in paused_ids} for worker in workers
+    ]
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a+", encoding="utf-8") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        merged: Dict[str, Dict[str, Any]]
+        try:
+            merged = _read(handle)
+        except (ValueError, KeyError):
+            merged = {}
+        merged.update({entry["id"]: entry for entry in entries})
+        handle.seek(0)
+        handle.truncate()
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "saved_at": time.time(),
+            "workers": list(merged.values()),
+        }
+        json.dump(snapshot, handle)
+    return len(entries)
+
+
+def load_pool_snapshot(path: str) -> Dict[str, dict]:
+    """
+    Read and remove the snapshot. Returns {container id: entry}.
+
+    A missing or unreadable snapshot yields {} (every container is then stale).
+    """
+    try:
+        with open(path, "r+", encoding="utf-8") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                return _read(handle)
+            finally:
+                os.unlink(path)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Ignoring unreadable pool snapshot {path}: {e}")
+        return {}
+
+
+def worker_from_snapshot(entry: dict) -> WorkerInfo:
+    fields = {f.name for f in dataclasses.fields(WorkerInfo)}
+    return WorkerInfo(**{k: v for k, v in entry.items() if k in fields})
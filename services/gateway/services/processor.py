@@ -4,10 +4,12 @@ Gateway Request Processor - Service Layer
 Standardizes the flow: InputContext -> Event -> InvocationResult.
 """
 
-import json
 import logging
+from typing import Optional
 
 from services.gateway.core.event_builder import EventBuilder
+from services.gateway.core.invocation_context import invocation_affinity
+from services.gateway.core.payload_codec import PayloadCodec
 from services.gateway.models.context import InputContext
 from services.gateway.models.result import InvocationResult
 from services.gateway.services.lambda_invoker import LambdaInvoker
@@ -22,9 +24,15 @@ class GatewayRequestProcessor:
     Acts as the Service Layer (Application Service) in our Clean Architecture.
     """
 
-    def __init__(self, invoker: LambdaInvoker, event_builder: EventBuilder):
+    def __init__(
+        self,
+        invoker: LambdaInvoker,
+        event_builder: EventBuilder,
+        codec: Optional[PayloadCodec] = None,
+    ):
         self.invoker = invoker
         self.event_builder = event_builder
+        self.codec = codec or PayloadCodec()
 
     async def process_request(self, context: InputContext) -> InvocationResult:
         """
@@ -35,14 +43,14 @@ class GatewayRequestProcessor:
         )
 
         try:
-            # 1. Build Event from Context
-            event = self.event_builder.build(context)
-
-            # 2. Invoke Lambda
-            payload = json.dumps(event).encode("utf-8")
-            result = await self.invoker.invoke_function(
-                context.function_name, payload, timeout=context.timeout
-            )
+            # 1. Build Event from Context (off the event loop for large bodies)
+            payload = await self.codec.encode_event(self.event_builder, context)
+
+            # 2. Invoke Lambda (affinity key steers worker selection)
+            with invocation_affinity(context.affinity_key):
+                result = await self.invoker.invoke_function(
+                    context.function_name, payload, timeout=context.timeout
+                )
 
             return result
 
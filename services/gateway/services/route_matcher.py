@@ -12,9 +12,11 @@ import threading
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
+from pydantic import ValidationError
 
 from services.gateway.config import config
 from services.gateway.models.function import FunctionEntity
+from services.gateway.models.target_function import RouteAffinity
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,8 @@ class RouteMatcher:
         self.function_registry = function_registry
         self.config_path = config.ROUTING_CONFIG_PATH
         self._routing_config: List[Dict[str, Any]] = []
+        # (route path, METHOD) -> sticky worker affinity
+        self._affinities: Dict[Tuple[str, str], RouteAffinity] = {}
         self._lock = threading.RLock()
 
     def load_routing_config(self, force: bool = False) -> List[Dict[str, Any]]:
@@ -67,8 +71,10 @@ class RouteMatcher:
             logger.error("routing.yml has invalid format: routes must be a list")
             return self._get_routing_copy()
 
+        affinities = self._parse_affinities(routes)
         with self._lock:
             self._routing_config = routes
+            self._affinities = affinities
 
         logger.info(f"Loaded {len(self._routing_config)} routes from {self.config_path}")
 
@@ -82,6 +88,35 @@ class RouteMatcher:
         logger.info("Reloading routing configuration...")
         self.load_routing_config(force=True)
 
+    def _parse_affinities(
+        self, routes: List[Dict[str, Any]]
+    ) -> Dict[Tuple[str, str], RouteAffinity]:
+        """Collect `affinity` settings; invalid ones are logged and ignored."""
+        affinities: Dict[Tuple[str, str], RouteAffinity] = {}
+        for route in routes:
+            if not isinstance(route, dict) or not route.get("affinity"):
+                continue
+            key = (route.get("path", ""), str(route.get("method", "")).upper())
+            try:
+                affinities[key] = RouteAffinity.model_validate(route["affinity"])
+            except ValidationError as e:
+                logger.error(f"Ignoring invalid affinity for {key[1]} {key[0]}: {e}")
+        return affinities
+
+    def get_route_affinity(self, route_path: str, method: str) -> Optional[RouteAffinity]:
+        """
+        Sticky worker affinity configured for a matched route.
+
+        Args:
+            route_path: matched route pattern (as returned by match_route)
+            method: HTTP method of the matched route
+
+        Returns:
+            RouteAffinity, or None if the route has no affinity
+        """
+        with self._lock:
+            return self._affinities.get((route_path, method.upper()))
+
     def _get_routing_copy(self) -> List[Dict[str, Any]]:
         """
         Get a thread-safe copy of the routing config.
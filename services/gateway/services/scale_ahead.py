@@ -0,0 +1,51 @@
+"""
+ScaleAheadAutoscaler - Provisions workers ahead of forecast demand
+
+Each tick asks PoolManager to raise every pool to its forecast concurrency
+(per-function Holt forecasts of arrival rate and peak demand). Surplus workers
+are left to age out through the normal idle timeout.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .pool_manager import PoolManager
+
+logger = logging.getLogger("gateway.scale_ahead")
+
+
+class ScaleAheadAutoscaler:
+    """Background loop driving PoolManager.scale_ahead()."""
+
+    def __init__(self, pool_manager: "PoolManager", interval: float = 1.0):
+        self.pool_manager = pool_manager
+        self.interval = float(interval)
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start the scale-ahead loop."""
+        self._task = asyncio.create_task(self._loop())
+        logger.info(f"Scale-ahead autoscaler started (interval: {self.interval}s)")
+
+    async def stop(self) -> None:
+        """Stop the scale-ahead loop."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Scale-ahead autoscaler stopped")
+
+    async def _loop(self) -> None:
+        """Periodic execution loop."""
+        while True:
+            try:
+                await asyncio.sleep(self.interval)
+                await self.pool_manager.scale_ahead()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Scale-ahead failed: {e}")
@@ -1,16 +1,20 @@
 import json
 import logging
 import re
-from datetime import timezone
-from typing import Any, Dict, Optional
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.base import BaseTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from aws_croniter import AwsCroniter
 
+from services.gateway.core.invocation_context import InvocationPriority
 from services.gateway.services.lambda_invoker import LambdaInvoker
 
+if TYPE_CHECKING:
+    from services.gateway.services.pool_manager import PoolManager
+
 logger = logging.getLogger("gateway.scheduler")
 
 
@@ -40,11 +44,36 @@ class AWSCronTrigger(BaseTrigger):
         return f"aws_cron({self.expr})"
 
 
+class LeadTimeTrigger(BaseTrigger):
+    """Fires `lead_seconds` before each fire time of another trigger."""
+
+    def __init__(self, trigger: BaseTrigger, lead_seconds: float):
+        self.trigger = trigger
+        self.lead = timedelta(seconds=lead_seconds)
+
+    def get_next_fire_time(self, previous_fire_time, now):
+        previous = previous_fire_time + self.lead if previous_fire_time else None
+        next_fire = self.trigger.get_next_fire_time(previous, now + self.lead)
+        return next_fire - self.lead if next_fire else None
+
+    def __str__(self):
+        return f"lead({self.trigger}, -{self.lead.total_seconds()}s)"
+
+
 class SchedulerService:
-    def __init__(self, invoker: LambdaInvoker):
+    def __init__(
+        self,
+        invoker: LambdaInvoker,
+        pool_manager: Optional["PoolManager"] = None,
+        prewarm_lead_seconds: float = 0.0,
+    ):
         self.invoker = invoker
         self.scheduler = AsyncIOScheduler(timezone=timezone.utc)
-        self._jobs = {}
+        # function name -> schedule job ids
+        self._jobs: Dict[str, List[str]] = {}
+        # Provision/resume a worker this long before each scheduled run (0 disables).
+        self.pool_manager = pool_manager
+        self.prewarm_lead_seconds = float(prewarm_lead_seconds) if pool_manager else 0.0
 
     async def start(self):
         """Start the scheduler."""
@@ -62,6 +91,7 @@ class SchedulerService:
         """Load schedules from functions configuration."""
         # Remove existing jobs managed by this loader
         self.scheduler.remove_all_jobs()
+        self._jobs = {}
 
         for func_name, config in functions_config.items():
             events = config.get("events", [])
@@ -98,15 +128,57 @@ class SchedulerService:
             logger.info(f"Triggering scheduled invocation for {function_name}")
             try:
                 # We use a large timeout for scheduled tasks or config value
-                await self.invoker.invoke_function(function_name, payload)
+                await self.invoker.invoke_function(
+                    function_name, payload, priority=InvocationPriority.SCHEDULED
+                )
             except Exception as e:
                 logger.error(f"Scheduled invocation failed for {function_name}: {e}")
 
         self.scheduler.add_job(
             job_func, trigger=trigger, id=job_id, replace_existing=True, misfire_grace_time=60
         )
+        self._jobs.setdefault(function_name, []).append(job_id)
         logger.info(f"Added schedule job {job_id} for {function_name}: {expression}")
 
+        if self.prewarm_lead_seconds > 0:
+            self._add_prewarm_job(job_id, function_name, trigger)
+
+    def _add_prewarm_job(self, job_id: str, function_name: str, trigger: BaseTrigger):
+        """Provision or resume a worker lead seconds before each scheduled run."""
+        pool_manager = self.pool_manager
+        if pool_manager is None:
+            return
+
+        async def prewarm_func():
+            try:
+                result = await pool_manager.prewarm_for_schedule(function_name)
+                logger.info(f"Pre-warmed {function_name} for scheduled run ({result})")
+            except Exception as e:
+                logger.error(f"Scheduled pre-warm failed for {function_name}: {e}")
+
+        self.scheduler.add_job(
+            prewarm_func,
+            trigger=LeadTimeTrigger(trigger, self.prewarm_lead_seconds),
+            id=f"{job_id}_prewarm",
+            replace_existing=True,
+            misfire_grace_time=max(1, int(self.prewarm_lead_seconds)),
+        )
+
+    def next_fire_time(self, function_name: str) -> Optional[float]:
+        """Next scheduled invocation of a function (epoch seconds), if any."""
+        now = datetime.now(timezone.utc)
+        fire_times = []
+        for job_id in self._jobs.get(function_name, []):
+            job = self.scheduler.get_job(job_id)
+            if job is None:
+                continue
+            next_run = getattr(job, "next_run_time", None)
+            if next_run is None:
+                next_run = job.trigger.get_next_fire_time(None, now)
+            if next_run is not None:
+                fire_times.append(next_run.timestamp())
+        return min(fire_times) if fire_times else None
+
     def _parse_expression(self, expression: str) -> Any:
         """Parse AWS schedule expression (cron or rate)."""
         # cron(Minutes Hours Day-of-month Month Day-of-week Year)
@@ -0,0 +1,69 @@
+"""
+WarmPoolMaintainer - Keeps functions at their min_capacity floor
+
+Periodically provisions idle workers for functions whose `scaling.min_capacity`
+is above zero, so scale-to-zero or a Gateway restart does not make the first
+requests pay full cold starts.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Callable, List
+
+if TYPE_CHECKING:
+    from .pool_manager import PoolManager
+
+logger = logging.getLogger("gateway.warm_pool")
+
+
+class WarmPoolMaintainer:
+    """
+    Background loop that tops pools up to min_capacity idle workers.
+
+    Provisioning parallelism is bounded by PoolManager (warm_parallelism).
+    """
+
+    def __init__(
+        self,
+        pool_manager: "PoolManager",
+        function_names: Callable[[], List[str]],
+        interval: float = 10.0,
+    ):
+        self.pool_manager = pool_manager
+        self.function_names = function_names
+        self.interval = float(interval)
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start the maintainer loop (the first top-up runs immediately)."""
+        self._task = asyncio.create_task(self._loop())
+        logger.info(f"Warm pool maintainer started (interval: {self.interval}s)")
+
+    async def stop(self) -> None:
+        """Stop the maintainer loop."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Warm pool maintainer stopped")
+
+    async def _loop(self) -> None:
+        """Periodic execution loop."""
+        while True:
+            try:
+                await self.run_once()
+                await asyncio.sleep(self.interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Warm pool maintenance failed: {e}")
+                await asyncio.sleep(self.interval)
+
+    async def run_once(self) -> dict:
+        """Top up all functions once. Returns {function_name: provisioned}."""
+        provisioned = await self.pool_manager.ensure_min_capacity(self.function_names())
+        for function_name, count in provisioned.items():
+            logger.info(f"Provisioned {count} warm workers for {function_name} (min_capacity)")
+        return provisioned
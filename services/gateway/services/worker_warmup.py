@@ -0,0 +1,84 @@
+"""
+WorkerWarmer - Synthetic init invocation for new workers
+
+A container that passes the readiness check still runs the handler's init
+(imports, SDK clients, JIT) on its first invocation. For functions with a
+`warmup` event in functions.yml, proactively provisioned workers (prewarm,
+min_capacity, scale-ahead) receive that event first and only join the idle set
+once it succeeds. Demand-driven cold starts skip it (the request itself runs
+init), as do resumed workers (a paused container keeps its initialized state).
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.core.exceptions import ContainerStartError
+from services.gateway.core.readiness import RIE_INVOKE_PATH
+from services.gateway.models.function import FunctionEntity, WarmupConfig
+from services.gateway.services.agent_invoke import AgentInvokeClient
+
+logger = logging.getLogger("gateway.worker_warmup")
+
+
+class WorkerWarmer:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        config_loader: Callable[[str], Optional[FunctionEntity]],
+        agent_invoker: Optional[AgentInvokeClient] = None,
+    ):
+        """
+        Args:
+            client: shared httpx client (direct RIE invocation)
+            config_loader: function name -> FunctionEntity (source of `warmup`)
+            agent_invoker: invoke through the Agent instead (AGENT_INVOKE_PROXY)
+        """
+        self.client = client
+        self.config_loader = config_loader
+        self.agent_invoker = agent_invoker
+        self.warmed = 0
+        self.failed = 0
+
+    def config_for(self, function_name: str) -> Optional[WarmupConfig]:
+        entity = self.config_loader(function_name)
+        warmup = getattr(entity, "warmup", None)
+        return warmup if isinstance(warmup, WarmupConfig) else None
+
+    async def warm(self, function_name: str, worker: WorkerInfo) -> None:
+        """Send the warm-up event; raise ContainerStartError unless it succeeds."""
+        warmup = self.config_for(function_name)
+        if warmup is None:
+            return
+        payload = json.dumps(warmup.payload).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        try:
+            if self.agent_invoker is not None:
+                response = await self.agent_invoker.invoke(
+                    worker=worker, payload=payload, headers=headers, timeout=warmup.timeout
+                )
+            else:
+                url = f"http://{worker.ip_address}:{worker.port or 8080}{RIE_INVOKE_PATH}"
+                response = await self.client.post(
+                    url, content=payload, headers=headers, timeout=warmup.timeout
+                )
+        except Exception as e:
+            self.failed += 1
+            raise ContainerStartError(function_name, e) from e
+
+        function_error = response.headers.get("X-Amz-Function-Error")
+        if response.status_code >= 400 or function_error:
+            self.failed += 1
+            raise ContainerStartError(
+                function_name,
+                f"Warm-up invocation failed: {function_error or response.status_code}",
+            )
+        self.warmed += 1
+        logger.debug(f"Warmed worker {worker.id} for {function_name}")
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {"warmed": self.warmed, "failed": self.failed}
@@ -0,0 +1,139 @@
+"""
+Stress test: 1k+ concurrent waiters on a small pool.
+
+Checks the direct-handoff invariants of ContainerPool under load: grants are
+FIFO, every release hands the worker to exactly one waiter, and no waiter is
+left behind (no lost wake-ups). A second test compares wake-ups per release
+against a notify_all (asyncio.Condition) reference pool.
+"""
+
+import asyncio
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.services.container_pool import ContainerPool
+
+NUM_WAITERS = 1500
+NUM_WORKERS = 4
+# Smaller queue for the comparison: the notify_all baseline is O(waiters) per release.
+NUM_COMPARE_WAITERS = 200
+
+
+class _CountingPool(ContainerPool):
+    """ContainerPool that counts waiters woken by _dispatch."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wakeups = 0
+
+    def _dispatch(self) -> None:
+        waiting = self._waiting
+        super()._dispatch()
+        self.wakeups += waiting - self._waiting
+
+
+class _NotifyAllPool:
+    """Reference pool: every release wakes all waiters, which then re-check for a worker."""
+
+    def __init__(self, workers: list[WorkerInfo]):
+        self._idle = list(workers)
+        self._cond = asyncio.Condition()
+        self.wakeups = 0
+
+    async def acquire(self) -> WorkerInfo:
+        async with self._cond:
+            while not self._idle:
+                await self._cond.wait()
+                self.wakeups += 1
+            return self._idle.pop(0)
+
+    async def release(self, worker: WorkerInfo) -> None:
+        async with self._cond:
+            self._idle.append(worker)
+            self._cond.notify_all()
+
+
+def _workers() -> list[WorkerInfo]:
+    return [
+        WorkerInfo(id=f"w{i}", name=f"w{i}", ip_address="127.0.0.1") for i in range(NUM_WORKERS)
+    ]
+
+
+async def _run_clients(pool, acquire, num_clients: int) -> None:
+    started = asyncio.Event()
+
+    async def client() -> None:
+        worker = await acquire()
+        await started.wait()
+        await asyncio.sleep(0)
+        await pool.release(worker)
+
+    tasks = []
+    for _ in range(num_clients):
+        tasks.append(asyncio.create_task(client()))
+        await asyncio.sleep(0)
+    started.set()
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=120)
+
+
+@pytest.mark.asyncio
+async def test_handoff_is_fifo_without_lost_wakeups():
+    pool = ContainerPool("bench", max_capacity=NUM_WORKERS, acquire_timeout=120)
+    for i in range(NUM_WORKERS):
+        await pool.adopt(WorkerInfo(id=f"w{i}", name=f"w{i}", ip_address="127.0.0.1"))
+
+    order: list[int] = []
+    holders: dict[str, int] = {}
+    max_in_use = 0
+    started = asyncio.Event()
+
+    async def client(i: int) -> None:
+        nonlocal max_in_use
+        worker = await pool.acquire(None)
+        # A worker is never handed to two waiters at once.
+        assert worker.id not in holders
+        holders[worker.id] = i
+        max_in_use = max(max_in_use, len(holders))
+        order.append(i)
+        await started.wait()
+        await asyncio.sleep(0)
+        del holders[worker.id]
+        await pool.release(worker)
+
+    tasks = []
+    for i in range(NUM_WAITERS):
+        tasks.append(asyncio.create_task(client(i)))
+        # Let each client enqueue before the next one, so arrival order is well defined.
+        await asyncio.sleep(0)
+
+    assert pool.stats["waiting"] == NUM_WAITERS - NUM_WORKERS
+    started.set()
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=120)
+
+    # Fairness: the longest-waiting acquirer always gets the next worker.
+    assert order == list(range(NUM_WAITERS))
+    # Handoff: released workers go straight to waiters, capacity is never exceeded.
+    assert max_in_use == NUM_WORKERS
+    # No lost wake-ups: every waiter was served and all workers are back.
+    assert pool.stats["waiting"] == 0
+    assert pool.stats["idle"] == NUM_WORKERS
+
+
+@pytest.mark.asyncio
+async def test_handoff_wakes_one_waiter_per_release_unlike_notify_all():
+    handoff = _CountingPool("bench", max_capacity=NUM_WORKERS, acquire_timeout=120)
+    for worker in _workers():
+        await handoff.adopt(worker)
+    baseline = _NotifyAllPool(_workers())
+
+    await _run_clients(handoff, lambda: handoff.acquire(None), NUM_COMPARE_WAITERS)
+    await _run_clients(baseline, baseline.acquire, NUM_COMPARE_WAITERS)
+
+    queued = NUM_COMPARE_WAITERS - NUM_WORKERS
+    # Direct handoff: each acquirer is resolved exactly once, already holding a worker
+    # (the first NUM_WORKERS without ever blocking).
+    assert handoff.wakeups == NUM_COMPARE_WAITERS
+    # notify_all: each release wakes the whole queue, so wake-ups grow quadratically.
+    assert baseline.wakeups >= queued * queued // (2 * NUM_WORKERS)
+    assert baseline.wakeups > 10 * handoff.wakeups
@@ -0,0 +1,100 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.core.adaptive_limiter import (
+    AIMDLimiter,
+    GradientLimiter,
+    create_adaptive_limiter,
+)
+from services.gateway.models.function import AdaptiveConcurrencyConfig, ScalingConfig
+from services.gateway.services.container_pool import ContainerPool
+
+
+class TestAIMDLimiter:
+    def test_increases_while_latency_is_healthy(self):
+        limiter = AIMDLimiter(initial_limit=2, min_limit=1, max_limit=10)
+
+        for _ in range(5):
+            limiter.on_sample(0.05, in_flight=limiter.limit)
+
+        assert limiter.limit == 7
+
+    def test_does_not_increase_when_limit_is_unused(self):
+        limiter = AIMDLimiter(initial_limit=4, min_limit=1, max_limit=10)
+
+        for _ in range(5):
+            limiter.on_sample(0.05, in_flight=1)
+
+        assert limiter.limit == 4
+
+    def test_backs_off_when_latency_exceeds_baseline(self):
+        limiter = AIMDLimiter(initial_limit=10, min_limit=2, max_limit=10, backoff_ratio=0.5)
+        limiter.on_sample(0.05, in_flight=10)
+
+        limiter.on_sample(0.5, in_flight=10)
+
+        assert limiter.limit == 5
+
+    def test_never_exceeds_bounds(self):
+        limiter = AIMDLimiter(initial_limit=3, min_limit=2, max_limit=3, backoff_ratio=0.1)
+        limiter.on_sample(0.01, in_flight=3)
+        limiter.on_sample(0.01, in_flight=3)
+        assert limiter.limit == 3
+
+        limiter.on_sample(1.0, in_flight=3)
+        assert limiter.limit == 2
+
+
+class TestGradientLimiter:
+    def test_shrinks_when_short_term_latency_rises(self):
+        limiter = GradientLimiter(initial_limit=20, min_limit=1, max_limit=20, smoothing=1.0)
+        for _ in range(50):
+            limiter.on_sample(0.05, in_flight=20)
+        assert limiter.limit == 20
+
+        for _ in range(10):
+            limiter.on_sample(0.5, in_flight=20)
+
+        assert limiter.limit < 20
+
+
+def test_create_adaptive_limiter_respects_config():
+    assert create_adaptive_limiter(None, 5) is None
+    assert create_adaptive_limiter(AdaptiveConcurrencyConfig(enabled=False), 5) is None
+
+    limiter = create_adaptive_limiter(
+        AdaptiveConcurrencyConfig(algorithm="gradient", initial_limit=3), 5
+    )
+    assert isinstance(limiter, GradientLimiter)
+    assert limiter.limit == 3
+    assert limiter.max_limit == 5
+
+
+def test_scaling_config_parses_adaptive_block():
+    scaling = ScalingConfig(**{"max_capacity": 8, "adaptive_concurrency": {"min_limit": 2}})
+
+    assert scaling.adaptive_concurrency is not None
+    assert scaling.adaptive_concurrency.algorithm == "aimd"
+    assert scaling.adaptive_concurrency.min_limit == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_waits_at_adaptive_limit_even_with_capacity():
+    """Pool should not hand out more workers than the adaptive limit allows."""
+    limiter = AIMDLimiter(initial_limit=1, min_limit=1, max_limit=4)
+    pool = ContainerPool("fn", max_capacity=4, acquire_timeout=0.2, limiter=limiter)
+    w1 = WorkerInfo(id="c1", name="w1", ip_address="10.0.0.1")
+    provision = AsyncMock(return_value=[w1])
+
+    worker = await pool.acquire(provision)
+    assert pool.stats["concurrency_limit"] == 1
+
+    with pytest.raises(asyncio.TimeoutError):
+        await pool.acquire(provision)
+
+    await pool.release(worker)
+    assert limiter.limit == 2
+    assert pool.stats["concurrency_limit"] == 2
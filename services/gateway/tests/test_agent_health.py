@@ -0,0 +1,114 @@
+"""
+Tests for Agent connectivity tracking and fail-fast provisioning.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import grpc
+import pytest
+from grpc.aio import AioRpcError, Metadata
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.core.exceptions import AgentUnavailableError
+from services.gateway.models.function import FunctionEntity, ScalingConfig
+from services.gateway.services.agent_health import (
+    HEALTH_SERVING_RESPONSE,
+    AgentConnectivityMonitor,
+)
+from services.gateway.services.pool_manager import PoolManager
+
+
+def _monitor(health_check: AsyncMock, **kwargs) -> AgentConnectivityMonitor:
+    channel = MagicMock()
+    channel.unary_unary.return_value = health_check
+    return AgentConnectivityMonitor(channel, **kwargs)
+
+
+def _rpc_error(code: grpc.StatusCode) -> AioRpcError:
+    return AioRpcError(code, Metadata(), Metadata(), details="boom")
+
+
+def _pool_manager(provision_client, monitor) -> PoolManager:
+    entity = FunctionEntity(name="fn", scaling=ScalingConfig(max_capacity=2))
+    return PoolManager(provision_client, lambda _: entity, agent_monitor=monitor)
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_makes_provisioning_fail_fast_but_warm_workers_serve():
+    monitor = _monitor(AsyncMock(side_effect=_rpc_error(grpc.StatusCode.UNAVAILABLE)))
+    provision_client = MagicMock()
+    provision_client.provision = AsyncMock(
+        return_value=[WorkerInfo(id="c1", name="c1", ip_address="10.0.0.1")]
+    )
+    manager = _pool_manager(provision_client, monitor)
+
+    warm = await manager.acquire_worker("fn")
+    await manager.release_worker("fn", warm)
+
+    assert await monitor.probe() is False
+    assert monitor.available is False
+
+    # Idle worker is still handed out.
+    assert (await manager.acquire_worker("fn")).id == "c1"
+
+    # Anything that needs provisioning fails immediately without calling the Agent.
+    with pytest.raises(AgentUnavailableError):
+        await manager.acquire_worker("fn")
+    assert provision_client.provision.await_count == 1
+    assert (await manager.get_pool("fn")).stats["provisioning"] == 0
+
+
+@pytest.mark.asyncio
+async def test_successful_probe_resumes_provisioning():
+    health_check = AsyncMock(
+        side_effect=[_rpc_error(grpc.StatusCode.UNAVAILABLE), HEALTH_SERVING_RESPONSE]
+    )
+    monitor = _monitor(health_check)
+
+    assert await monitor.probe() is False
+    assert await monitor.probe() is True
+
+    monitor.check("fn")
+    assert monitor.stats["consecutive_failures"] == 0
+
+
+@pytest.mark.asyncio
+async def test_not_serving_response_marks_unavailable():
+    monitor = _monitor(AsyncMock(return_value=b"\x08\x02"))
+
+    assert await monitor.probe() is False
+    with pytest.raises(AgentUnavailableError, match="NOT_SERVING"):
+        monitor.check("fn")
+
+
+@pytest.mark.asyncio
+async def test_probe_backoff_grows_and_caps():
+    monitor = _monitor(
+        AsyncMock(side_effect=_rpc_error(grpc.StatusCode.UNAVAILABLE)),
+        probe_interval=5.0,
+        backoff_initial=0.5,
+        backoff_max=2.0,
+    )
+    assert monitor._next_probe_delay() == 5.0
+
+    delays = []
+    for _ in range(4):
+        await monitor.probe()
+        delays.append(monitor._next_probe_delay())
+
+    assert delays == [0.5, 1.0, 2.0, 2.0]
+
+
+def test_unavailable_rpc_error_and_channel_failure_mark_agent_down():
+    monitor = _monitor(AsyncMock())
+
+    monitor.observe_error(_rpc_error(grpc.StatusCode.INVALID_ARGUMENT))
+    assert monitor.available is True
+
+    monitor.observe_error(_rpc_error(grpc.StatusCode.UNAVAILABLE))
+    assert monitor.available is False
+
+    other = _monitor(AsyncMock())
+    other._on_channel_state(grpc.ChannelConnectivity.TRANSIENT_FAILURE)
+    assert other.available is False
+    assert other.stats["channel_state"] == "TRANSIENT_FAILURE"
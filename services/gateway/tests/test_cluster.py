@@ -0,0 +1,190 @@
+"""
+Tests for cluster mode (function ownership across gateway replicas).
+"""
+
+import json
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.api.deps import get_cluster_router, get_lambda_invoker
+from services.gateway.config import GatewayConfig
+from services.gateway.models.function import FunctionEntity, ScalingConfig
+from services.gateway.models.result import InvocationResult
+from services.gateway.services.cluster import (
+    ClusterRouter,
+    FileMembership,
+    StaticMembership,
+    parse_cluster_members,
+)
+from services.gateway.services.lambda_invoker import LambdaInvoker
+from services.gateway.services.pool_manager import PoolManager
+
+MEMBERS = {"gw-a": "http://gw-a:8000", "gw-b": "http://gw-b:8000"}
+
+
+async def _router(self_id: str, pool_manager=None, client=None) -> ClusterRouter:
+    router = ClusterRouter(
+        self_id,
+        StaticMembership(MEMBERS),
+        pool_manager or MagicMock(),
+        client or AsyncMock(),
+        shared_secret="s3cret",
+    )
+    router.pool_manager.get_all_worker_names.return_value = {}
+    await router.refresh()
+    return router
+
+
+def _function_owned_by(router: ClusterRouter, owner: str) -> str:
+    return next(f"fn-{n}" for n in range(100) if router.owner_of(f"fn-{n}") == owner)
+
+
+def test_parse_cluster_members():
+    assert parse_cluster_members(" gw-a=http://gw-a:8000/ , gw-b=http://gw-b:8000") == MEMBERS
+    with pytest.raises(ValueError):
+        parse_cluster_members("gw-a")
+
+
+@pytest.mark.asyncio
+async def test_every_function_has_exactly_one_owner():
+    a = await _router("gw-a")
+    b = await _router("gw-b")
+
+    names = [f"fn-{n}" for n in range(50)]
+
+    assert all(a.owns(name) != b.owns(name) for name in names)
+    assert {a.owner_of(name) for name in names} == {"gw-a", "gw-b"}
+
+
+@pytest.mark.asyncio
+async def test_invoker_forwards_functions_owned_by_another_replica():
+    cluster = MagicMock()
+    cluster.owns.return_value = False
+    cluster.forward = AsyncMock(return_value=InvocationResult(success=True, status_code=200))
+    registry = MagicMock()
+    registry.get_function_config.return_value = FunctionEntity(name="fn")
+    backend = AsyncMock()
+    invoker = LambdaInvoker(AsyncMock(), registry, GatewayConfig(), backend, cluster=cluster)
+
+    result = await invoker.invoke_function("fn", b"{}")
+
+    assert result.success
+    backend.acquire_worker.assert_not_awaited()
+
+    # A forwarded invocation always runs locally (no forwarding loops).
+    backend.acquire_worker.side_effect = RuntimeError("no worker")
+    await invoker.invoke_function("fn", b"{}", forwarded=True)
+    cluster.forward.assert_awaited_once()
+    backend.acquire_worker.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_forward_runs_on_owner_endpoint(main_app, async_client):
+    owner_invoker = MagicMock()
+    owner_invoker.invoke_function = AsyncMock(
+        return_value=InvocationResult(
+            success=True, status_code=200, payload=b'{"ok": true}', headers={"X-Custom": "1"}
+        )
+    )
+    owner = await _router("gw-b")
+    main_app.dependency_overrides[get_lambda_invoker] = lambda: owner_invoker
+    main_app.dependency_overrides[get_cluster_router] = lambda: owner
+    sender = await _router("gw-a", client=async_client)
+    sender._urls = {member: "" for member in MEMBERS}
+    function_name = _function_owned_by(sender, "gw-b")
+    try:
+        result = await sender.forward(function_name, b"{}", {}, timeout=30)
+    finally:
+        main_app.dependency_overrides = {}
+
+    assert result.success and result.payload == b'{"ok": true}'
+    assert result.headers["x-custom"] == "1"
+    owner_invoker.invoke_function.assert_awaited_once()
+    assert owner_invoker.invoke_function.await_args.kwargs["forwarded"] is True
+    assert (sender.counts["forwarded"], owner.counts["received"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_forward_falls_back_when_owner_rejects(main_app, async_client):
+    owner = await _router("gw-b")
+    owner.shared_secret = "other"
+    main_app.dependency_overrides[get_cluster_router] = lambda: owner
+    sender = await _router("gw-a", client=async_client)
+    sender._urls = {member: "" for member in MEMBERS}
+    try:
+        result = await sender.forward(_function_owned_by(sender, "gw-b"), b"{}", {}, timeout=30)
+    finally:
+        main_app.dependency_overrides = {}
+
+    assert result is None
+    assert sender.counts["forward_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_moved_function_is_handed_off_to_the_new_owner():
+    client = AsyncMock()
+    client.post.return_value = httpx.Response(202, request=httpx.Request("POST", "http://gw-b"))
+    provision_client = AsyncMock()
+    manager = PoolManager(
+        provision_client,
+        lambda name: FunctionEntity(name=name, scaling=ScalingConfig(min_capacity=1)),
+    )
+    router = ClusterRouter("gw-a", StaticMembership(MEMBERS), manager, client, "s3cret")
+    router.ring.sync(MEMBERS)
+    router._urls = dict(MEMBERS)
+    function_name = _function_owned_by(router, "gw-b")
+    pool = await manager.get_pool(function_name)
+    await pool.adopt(WorkerInfo(id="c1", name="c1", ip_address="10.0.0.1"))
+
+    assert await router.hand_off_moved() == {function_name: 1}
+
+    provision_client.delete_container.assert_awaited_once_with("c1")
+    assert pool.size == 0
+    assert client.post.await_args.args[0] == "http://gw-b:8000/_cluster/handoff"
+    assert client.post.await_args.kwargs["json"] == {"function_name": function_name, "count": 1}
+
+
+@pytest.mark.asyncio
+async def test_non_owned_functions_are_not_kept_warm():
+    provision_client = AsyncMock()
+    manager = PoolManager(
+        provision_client,
+        lambda name: FunctionEntity(name=name, scaling=ScalingConfig(min_capacity=1)),
+    )
+    manager.owns = lambda name: name != "remote"
+
+    assert await manager.ensure_min_capacity(["remote"]) == {}
+    assert await manager.prewarm_for_schedule("remote") == "remote"
+    assert await manager.warm_up("remote", 2) == 0
+    provision_client.provision.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_file_registry_drops_stale_members(tmp_path):
+    a = FileMembership(str(tmp_path), "gw-a", "http://gw-a:8000", ttl=15.0)
+    b = FileMembership(str(tmp_path), "gw-b", "http://gw-b:8000/", ttl=15.0)
+
+    await b.members()
+    assert await a.members() == MEMBERS
+
+    stale = time.time() - 60
+    os.utime(b.path, (stale, stale))
+    assert await a.members() == {"gw-a": "http://gw-a:8000"}
+
+    a.leave()
+    assert not os.path.exists(a.path)
+    assert json.loads(open(b.path).read())["id"] == "gw-b"
+
+
+@pytest.mark.asyncio
+async def test_router_without_secret_rejects_everything():
+    router = await _router("gw-a")
+    router.shared_secret = ""
+
+    assert not router.authorize("")
+    assert not router.authorize(None)
@@ -4,6 +4,9 @@ What: Validate default GatewayConfig values for critical flags.
 Why: Keep config defaults stable as environment defaults evolve.
 """
 
+import pytest
+from pydantic import ValidationError
+
 from services.gateway.config import GatewayConfig
 
 
@@ -23,3 +26,34 @@ def test_agent_invoke_proxy_default_false(monkeypatch):
     config = GatewayConfig(_env_file=None)
 
     assert config.AGENT_INVOKE_PROXY is False
+
+
+def test_opt_in_pool_features_default_off(monkeypatch):
+    _set_required_env(monkeypatch)
+    for name in (
+        "SCHEDULE_PREWARM_LEAD_SECONDS",
+        "PROVISION_MAX_CONCURRENCY",
+        "PROVISION_BATCH_SIZE",
+        "IDLE_HEALTH_CHECK_INTERVAL",
+    ):
+        monkeypatch.delenv(name, raising=False)
+
+    config = GatewayConfig(_env_file=None)
+
+    assert config.SCHEDULE_PREWARM_LEAD_SECONDS == 0
+    assert config.PROVISION_MAX_CONCURRENCY == 0
+    assert config.PROVISION_BATCH_SIZE == 1
+    assert config.IDLE_HEALTH_CHECK_INTERVAL == 0
+
+
+@pytest.mark.parametrize("mode", ["static", "file"])
+def test_cluster_mode_requires_shared_secret(monkeypatch, mode):
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("CLUSTER_MODE", mode)
+    monkeypatch.delenv("CLUSTER_SHARED_SECRET", raising=False)
+
+    with pytest.raises(ValidationError, match="CLUSTER_SHARED_SECRET"):
+        GatewayConfig(_env_file=None)
+
+    monkeypatch.setenv("CLUSTER_SHARED_SECRET", "s3cret")
+    assert GatewayConfig(_env_file=None).CLUSTER_MODE == mode
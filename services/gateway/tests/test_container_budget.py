@@ -0,0 +1,100 @@
+"""
+Tests for the gateway-wide container budget.
+"""
+
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.core.container_budget import BudgetCandidate, ContainerBudget
+from services.gateway.core.exceptions import ContainerBudgetExceededError
+from services.gateway.models.function import FunctionEntity, ScalingConfig
+from services.gateway.services.pool_manager import PoolManager
+
+
+def _worker(worker_id: str, last_used_at: float = 0.0) -> WorkerInfo:
+    return WorkerInfo(
+        id=worker_id, name=worker_id, ip_address="10.0.0.1", last_used_at=last_used_at
+    )
+
+
+class _Provisioner:
+    def __init__(self):
+        self.calls = 0
+        self.delete_container = AsyncMock()
+
+    async def provision(self, function_name):
+        self.calls += 1
+        worker_id = f"{function_name}-{self.calls}"
+        return [_worker(worker_id)]
+
+
+def _manager(budget, entities):
+    provisioner = _Provisioner()
+    manager = PoolManager(provisioner, lambda name: entities.get(name), budget=budget)
+    return manager, provisioner
+
+
+def _entities(**memory):
+    return {
+        name: FunctionEntity(name=name, memory_size=mb, scaling=ScalingConfig(max_capacity=5))
+        for name, mb in memory.items()
+    }
+
+
+def test_victims_prefer_long_idle_and_cheap_cold_start():
+    budget = ContainerBudget(max_containers=2)
+    cheap = BudgetCandidate("cheap", _worker("a"), 128, idle_seconds=60, cold_start_seconds=0.5)
+    costly = BudgetCandidate("costly", _worker("b"), 128, idle_seconds=60, cold_start_seconds=5)
+    recent = BudgetCandidate("cheap", _worker("c"), 128, idle_seconds=1, cold_start_seconds=0.5)
+
+    victims = budget.select_victims([costly, recent, cheap], containers=3, memory_mb=0)
+
+    assert [v.worker.id for v in victims] == ["a"]
+    assert budget.select_victims([], containers=3, memory_mb=0) is None
+
+
+@pytest.mark.asyncio
+async def test_full_budget_evicts_idle_worker_of_other_function():
+    manager, provisioner = _manager(ContainerBudget(max_containers=2), _entities(a=None, b=None))
+    old = time.time() - 600
+    pool_a = await manager.get_pool("a")
+    await pool_a.adopt(_worker("a-old", last_used_at=old))
+    await pool_a.adopt(_worker("a-new", last_used_at=time.time()))
+
+    worker = await manager.acquire_worker("b")
+
+    assert worker.id == "b-1"
+    provisioner.delete_container.assert_awaited_once_with("a-old")
+    assert [w.id for w in pool_a.get_all_workers()] == ["a-new"]
+    assert manager.budget_stats["containers"] == 2
+    assert manager.budget_stats["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_budget_rejects_when_nothing_is_reclaimable():
+    manager, provisioner = _manager(
+        ContainerBudget(max_memory_mb=1024), _entities(big=768, small=256)
+    )
+    busy = await manager.acquire_worker("big")
+
+    await manager.acquire_worker("small")
+    with pytest.raises(ContainerBudgetExceededError):
+        await manager.acquire_worker("small")
+
+    provisioner.delete_container.assert_not_called()
+    assert manager.budget_stats["rejections"] == 1
+    assert busy.id == "big-1"
+
+
+@pytest.mark.asyncio
+async def test_warm_up_does_not_evict_other_functions():
+    manager, provisioner = _manager(ContainerBudget(max_containers=1), _entities(a=None, b=None))
+    await (await manager.get_pool("a")).adopt(_worker("a-1", last_used_at=time.time() - 600))
+
+    with pytest.raises(ContainerBudgetExceededError):
+        await manager.warm_up("b", 1)
+    provisioner.delete_container.assert_not_called()
+    assert (await manager.get_pool("b")).size == 0
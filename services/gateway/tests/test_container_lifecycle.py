@@ -0,0 +1,162 @@
+"""
+Tests for the bounded-parallel container lifecycle executor.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import grpc
+import pytest
+from grpc.aio import AioRpcError, Metadata
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.models.function import FunctionEntity, ScalingConfig
+from services.gateway.services.container_lifecycle import ContainerLifecycleExecutor
+from services.gateway.services.pool_manager import PoolManager
+
+
+def _rpc_error(code: grpc.StatusCode) -> AioRpcError:
+    return AioRpcError(code, Metadata(), Metadata(), details="boom")
+
+
+class SlowAgent:
+    def __init__(self, failures: int = 0, code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE):
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+        self.failures = failures
+        self.code = code
+
+    async def delete_container(self, container_id: str) -> None:
+        self.calls.append(container_id)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if self.failures:
+                self.failures -= 1
+                raise _rpc_error(self.code)
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_destroy_many_is_bounded_and_parallel():
+    agent = SlowAgent()
+    executor = ContainerLifecycleExecutor(agent, max_parallel=4)
+
+    deleted = await executor.destroy_many(f"c{i}" for i in range(20))
+
+    assert deleted == 20
+    assert agent.peak == 4
+    assert executor.stats["completed"] == 20
+
+
+@pytest.mark.asyncio
+async def test_concurrent_destroy_of_same_container_is_deduplicated():
+    agent = SlowAgent()
+    executor = ContainerLifecycleExecutor(agent)
+
+    first = asyncio.create_task(executor.destroy("c1"))
+    await asyncio.sleep(0)
+    assert executor.deleting_ids == {"c1"}
+    results = await asyncio.gather(first, executor.destroy("c1"))
+
+    assert results == [True, True]
+    assert agent.calls == ["c1"]
+    assert executor.deleting_ids == set()
+
+
+@pytest.mark.asyncio
+async def test_failed_call_is_retried_with_backoff():
+    agent = SlowAgent(failures=2)
+    executor = ContainerLifecycleExecutor(agent, retries=2, backoff_seconds=0.001)
+
+    assert await executor.destroy("c1") is True
+    assert agent.calls == ["c1", "c1", "c1"]
+    assert executor.stats["retried"] == 2
+
+    agent.failures = 5
+    assert await executor.destroy("c2") is False
+    assert executor.stats["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_non_transient_errors_are_not_retried():
+    agent = SlowAgent(failures=1, code=grpc.StatusCode.INVALID_ARGUMENT)
+    executor = ContainerLifecycleExecutor(agent, retries=2, backoff_seconds=0.001)
+
+    assert await executor.destroy("c1") is False
+    assert agent.calls == ["c1"]
+    assert executor.stats["retried"] == 0
+    assert executor.stats["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_destroy_of_missing_container_counts_as_done():
+    agent = SlowAgent(failures=1, code=grpc.StatusCode.NOT_FOUND)
+    executor = ContainerLifecycleExecutor(agent, retries=2, backoff_seconds=0.001)
+
+    assert await executor.destroy("c1") is True
+    assert agent.calls == ["c1"]
+    assert executor.stats["completed"] == 1
+    assert executor.stats["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_resume_without_retry_makes_a_single_attempt():
+    client = AsyncMock()
+    client.resume_container.side_effect = _rpc_error(grpc.StatusCode.UNAVAILABLE)
+    executor = ContainerLifecycleExecutor(client, retries=2, backoff_seconds=0.001)
+    worker = WorkerInfo(id="c1", name="c1", ip_address="10.0.0.1")
+
+    with pytest.raises(AioRpcError):
+        await executor.resume("fn", worker, retry=False)
+    assert client.resume_container.await_count == 1
+
+    with pytest.raises(AioRpcError):
+        await executor.resume("fn", worker)
+    assert client.resume_container.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_acquire_does_not_retry_a_failed_resume():
+    client = AsyncMock()
+    client.resume_container.side_effect = _rpc_error(grpc.StatusCode.UNAVAILABLE)
+    client.provision.return_value = [WorkerInfo(id="c2", name="c2", ip_address="10.0.0.2")]
+    entity = FunctionEntity(name="fn", scaling=ScalingConfig(max_capacity=2))
+    manager = PoolManager(
+        client,
+        lambda _: entity,
+        lifecycle=ContainerLifecycleExecutor(client, retries=2, backoff_seconds=0.001),
+        pause_enabled=True,
+        pause_idle_seconds=60.0,
+    )
+    pool = await manager.get_pool("fn")
+    paused = WorkerInfo(id="c1", name="c1", ip_address="10.0.0.1")
+    await pool.adopt(paused)
+    manager._mark_paused(pool, paused.id, True)
+
+    worker = await manager.acquire_worker("fn")
+
+    assert worker.id == "c2"
+    assert client.resume_container.await_count == 1
+    assert pool.size == 1
+
+
+@pytest.mark.asyncio
+async def test_shutdown_waits_for_in_flight_invocations():
+    client = AsyncMock()
+    client.provision.return_value = [WorkerInfo(id="c1", name="c1", ip_address="10.0.0.1")]
+    entity = FunctionEntity(name="fn", scaling=ScalingConfig(max_capacity=1))
+    manager = PoolManager(client, lambda _: entity)
+    worker = await manager.acquire_worker("fn")
+
+    shutdown = asyncio.create_task(manager.shutdown_all(drain_timeout=5.0))
+    await asyncio.sleep(0.1)
+    client.delete_container.assert_not_awaited()
+
+    await manager.release_worker("fn", worker)
+    await shutdown
+
+    client.delete_container.assert_awaited_once_with("c1")
@@ -170,6 +170,47 @@ class TestContainerPoolRelease:
         result = await asyncio.wait_for(acquire_task, timeout=1.0)
         assert result.id == "c1"
 
+    @pytest.mark.asyncio
+    async def test_release_hands_off_to_longest_waiter(self, pool):
+        """release() should hand the worker to the oldest waiter only"""
+        from services.common.models.internal import WorkerInfo
+
+        worker = WorkerInfo(id="c1", name="w1", ip_address="10.0.0.1")
+        pool._all_workers[worker.id] = worker
+        pool._all_workers["c2"] = WorkerInfo(id="c2", name="w2", ip_address="10.0.0.2")
+
+        first = asyncio.create_task(pool.acquire(AsyncMock()))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(pool.acquire(AsyncMock()))
+        await asyncio.sleep(0.01)
+
+        await pool.release(worker)
+
+        assert (await asyncio.wait_for(first, timeout=1.0)).id == "c1"
+        await asyncio.sleep(0.01)
+        assert not second.done()
+        assert pool.stats["waiting"] == 1
+        second.cancel()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_consume_worker(self, pool):
+        """A cancelled waiter must not swallow a handed-off worker"""
+        from services.common.models.internal import WorkerInfo
+
+        worker = WorkerInfo(id="c1", name="w1", ip_address="10.0.0.1")
+        pool._all_workers[worker.id] = worker
+        pool._all_workers["c2"] = WorkerInfo(id="c2", name="w2", ip_address="10.0.0.2")
+
+        cancelled = asyncio.create_task(pool.acquire(AsyncMock()))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+
+        await pool.release(worker)
+
+        assert pool.stats["waiting"] == 0
+        assert await pool.is_idle("c1")
+
 
 class TestContainerPoolEvict:
     """Tests for ContainerPool.evict() method"""
@@ -262,3 +303,219 @@ class TestContainerPoolConcurrency:
 
         assert len(successes) == 3
         assert len(timeouts) == 2
+
+
+class TestContainerPoolSlots:
+    """Tests for per_worker_concurrency (multiple invocations per worker)"""
+
+    @pytest.fixture
+    def pool(self):
+        from services.gateway.services.container_pool import ContainerPool
+
+        return ContainerPool(
+            function_name="test-function",
+            max_capacity=2,
+            acquire_timeout=1.0,
+            per_worker_concurrency=3,
+        )
+
+    @staticmethod
+    def _provisioner():
+        from services.common.models.internal import WorkerInfo
+
+        calls = []
+
+        async def provision_callback(fn):
+            worker_id = f"c{len(calls) + 1}"
+            calls.append(worker_id)
+            await asyncio.sleep(0.05)
+            return [WorkerInfo(id=worker_id, name=worker_id, ip_address="10.0.0.1")]
+
+        return provision_callback, calls
+
+    @pytest.mark.asyncio
+    async def test_concurrent_burst_shares_one_worker(self, pool):
+        """A burst within one worker's slots provisions a single container"""
+        provision, calls = self._provisioner()
+
+        workers = await asyncio.gather(*(pool.acquire(provision) for _ in range(3)))
+
+        assert calls == ["c1"]
+        assert {w.id for w in workers} == {"c1"}
+        assert pool.stats["in_flight"] == 3
+        assert pool.size == 1
+
+    @pytest.mark.asyncio
+    async def test_capacity_is_counted_in_slots(self, pool):
+        """Slots beyond one worker provision the next one, up to max_capacity"""
+        provision, calls = self._provisioner()
+        pool.acquire_timeout = 0.3
+
+        results = await asyncio.gather(
+            *(pool.acquire(provision) for _ in range(7)), return_exceptions=True
+        )
+
+        successes = [r for r in results if not isinstance(r, Exception)]
+        assert len(successes) == 6
+        assert sorted(calls) == ["c1", "c2"]
+        assert pool.stats["busy"] == 2
+
+    @pytest.mark.asyncio
+    async def test_least_loaded_worker_gets_next_slot(self, pool):
+        """Busy workers with free slots are filled least-loaded first"""
+        provision, calls = self._provisioner()
+        first = await asyncio.gather(*(pool.acquire(provision) for _ in range(5)))
+        assert sorted(calls) == ["c1", "c2"]
+        assert sorted(w.id for w in first) == ["c1", "c1", "c1", "c2", "c2"]
+
+        # Free two slots of c1 so it is the least loaded worker (1 vs 2).
+        c1 = next(w for w in first if w.id == "c1")
+        await pool.release(c1)
+        await pool.release(c1)
+
+        worker = await pool.acquire(provision)
+        assert worker.id == "c1"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_worker_idle_only_after_all_slots_return(self, pool):
+        """A worker returns to the idle set when its last slot is released"""
+        provision, _ = self._provisioner()
+        a, b = await asyncio.gather(pool.acquire(provision), pool.acquire(provision))
+        assert a.id == b.id
+
+        await pool.release(a)
+        assert not await pool.is_idle(a.id)
+        await pool.release(b)
+        assert await pool.is_idle(a.id)
+        assert pool.stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_evicted_worker_is_not_readded_by_other_slots(self, pool):
+        """Releasing other slots of an evicted worker does not resurrect it"""
+        provision, _ = self._provisioner()
+        a, b = await asyncio.gather(pool.acquire(provision), pool.acquire(provision))
+
+        await pool.evict(a)
+        await pool.release(b)
+
+        assert pool.size == 0
+        assert pool.stats["in_flight"] == 0
+
+
+class TestContainerPoolSelectionPolicy:
+    """Tests for idle-worker selection policies (mru / fifo / least_invocations)"""
+
+    @staticmethod
+    def _provisioner():
+        from services.common.models.internal import WorkerInfo
+
+        calls = []
+
+        async def provision_callback(fn):
+            worker_id = f"c{len(calls) + 1}"
+            calls.append(worker_id)
+            return [WorkerInfo(id=worker_id, name=worker_id, ip_address="10.0.0.1")]
+
+        return provision_callback
+
+    @staticmethod
+    async def _warm_pool(policy, size=3):
+        from services.gateway.services.container_pool import ContainerPool
+
+        pool = ContainerPool("fn", max_capacity=10, acquire_timeout=1.0, selection_policy=policy)
+        provision = TestContainerPoolSelectionPolicy._provisioner()
+        workers = [await pool.acquire(provision) for _ in range(size)]
+        for worker in workers:
+            await pool.release(worker)
+        return pool, provision
+
+    @pytest.mark.asyncio
+    async def test_mru_reuses_most_recently_released(self):
+        pool, provision = await self._warm_pool("mru")
+
+        for _ in range(3):
+            worker = await pool.acquire(provision)
+            assert worker.id == "c3"
+            await pool.release(worker)
+
+    @pytest.mark.asyncio
+    async def test_fifo_rotates_through_idle_workers(self):
+        pool, provision = await self._warm_pool("fifo")
+
+        seen = []
+        for _ in range(3):
+            worker = await pool.acquire(provision)
+            seen.append(worker.id)
+            await pool.release(worker)
+        assert seen == ["c1", "c2", "c3"]
+
+    @pytest.mark.asyncio
+    async def test_least_invocations_picks_least_used(self):
+        pool, provision = await self._warm_pool("least_invocations")
+        c1 = await pool.acquire(provision)
+        await pool.release(c1)
+
+        worker = await pool.acquire(provision)
+        assert worker.id != c1.id
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("policy", ["mru", "fifo", "least_invocations"])
+    async def test_running_workers_are_taken_before_paused(self, policy):
+        pool, provision = await self._warm_pool(policy)
+        pool.set_paused("c1", True)
+        pool.set_paused("c3", True)
+        assert pool.paused_idle_count == 2
+
+        first = await pool.acquire(provision)
+        # Resumed while idle: it becomes a running candidate again.
+        pool.set_paused("c3", False)
+        rest = [await pool.acquire(provision) for _ in range(2)]
+
+        assert [w.id for w in (first, *rest)] == ["c2", "c3", "c1"]
+        assert pool.paused_idle_count == 0
+
+    def test_unknown_policy_is_rejected(self):
+        from services.gateway.services.container_pool import ContainerPool
+
+        with pytest.raises(ValueError):
+            ContainerPool("fn", selection_policy="random")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("policy", ["mru", "fifo"])
+    async def test_simulated_container_hours_after_spike(self, policy, monkeypatch):
+        """
+        Spike to 10 workers, then 5 minutes of steady load needing 2 workers.
+
+        MRU lets the 8 surplus workers reach the idle timeout; FIFO keeps touching
+        all of them, so the pool never shrinks.
+        """
+        from services.gateway.services import container_pool as module
+
+        clock = {"now": 1000.0}
+        monkeypatch.setattr(module.time, "time", lambda: clock["now"])
+        pool = module.ContainerPool(
+            "fn", max_capacity=10, acquire_timeout=1.0, selection_policy=policy
+        )
+        provision = self._provisioner()
+
+        spike = await asyncio.gather(*(pool.acquire(provision) for _ in range(10)))
+        for worker in spike:
+            await pool.release(worker)
+
+        container_seconds = 0
+        for _ in range(300):
+            clock["now"] += 1.0
+            busy = [await pool.acquire(provision) for _ in range(2)]
+            for worker in busy:
+                await pool.release(worker)
+            await pool.prune_idle_workers(idle_timeout=30.0)
+            container_seconds += pool.size
+
+        if policy == "mru":
+            assert pool.size == 2
+            # ~10 workers for the 30s timeout, then 2: about 70% fewer container-hours.
+            assert container_seconds < 0.35 * 10 * 300
+        else:
+            assert pool.size == 10
+            assert container_seconds == 10 * 300
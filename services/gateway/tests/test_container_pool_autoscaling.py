@@ -109,8 +109,9 @@ async def test_adopt_respects_max_capacity():
     acquired1 = await pool.acquire(mock_list_empty)
     acquired2 = await pool.acquire(mock_list_empty)
 
-    assert acquired1.id == "c1"
-    assert acquired2.id == "c2"
+    # Default MRU selection hands out the most recently adopted worker first.
+    assert acquired1.id == "c2"
+    assert acquired2.id == "c1"
 
     # Now try to acquire a 3rd (should timeout - no capacity left)
     async def mock_provision_should_not_be_called(fn):
@@ -0,0 +1,89 @@
+"""
+Tests for priority-ordered waiters in ContainerPool.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.core.invocation_context import (
+    InvocationPriority,
+    get_invocation_priority,
+    invocation_priority,
+)
+from services.gateway.services.container_pool import ContainerPool
+
+
+def _worker(worker_id: str) -> WorkerInfo:
+    return WorkerInfo(id=worker_id, name=worker_id, ip_address="10.0.0.1")
+
+
+async def _hold_single_worker(pool: ContainerPool) -> WorkerInfo:
+    return await pool.acquire(AsyncMock(return_value=[_worker("c1")]))
+
+
+@pytest.mark.asyncio
+async def test_interactive_waiter_is_served_before_older_scheduled_waiter():
+    pool = ContainerPool("fn", max_capacity=1, acquire_timeout=2.0)
+    worker = await _hold_single_worker(pool)
+    order = []
+
+    async def waiter(name, priority):
+        acquired = await pool.acquire(AsyncMock(), priority=priority)
+        order.append(name)
+        await pool.release(acquired)
+
+    scheduled = asyncio.create_task(waiter("scheduled", InvocationPriority.SCHEDULED))
+    await asyncio.sleep(0.01)
+    interactive = asyncio.create_task(waiter("interactive", InvocationPriority.INTERACTIVE))
+    await asyncio.sleep(0.01)
+
+    await pool.release(worker)
+    await asyncio.wait_for(asyncio.gather(scheduled, interactive), timeout=1.0)
+
+    assert order == ["interactive", "scheduled"]
+
+
+@pytest.mark.asyncio
+async def test_aging_prevents_starvation():
+    pool = ContainerPool("fn", max_capacity=1, acquire_timeout=2.0, priority_aging_seconds=0.05)
+    worker = await _hold_single_worker(pool)
+    order = []
+
+    async def waiter(name, priority):
+        acquired = await pool.acquire(AsyncMock(), priority=priority)
+        order.append(name)
+        await pool.release(acquired)
+
+    async_task = asyncio.create_task(waiter("async", InvocationPriority.ASYNC))
+    # Wait longer than two aging periods so ASYNC now ranks above a fresh INTERACTIVE waiter.
+    await asyncio.sleep(0.15)
+    interactive = asyncio.create_task(waiter("interactive", InvocationPriority.INTERACTIVE))
+    await asyncio.sleep(0.01)
+
+    await pool.release(worker)
+    await asyncio.wait_for(asyncio.gather(async_task, interactive), timeout=1.0)
+
+    assert order == ["async", "interactive"]
+
+
+@pytest.mark.asyncio
+async def test_reserved_capacity_is_kept_for_interactive():
+    pool = ContainerPool("fn", max_capacity=2, acquire_timeout=0.1, reserved_interactive=1)
+    provision = AsyncMock(side_effect=[[_worker("c1")], [_worker("c2")]])
+
+    await pool.acquire(provision, priority=InvocationPriority.SCHEDULED)
+    with pytest.raises(asyncio.TimeoutError):
+        await pool.acquire(provision, priority=InvocationPriority.ASYNC)
+
+    worker = await pool.acquire(provision, priority=InvocationPriority.INTERACTIVE)
+    assert worker.id == "c2"
+
+
+def test_invocation_priority_context_resets():
+    assert get_invocation_priority() == InvocationPriority.INTERACTIVE
+    with invocation_priority(InvocationPriority.SCHEDULED):
+        assert get_invocation_priority() == InvocationPriority.SCHEDULED
+    assert get_invocation_priority() == InvocationPriority.INTERACTIVE
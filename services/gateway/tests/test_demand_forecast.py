@@ -0,0 +1,115 @@
+"""
+Tests for demand forecasting and scale-ahead provisioning.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.core.demand_forecast import DemandForecaster, HoltEstimator
+from services.gateway.models.function import FunctionEntity, ScalingConfig
+from services.gateway.services.container_pool import ContainerPool
+from services.gateway.services.pool_manager import PoolManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _feed(forecaster: DemandForecaster, clock: FakeClock, peaks) -> None:
+    for peak in peaks:
+        for demand in range(1, peak + 1):
+            forecaster.on_arrival(demand)
+        for demand in range(peak - 1, -1, -1):
+            forecaster.on_release(demand, service_time=0.5)
+        clock.now += forecaster.window_seconds
+
+
+def test_holt_extrapolates_trend():
+    estimator = HoltEstimator(alpha=0.5, beta=0.5)
+    for value in [1, 2, 3, 4, 5, 6]:
+        estimator.update(value)
+
+    assert estimator.forecast(1) > 6
+    assert estimator.forecast(3) > estimator.forecast(1)
+
+
+def test_ramp_is_forecast_ahead_of_current_peak():
+    clock = FakeClock()
+    forecaster = DemandForecaster(window_seconds=1.0, horizon_seconds=2.0, clock=clock)
+
+    _feed(forecaster, clock, [1, 2, 3, 4, 5, 6])
+
+    assert forecaster.forecast_concurrency() > 6
+    assert forecaster.stats["windows"] == 6
+
+
+def test_steady_load_has_low_forecast_error():
+    clock = FakeClock()
+    forecaster = DemandForecaster(window_seconds=1.0, horizon_seconds=1.0, clock=clock)
+
+    _feed(forecaster, clock, [3] * 20)
+
+    stats = forecaster.stats
+    assert stats["forecast_error"] < 0.1
+    assert round(stats["forecast_concurrency"]) == 3
+    assert stats["service_time_ms"] == 500.0
+
+
+def test_long_idle_gap_resets_estimators():
+    clock = FakeClock()
+    forecaster = DemandForecaster(window_seconds=1.0, clock=clock)
+    _feed(forecaster, clock, [5, 5, 5])
+
+    clock.now += 10_000
+
+    assert forecaster.forecast_concurrency() == 0.0
+    assert forecaster.stats["windows"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_reports_cold_start_percentage():
+    pool = ContainerPool("fn", max_capacity=2)
+    provision = AsyncMock(return_value=[WorkerInfo(id="c1", name="c1", ip_address="10.0.0.1")])
+
+    worker = await pool.acquire(provision)
+    await pool.release(worker)
+    worker = await pool.acquire(provision)
+    await pool.release(worker)
+
+    stats = pool.stats
+    assert stats["acquired"] == 2
+    assert stats["cold_starts"] == 1
+    assert stats["cold_start_pct"] == 50.0
+
+
+@pytest.mark.asyncio
+async def test_scale_ahead_provisions_to_forecast_target():
+    calls = []
+
+    class Provisioner:
+        async def provision(self, function_name):
+            calls.append(function_name)
+            worker_id = f"c{len(calls)}"
+            return [WorkerInfo(id=worker_id, name=worker_id, ip_address="10.0.0.1")]
+
+    entity = FunctionEntity(name="fn", scaling=ScalingConfig(max_capacity=20))
+    manager = PoolManager(Provisioner(), lambda _: entity)
+    pool = await manager.get_pool("fn")
+    clock = FakeClock()
+    pool.forecaster = DemandForecaster(window_seconds=1.0, horizon_seconds=2.0, clock=clock)
+    _feed(pool.forecaster, clock, [1, 2, 3, 4, 5, 6])
+
+    provisioned = await manager.scale_ahead()
+
+    # Provisioned beyond the last observed peak (6), before demand arrives.
+    assert provisioned["fn"] > 6
+    assert pool.stats["idle"] == provisioned["fn"]
+    # Nothing more to do once the target is covered.
+    assert await manager.scale_ahead() == {}
+    assert "forecast" in pool.stats
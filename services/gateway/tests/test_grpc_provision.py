@@ -2,6 +2,8 @@ import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from grpc import StatusCode
+from grpc.aio import AioRpcError, Metadata
 
 from services.gateway.models.function import FunctionEntity
 from services.gateway.pb import agent_pb2
@@ -135,6 +137,70 @@ async def test_provision_fallback_containerd(grpc_client, mock_stub, mock_regist
         assert args[0].owner_id == OWNER_ID
 
 
+def _data_plane(mock_config):
+    mock_config.S3_ENDPOINT = ""
+    mock_config.S3_PRESIGN_ENDPOINT = ""
+    mock_config.DYNAMODB_ENDPOINT = ""
+    mock_config.GATEWAY_VICTORIALOGS_URL = ""
+    mock_config.DATA_PLANE_HOST = "10.99.99.99"
+
+
+@pytest.mark.asyncio
+async def test_provision_batch_uses_one_rpc(grpc_client, mock_stub):
+    """count > 1 asks the Agent for all containers in one EnsureContainers call."""
+    mock_stub.EnsureContainers = AsyncMock(
+        return_value=agent_pb2.EnsureContainersResponse(
+            workers=[
+                agent_pb2.WorkerInfo(id=f"w{i}", name=f"w{i}", ip_address="1.2.3.4", port=8080)
+                for i in range(3)
+            ]
+        )
+    )
+    mock_stub.EnsureContainer = AsyncMock()
+
+    with (
+        patch("services.gateway.config.config") as mock_config,
+        patch.object(grpc_client, "_wait_for_readiness", new_callable=AsyncMock) as ready,
+    ):
+        _data_plane(mock_config)
+        workers = await grpc_client.provision("my-func", count=3)
+
+    assert [w.id for w in workers] == ["w0", "w1", "w2"]
+    request = mock_stub.EnsureContainers.call_args.args[0]
+    assert request.count == 3
+    assert request.template.function_name == "my-func"
+    assert request.template.owner_id == OWNER_ID
+    assert ready.await_count == 3
+    mock_stub.EnsureContainer.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_provision_batch_falls_back_to_single_calls(grpc_client, mock_stub):
+    """An Agent without EnsureContainers gets parallel EnsureContainer calls."""
+    mock_stub.EnsureContainers = AsyncMock(
+        side_effect=AioRpcError(StatusCode.UNIMPLEMENTED, Metadata(), Metadata())
+    )
+    mock_stub.EnsureContainer = AsyncMock(
+        side_effect=[
+            agent_pb2.WorkerInfo(id="w1", name="w1", ip_address="1.2.3.4"),
+            RuntimeError("no capacity"),
+            agent_pb2.WorkerInfo(id="w2", name="w2", ip_address="1.2.3.5"),
+            agent_pb2.WorkerInfo(id="w3", name="w3", ip_address="1.2.3.6"),
+        ]
+    )
+    grpc_client.skip_readiness_check = True
+
+    with patch("services.gateway.config.config") as mock_config:
+        _data_plane(mock_config)
+        first = await grpc_client.provision("my-func", count=3)
+        second = await grpc_client.provision("my-func", count=1)
+
+    # Partial failure keeps the containers that started.
+    assert [w.id for w in first] == ["w1", "w2"]
+    assert [w.id for w in second] == ["w3"]
+    mock_stub.EnsureContainers.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_grpc_delete_container(mock_stub, mock_registry):
     """Ensure delete_container calls the agent DestroyContainer."""
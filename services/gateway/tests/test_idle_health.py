@@ -0,0 +1,114 @@
+"""
+Tests for background health checks of idle workers.
+"""
+
+import itertools
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.models.function import FunctionEntity, ScalingConfig
+from services.gateway.services.idle_health import IdleHealthChecker
+from services.gateway.services.pool_manager import PoolManager
+
+
+def _setup(min_capacity: int = 0):
+    ids = itertools.count(1)
+    client = AsyncMock()
+
+    async def provision(function_name, count=1):
+        return [
+            WorkerInfo(id=f"c{n}", name=f"c{n}", ip_address="10.0.0.1")
+            for n in itertools.islice(ids, count)
+        ]
+
+    client.provision.side_effect = provision
+    client.probe_container.return_value = True
+    entity = FunctionEntity(
+        name="fn", scaling=ScalingConfig(max_capacity=2, min_capacity=min_capacity)
+    )
+    return client, PoolManager(client, lambda _: entity)
+
+
+@pytest.mark.asyncio
+async def test_dead_idle_worker_is_evicted_and_replaced():
+    client, manager = _setup(min_capacity=1)
+    await manager.warm_up("fn", 1)
+    client.container_states.return_value = {}
+
+    evicted = await manager.check_idle_health()
+
+    assert evicted == {"fn": 1}
+    client.delete_container.assert_awaited_once_with("c1")
+    pool = await manager.get_pool("fn")
+    assert [w.id for w in pool.get_idle_workers()] == ["c2"]
+    assert pool.stats["unhealthy_evicted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unresponsive_running_worker_is_evicted():
+    client, manager = _setup()
+    await manager.warm_up("fn", 2)
+    client.container_states.return_value = {"c1": "RUNNING", "c2": "RUNNING"}
+    client.probe_container.side_effect = lambda fn, worker, timeout: worker.id == "c2"
+
+    assert await manager.check_idle_health(quiet_seconds=0.0) == {"fn": 1}
+
+    pool = await manager.get_pool("fn")
+    assert [w.id for w in pool.get_idle_workers()] == ["c2"]
+
+
+@pytest.mark.asyncio
+async def test_recently_used_and_paused_workers_are_not_probed():
+    client, manager = _setup()
+    await manager.warm_up("fn", 2)
+    manager._paused_ids.add("c2")
+    client.container_states.return_value = {"c1": "RUNNING", "c2": "PAUSED"}
+
+    assert await manager.check_idle_health(quiet_seconds=60.0) == {}
+    client.probe_container.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_worker_acquired_during_check_is_kept():
+    client, manager = _setup()
+    await manager.warm_up("fn", 1)
+    client.container_states.return_value = {"c1": "RUNNING"}
+
+    async def probe(function_name, worker, timeout):
+        await manager.release_worker("fn", await manager.acquire_worker("fn"))
+        return False
+
+    client.probe_container.side_effect = probe
+
+    assert await manager.check_idle_health(quiet_seconds=0.0) == {}
+    client.delete_container.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_worker_paused_during_check_is_kept():
+    client, manager = _setup()
+    await manager.warm_up("fn", 1)
+
+    async def container_states():
+        # The pause deadline fires while ListContainers is in flight.
+        manager._paused_ids.add("c1")
+        return {"c1": "RUNNING"}
+
+    client.container_states.side_effect = container_states
+
+    assert await manager.check_idle_health() == {}
+    client.delete_container.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_checker_counts_evictions():
+    manager = AsyncMock()
+    manager.check_idle_health.return_value = {"fn": 2}
+    checker = IdleHealthChecker(manager, interval=30.0, probe_timeout=0.5)
+
+    await checker.run_once()
+
+    manager.check_idle_health.assert_awaited_once_with(probe_timeout=0.5, quiet_seconds=30.0)
+    assert (checker.checks, checker.evicted) == (1, 2)
@@ -8,6 +8,7 @@ from services.gateway.api.deps import (
     resolve_lambda_target,
     verify_authorization,
 )
+from services.gateway.core.payload_codec import PayloadCodec
 from services.gateway.main import gateway_handler
 from services.gateway.models import TargetFunction
 from services.gateway.models.context import InputContext
@@ -208,7 +209,7 @@ routes:
         route_path=target.route_path,
         timeout=30.0,
     )
-    response = await gateway_handler(context, mock_processor)
+    response = await gateway_handler(context, mock_processor, PayloadCodec())
 
     assert response.status_code == 200
     assert response.body == b""
@@ -0,0 +1,92 @@
+"""
+Tests for the per-function lifecycle policy (scaling.idle_timeout & recycling).
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.core.timer_wheel import TimerWheel
+from services.gateway.models.function import FunctionEntity, ScalingConfig
+from services.gateway.services.pool_manager import PoolManager
+
+
+def _manager(scaling: ScalingConfig, created_at: float = 0.0, **kwargs) -> tuple:
+    client = AsyncMock()
+    client.provision.return_value = [
+        WorkerInfo(id="c1", name="c1", ip_address="10.0.0.1", created_at=created_at)
+    ]
+    entity = FunctionEntity(name="fn", scaling=scaling)
+    return client, PoolManager(client, lambda _: entity, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_function_idle_timeout_overrides_gateway_default():
+    client, manager = _manager(
+        ScalingConfig(idle_timeout=0.1),
+        idle_timeout_seconds=300,
+        timers=TimerWheel(tick_seconds=0.01),
+    )
+    worker = await manager.acquire_worker("fn")
+    await manager.release_worker("fn", worker)
+
+    await asyncio.sleep(0.2)
+
+    client.delete_container.assert_awaited_once_with("c1")
+    await manager.shutdown_all()
+
+
+@pytest.mark.asyncio
+async def test_prune_all_pools_uses_function_idle_timeout():
+    client, manager = _manager(ScalingConfig(idle_timeout=1000))
+    worker = await manager.acquire_worker("fn")
+    await manager.release_worker("fn", worker)
+    worker.last_used_at = time.time() - 500
+
+    assert await manager.prune_all_pools(idle_timeout=60.0) == {}
+    client.delete_container.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_worker_is_recycled_after_max_invocations():
+    client, manager = _manager(ScalingConfig(max_worker_invocations=2))
+
+    for _ in range(2):
+        worker = await manager.acquire_worker("fn")
+        await manager.release_worker("fn", worker)
+
+    client.delete_container.assert_awaited_once_with("c1")
+    stats = (await manager.get_pool("fn")).stats
+    assert stats["total_workers"] == 0
+    assert stats["recycled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_is_recycled_after_max_age():
+    client, manager = _manager(
+        ScalingConfig(max_worker_age_seconds=60), created_at=time.time() - 120
+    )
+
+    worker = await manager.acquire_worker("fn")
+    await manager.release_worker("fn", worker)
+
+    client.delete_container.assert_awaited_once_with("c1")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_worker_is_retired_on_its_last_release():
+    client, manager = _manager(ScalingConfig(per_worker_concurrency=2, max_worker_invocations=2))
+    first = await manager.acquire_worker("fn")
+    second = await manager.acquire_worker("fn")
+
+    await manager.release_worker("fn", first)
+    pool = await manager.get_pool("fn")
+    assert pool.stats["total_workers"] == 1
+    client.delete_container.assert_not_awaited()
+
+    await manager.release_worker("fn", second)
+    client.delete_container.assert_awaited_once_with("c1")
+    assert pool.in_flight == 0
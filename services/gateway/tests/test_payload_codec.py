@@ -0,0 +1,117 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+
+import pytest
+
+from services.common.core.request_context import clear_trace_id, generate_request_id
+from services.gateway.core.event_builder import V1ProxyEventBuilder
+from services.gateway.core.loop_lag import EventLoopLagMonitor
+from services.gateway.core.payload_codec import PayloadCodec
+from services.gateway.models.context import InputContext
+from services.gateway.models.result import InvocationResult
+
+
+def _context(body: bytes) -> InputContext:
+    return InputContext(
+        function_name="fn",
+        method="POST",
+        path="/upload",
+        headers={"content-type": "application/octet-stream"},
+        body=body,
+    )
+
+
+@pytest.mark.asyncio
+async def test_small_payloads_stay_inline():
+    codec = PayloadCodec(offload_threshold=1024)
+    caller = threading.get_ident()
+
+    thread_id = await codec.run(threading.get_ident, size=10)
+
+    assert thread_id == caller
+    assert codec.stats == {"inline": 1, "thread": 0, "process": 0}
+
+
+@pytest.mark.asyncio
+async def test_large_payloads_are_offloaded_to_thread_pool():
+    codec = PayloadCodec(offload_threshold=1024)
+    try:
+        thread_id = await codec.run(threading.get_ident, size=4096)
+    finally:
+        codec.shutdown()
+
+    assert thread_id != threading.get_ident()
+    assert codec.stats["thread"] == 1
+
+
+@pytest.mark.asyncio
+async def test_encode_event_matches_inline_encoding():
+    body = bytes(range(256)) * 64  # not valid UTF-8 -> base64 encoded
+    context = _context(body)
+    builder = V1ProxyEventBuilder()
+    inline = PayloadCodec(offload_threshold=len(body) + 1)
+    offloaded = PayloadCodec(offload_threshold=1)
+
+    try:
+        inline_payload = json.loads(await inline.encode_event(builder, context))
+        offloaded_payload = json.loads(await offloaded.encode_event(builder, context))
+    finally:
+        offloaded.shutdown()
+
+    assert offloaded_payload["isBase64Encoded"] is True
+    assert base64.b64decode(offloaded_payload["body"]) == body
+    offloaded_payload["requestContext"].pop("requestId")
+    inline_payload["requestContext"].pop("requestId")
+    assert offloaded_payload == inline_payload
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("process_threshold", [0, 1], ids=["thread", "process"])
+async def test_encode_event_keeps_request_id_when_offloaded(process_threshold):
+    codec = PayloadCodec(offload_threshold=1, process_threshold=process_threshold)
+    request_id = generate_request_id()
+    try:
+        payload = json.loads(await codec.encode_event(V1ProxyEventBuilder(), _context(b"x" * 64)))
+    finally:
+        codec.shutdown()
+        clear_trace_id()
+
+    assert payload["requestContext"]["requestId"] == request_id
+    assert codec.stats["process" if process_threshold else "thread"] == 1
+
+
+@pytest.mark.asyncio
+async def test_decode_response_offloaded():
+    raw = b"x" * 2048
+    payload = json.dumps(
+        {"statusCode": 201, "body": base64.b64encode(raw).decode(), "isBase64Encoded": True}
+    ).encode()
+    codec = PayloadCodec(offload_threshold=1024)
+    try:
+        parsed = await codec.decode_response(
+            InvocationResult(success=True, status_code=200, payload=payload)
+        )
+    finally:
+        codec.shutdown()
+
+    assert parsed["status_code"] == 201
+    assert parsed["raw_content"] == raw
+    assert codec.stats["thread"] == 1
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor_detects_blocking_call():
+    monitor = EventLoopLagMonitor(interval=0.01)
+    await monitor.start()
+    try:
+        await asyncio.sleep(0.03)
+        time.sleep(0.1)  # Block the event loop.
+        await asyncio.sleep(0.03)
+    finally:
+        await monitor.stop()
+
+    assert monitor.samples > 0
+    assert monitor.stats["max_lag_ms"] >= 50
@@ -0,0 +1,192 @@
+"""
+Tests for the node-wide pool coordinator shared by worker processes.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.core.exceptions import ContainerStartError
+from services.gateway.models.function import FunctionEntity, ScalingConfig
+from services.gateway.services.pool_coordinator import (
+    PoolCoordinatorClient,
+    PoolCoordinatorServer,
+)
+from services.gateway.services.pool_manager import PoolManager
+
+
+class _Provisioner:
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self.calls = 0
+        self.deleted = []
+
+    async def provision(self, function_name):
+        self.calls += 1
+        worker_id = f"{self.prefix}-{self.calls}"
+        return [WorkerInfo(id=worker_id, name=worker_id, ip_address="10.0.0.1")]
+
+    async def delete_container(self, worker_id):
+        self.deleted.append(worker_id)
+
+    async def list_containers(self):
+        return []
+
+
+@pytest.fixture
+async def coordinator(tmp_path):
+    server = PoolCoordinatorServer(str(tmp_path / "pool.sock"))
+    await server.start()
+    clients = []
+
+    async def connect(prefix: str, max_capacity: int = 2):
+        client = PoolCoordinatorClient(server.socket_path, connect_timeout=1.0)
+        assert await client.connect()
+        clients.append(client)
+        entity = FunctionEntity(
+            name="fn", scaling=ScalingConfig(max_capacity=max_capacity, acquire_timeout=0.3)
+        )
+        provisioner = _Provisioner(prefix)
+        manager = PoolManager(provisioner, lambda _: entity, coordinator=client)
+        return manager, provisioner, client
+
+    yield server, connect
+    for client in clients:
+        await client.close()
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_max_capacity_is_node_wide(coordinator):
+    server, connect = coordinator
+    manager_a, _, _ = await connect("a")
+    manager_b, _, _ = await connect("b")
+
+    await manager_a.acquire_worker("fn")
+    await manager_b.acquire_worker("fn")
+
+    # Two processes each below their local limit, but the node is full.
+    with pytest.raises(ContainerStartError):
+        await manager_a.acquire_worker("fn")
+    assert (await server._dispatch(None, {"op": "stats"}))["usage"] == {"fn": 2}
+
+
+@pytest.mark.asyncio
+async def test_idle_worker_is_handed_to_other_process(coordinator):
+    server, connect = coordinator
+    manager_a, provisioner_a, _ = await connect("a", max_capacity=1)
+    manager_b, provisioner_b, _ = await connect("b", max_capacity=1)
+
+    worker = await manager_a.acquire_worker("fn")
+    await manager_a.release_worker("fn", worker)
+
+    taken = await manager_b.acquire_worker("fn")
+
+    assert taken.id == worker.id
+    assert provisioner_b.calls == 0
+    assert (await manager_a.get_pool("fn")).size == 0
+    assert server.transfers == 1
+
+    # Ownership moved: deleting from B frees node capacity for A.
+    await manager_b.evict_worker("fn", taken)
+    await manager_a.acquire_worker("fn")
+    assert provisioner_a.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_reconcile_keeps_other_processes_containers(coordinator):
+    _, connect = coordinator
+    manager_a, _, _ = await connect("a")
+    manager_b, provisioner_b, _ = await connect("b")
+    worker = await manager_a.acquire_worker("fn")
+    worker.created_at = time.time() - 3600
+
+    async def list_containers():
+        return [worker]
+
+    provisioner_b.list_containers = list_containers
+    assert await manager_b.reconcile_orphans() == 0
+    assert provisioner_b.deleted == []
+
+
+@pytest.mark.asyncio
+async def test_startup_cleanup_runs_once_and_disconnect_frees_capacity(coordinator):
+    server, connect = coordinator
+    manager_a, _, first = await connect("a")
+    manager_b, _, second = await connect("b")
+    assert first.startup_cleanup is True
+    assert second.startup_cleanup is False
+    await manager_a.cleanup_all_containers()
+    assert await manager_b.cleanup_all_containers() == 0
+
+    await manager_b.acquire_worker("fn")
+    await second.close()
+    await asyncio.sleep(0.05)
+
+    assert (await server._dispatch(None, {"op": "stats"}))["usage"] == {}
+
+
+@pytest.mark.asyncio
+async def test_unreachable_coordinator_falls_back_to_local(tmp_path):
+    client = PoolCoordinatorClient(str(tmp_path / "missing.sock"), connect_timeout=0.1)
+
+    assert await client.connect() is False
+    assert await client.reserve("fn", 1) is True
+    assert client.startup_cleanup is True
+
+
+@pytest.mark.asyncio
+async def test_uncommitted_donation_is_taken_back(coordinator):
+    _, connect = coordinator
+    manager, _, client = await connect("a")
+    client.offer_timeout = 0.05
+    worker = await manager.acquire_worker("fn")
+    await manager.release_worker("fn", worker)
+
+    # The coordinator gave up on the donor (timeout) and never commits.
+    offer = await client._handle(None, {"op": "donate", "function_name": "fn"})
+    assert offer["worker"]["id"] == worker.id
+    assert (await manager.get_pool("fn")).size == 0
+    await asyncio.sleep(0.1)
+
+    assert [w.id for w in (await manager.get_pool("fn")).get_idle_workers()] == [worker.id]
+    assert await client._handle(None, {"op": "commit", "worker_id": worker.id}) == {"ok": False}
+
+
+@pytest.mark.asyncio
+async def test_pausing_worker_is_not_donated(coordinator):
+    _, connect = coordinator
+    manager, _, client = await connect("a")
+    worker = await manager.acquire_worker("fn")
+    await manager.release_worker("fn", worker)
+    manager._pausing[worker.id] = asyncio.get_running_loop().create_future()
+
+    assert await client._handle(None, {"op": "donate", "function_name": "fn"}) == {"worker": None}
+    assert (await manager.get_pool("fn")).size == 1
+
+
+@pytest.mark.asyncio
+async def test_other_processes_wait_for_startup_cleanup(coordinator):
+    _, connect = coordinator
+    manager_a, provisioner_a, _ = await connect("a")
+    manager_b, _, _ = await connect("b")
+    listed = asyncio.Event()
+    release = asyncio.Event()
+
+    async def list_containers():
+        listed.set()
+        await release.wait()
+        return []
+
+    provisioner_a.list_containers = list_containers
+    cleanup = asyncio.create_task(manager_a.cleanup_all_containers())
+    await listed.wait()
+    waiting = asyncio.create_task(manager_b.cleanup_all_containers())
+    await asyncio.sleep(0.05)
+    assert not waiting.done()
+
+    release.set()
+    await cleanup
+    assert await asyncio.wait_for(waiting, 1.0) == 0
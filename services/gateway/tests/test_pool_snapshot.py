@@ -0,0 +1,139 @@
+"""
+Tests for warm restart (pool snapshot + re-adoption).
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.models.function import FunctionEntity, ScalingConfig
+from services.gateway.services.pool_manager import PoolManager
+from services.gateway.services.pool_snapshot import load_pool_snapshot, save_pool_snapshot
+
+
+def _worker(worker_id: str, function_name: str = "fn") -> WorkerInfo:
+    return WorkerInfo(
+        id=worker_id,
+        name=f"lambda-{worker_id}",
+        ip_address="10.0.0.9",
+        port=8080,
+        function_name=function_name,
+        created_at=100.0,
+    )
+
+
+def _listed(worker_id: str, function_name: str = "fn") -> WorkerInfo:
+    # ListContainers carries no address.
+    return WorkerInfo(
+        id=worker_id, name=f"lambda-{worker_id}", ip_address="", function_name=function_name
+    )
+
+
+def _manager(client, **kwargs) -> PoolManager:
+    entities = {"fn": FunctionEntity(name="fn", scaling=ScalingConfig(max_capacity=5))}
+    return PoolManager(client, entities.get, **kwargs)
+
+
+def test_snapshot_round_trip_merges_processes(tmp_path):
+    path = str(tmp_path / "snapshot.json")
+
+    save_pool_snapshot(path, [_worker("c1")], paused_ids=set())
+    save_pool_snapshot(path, [_worker("c2")], paused_ids={"c2"})
+
+    snapshot = load_pool_snapshot(path)
+    assert set(snapshot) == {"c1", "c2"}
+    assert snapshot["c1"]["ip_address"] == "10.0.0.9"
+    assert snapshot["c2"]["paused"] is True
+    # Consumed: a second start does not re-adopt from a stale snapshot.
+    assert load_pool_snapshot(path) == {}
+
+
+def test_unreadable_snapshot_is_ignored(tmp_path):
+    path = tmp_path / "snapshot.json"
+    path.write_text("{not json")
+
+    assert load_pool_snapshot(str(path)) == {}
+
+
+@pytest.mark.asyncio
+async def test_warm_restart_adopts_healthy_and_destroys_stale(tmp_path):
+    client = AsyncMock()
+    client.list_containers.return_value = [
+        _listed("c1"),
+        _listed("c2"),
+        _listed("c3"),
+        _listed("c4", function_name="removed"),
+    ]
+    client.probe_container.side_effect = lambda fn, worker, timeout: worker.id != "c2"
+    manager = _manager(client)
+    path = str(tmp_path / "snapshot.json")
+    save_pool_snapshot(path, [_worker("c1"), _worker("c2"), _worker("c4", "removed")], set())
+
+    result = await manager.warm_restart(path)
+
+    assert result == {"adopted": 1, "destroyed": 3}
+    deleted = {call.args[0] for call in client.delete_container.await_args_list}
+    assert deleted == {"c2", "c3", "c4"}
+    pool = await manager.get_pool("fn")
+    worker = await pool.acquire(AsyncMock(side_effect=AssertionError("no cold start")))
+    assert worker.id == "c1"
+    assert worker.ip_address == "10.0.0.9"
+
+
+@pytest.mark.asyncio
+async def test_paused_containers_are_resumed_on_acquire(tmp_path):
+    client = AsyncMock()
+    client.list_containers.return_value = [_listed("c1")]
+    manager = _manager(client, pause_enabled=True, pause_idle_seconds=60.0)
+    path = str(tmp_path / "snapshot.json")
+    save_pool_snapshot(path, [_worker("c1")], paused_ids={"c1"})
+
+    await manager.warm_restart(path)
+    client.probe_container.assert_not_awaited()
+
+    worker = await manager.acquire_worker("fn")
+
+    assert worker.id == "c1"
+    client.resume_container.assert_awaited_once()
+    await manager.shutdown_all()
+
+
+@pytest.mark.asyncio
+async def test_detach_all_keeps_containers(tmp_path):
+    client = AsyncMock()
+    client.provision.return_value = [_worker("c1")]
+    manager = _manager(client)
+    await manager.acquire_worker("fn")
+
+    workers, paused_ids = await manager.detach_all()
+    save_pool_snapshot(str(tmp_path / "s.json"), workers, paused_ids)
+
+    client.delete_container.assert_not_awaited()
+    assert set(load_pool_snapshot(str(tmp_path / "s.json"))) == {"c1"}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_kept_when_containers_cannot_be_listed(tmp_path):
+    client = AsyncMock()
+    client.list_containers.side_effect = ConnectionError("agent down")
+    manager = _manager(client)
+    path = str(tmp_path / "snapshot.json")
+    save_pool_snapshot(path, [_worker("c1")], set())
+
+    assert await manager.warm_restart(path) == {"adopted": 0, "destroyed": 0}
+    assert set(load_pool_snapshot(path)) == {"c1"}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_left_to_the_cleanup_process(tmp_path):
+    client = AsyncMock()
+    coordinator = MagicMock(startup_cleanup=False, wait_for_cleanup=AsyncMock())
+    manager = _manager(client, coordinator=coordinator)
+    path = str(tmp_path / "snapshot.json")
+    save_pool_snapshot(path, [_worker("c1")], set())
+
+    assert await manager.warm_restart(path) == {"adopted": 0, "destroyed": 0}
+    coordinator.wait_for_cleanup.assert_awaited_once()
+    client.list_containers.assert_not_awaited()
+    assert set(load_pool_snapshot(path)) == {"c1"}
@@ -0,0 +1,110 @@
+"""
+Tests for the gateway-wide fair provisioning scheduler.
+"""
+
+import asyncio
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.core.provision_scheduler import ProvisionScheduler
+from services.gateway.models.function import FunctionEntity, ScalingConfig
+from services.gateway.services.pool_manager import PoolManager
+
+
+async def _run(scheduler: ProvisionScheduler, requests, hold: float = 0.01):
+    """Queue (function, background) requests in order; return the grant order."""
+    order = []
+
+    async def provision(function_name: str, background: bool) -> None:
+        async with scheduler.slot(function_name, background=background):
+            order.append(function_name)
+            await asyncio.sleep(hold)
+
+    tasks = []
+    for function_name, background in requests:
+        tasks.append(asyncio.create_task(provision(function_name, background)))
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    return order
+
+
+@pytest.mark.asyncio
+async def test_global_cap_bounds_concurrent_provisions():
+    scheduler = ProvisionScheduler(max_concurrent=3)
+    active = peak = 0
+
+    async def provision():
+        nonlocal active, peak
+        async with scheduler.slot("fn"):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(provision() for _ in range(10)))
+
+    assert peak == 3
+    assert scheduler.stats["granted"] == {"fn": 10}
+
+
+@pytest.mark.asyncio
+async def test_small_function_is_not_queued_behind_a_big_one():
+    scheduler = ProvisionScheduler(max_concurrent=1)
+
+    order = await _run(scheduler, [("big", False)] * 20 + [("small", False)])
+
+    assert order.index("small") <= 2
+
+
+@pytest.mark.asyncio
+async def test_weights_split_capacity():
+    scheduler = ProvisionScheduler(
+        max_concurrent=1, weight_of=lambda name: 3.0 if name == "heavy" else 1.0
+    )
+
+    order = await _run(scheduler, [("heavy", False)] * 12 + [("light", False)] * 12)
+
+    assert order[1:9].count("heavy") == 6
+
+
+@pytest.mark.asyncio
+async def test_warm_up_waits_for_demand_driven_provisions():
+    scheduler = ProvisionScheduler(max_concurrent=1)
+
+    order = await _run(
+        scheduler, [("first", False), ("warm", True), ("warm", True), ("demand", False)]
+    )
+
+    assert order == ["first", "demand", "warm", "warm"]
+
+
+@pytest.mark.asyncio
+async def test_small_function_cold_start_is_stable_while_big_scales():
+    calls = []
+
+    class Agent:
+        async def provision(self, function_name):
+            calls.append(function_name)
+            await asyncio.sleep(0.05)
+            worker_id = f"{function_name}-{len(calls)}"
+            return [WorkerInfo(id=worker_id, name=worker_id, ip_address="10.0.0.1")]
+
+    entities = {
+        "big": FunctionEntity(name="big", scaling=ScalingConfig(max_capacity=40)),
+        "small": FunctionEntity(name="small", scaling=ScalingConfig(max_capacity=1)),
+    }
+    manager = PoolManager(
+        Agent(), entities.get, provision_scheduler=ProvisionScheduler(max_concurrent=2)
+    )
+    loop = asyncio.get_running_loop()
+
+    big = [asyncio.create_task(manager.acquire_worker("big")) for _ in range(40)]
+    await asyncio.sleep(0.01)
+    started = loop.time()
+    await manager.acquire_worker("small")
+    small_latency = loop.time() - started
+    await asyncio.gather(*big)
+
+    # 40 big provisions take ~1s at 2 at a time; small waits for at most one slot.
+    assert small_latency < 0.2
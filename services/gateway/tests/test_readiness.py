@@ -0,0 +1,127 @@
+"""
+Tests for container readiness probing.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.core.exceptions import ContainerStartError
+from services.gateway.core.readiness import LatencyHistogram, ReadinessProber
+from services.gateway.models.function import FunctionEntity, ScalingConfig
+from services.gateway.services.grpc_provision import GrpcProvisionClient
+
+
+async def _free_port() -> int:
+    server = await asyncio.start_server(lambda r, w: None, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    server.close()
+    await server.wait_closed()
+    return port
+
+
+async def _http_ok(reader, writer):
+    await reader.readline()
+    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+    await writer.drain()
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_backoff_detects_readiness_well_under_old_poll_interval():
+    port = await _free_port()
+    prober = ReadinessProber()
+
+    async def start_late():
+        await asyncio.sleep(0.03)
+        return await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", port)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    server_task = asyncio.create_task(start_late())
+    await prober.wait("fn", "127.0.0.1", port)
+    elapsed = loop.time() - started
+    server = await server_task
+    server.close()
+    await server.wait_closed()
+
+    # Probes at 0, 5, 15, 35ms: ready within ~one backoff step of the listener.
+    assert elapsed < 0.06
+    assert prober.histogram.count == 1
+
+
+@pytest.mark.asyncio
+async def test_http_mode_waits_for_an_http_response():
+    serving = asyncio.Event()
+
+    async def handle(reader, writer):
+        if serving.is_set():
+            await _http_ok(reader, writer)
+        else:
+            # Port open, runtime not serving yet.
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    prober = ReadinessProber(mode="http")
+
+    with pytest.raises(ContainerStartError):
+        await prober.wait("fn", "127.0.0.1", port, timeout=0.05)
+
+    serving.set()
+    await prober.wait("fn", "127.0.0.1", port, timeout=1.0)
+    server.close()
+    await server.wait_closed()
+
+    assert prober.failures == 1
+    assert prober.histogram.count == 1
+
+
+def test_unknown_mode_is_rejected():
+    # The Agent does not wait for readiness, so the gateway always probes.
+    with pytest.raises(ValueError):
+        ReadinessProber(mode="agent")
+
+
+def test_histogram_quantiles_and_buckets():
+    histogram = LatencyHistogram(buckets_ms=(5, 10, 100))
+    for seconds in (0.001, 0.002, 0.003, 0.008, 0.5):
+        histogram.observe(seconds)
+
+    stats = histogram.stats
+
+    assert stats["count"] == 5
+    assert stats["p50_ms"] == 5.0
+    assert stats["p90_ms"] == 500.0
+    assert stats["buckets"] == {"le_5ms": 3, "le_10ms": 1, "le_100ms": 0, "gt_100ms": 1}
+    assert LatencyHistogram().stats["p50_ms"] is None
+
+
+@pytest.mark.asyncio
+async def test_per_function_readiness_timeout(monkeypatch):
+    monkeypatch.setattr(asyncio, "open_connection", AsyncMock(side_effect=ConnectionRefusedError))
+    registry = MagicMock()
+    registry.get_function_config.return_value = FunctionEntity(
+        name="fn", scaling=ScalingConfig(readiness_timeout=0.05)
+    )
+    client = GrpcProvisionClient(MagicMock(), registry, owner_id="gw")
+    loop = asyncio.get_running_loop()
+
+    started = loop.time()
+    with pytest.raises(ContainerStartError):
+        await client._wait_for_readiness("fn", "10.0.0.1", 8080)
+
+    assert loop.time() - started < 1.0
+    assert client.readiness.stats["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_probe_container_is_not_recorded(monkeypatch):
+    monkeypatch.setattr(asyncio, "open_connection", AsyncMock(side_effect=ConnectionRefusedError))
+    client = GrpcProvisionClient(MagicMock(), MagicMock(), owner_id="gw")
+    worker = WorkerInfo(id="c1", name="c1", ip_address="10.0.0.1", port=8080)
+
+    assert await client.probe_container("fn", worker, timeout=0.02) is False
+    assert client.readiness.stats["failures"] == 0
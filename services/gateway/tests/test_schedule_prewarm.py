@@ -0,0 +1,113 @@
+"""
+Tests for schedule-aware pre-warming.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from apscheduler.triggers.interval import IntervalTrigger
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.models.function import FunctionEntity, ScalingConfig
+from services.gateway.services.pool_manager import PoolManager
+from services.gateway.services.scheduler import LeadTimeTrigger, SchedulerService
+
+
+def _worker(worker_id: str, last_used_at: float = 0.0) -> WorkerInfo:
+    return WorkerInfo(
+        id=worker_id, name=worker_id, ip_address="10.0.0.1", last_used_at=last_used_at
+    )
+
+
+def _manager(provision_client, pause_enabled=False) -> PoolManager:
+    entity = FunctionEntity(name="fn", scaling=ScalingConfig(max_capacity=3))
+    return PoolManager(
+        provision_client,
+        lambda _: entity,
+        pause_enabled=pause_enabled,
+        pause_idle_seconds=60.0 if pause_enabled else 0.0,
+    )
+
+
+def test_lead_time_trigger_fires_before_inner_trigger():
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    inner = IntervalTrigger(minutes=10, start_date=start, timezone=timezone.utc)
+    trigger = LeadTimeTrigger(inner, 30)
+
+    first = trigger.get_next_fire_time(None, start)
+    second = trigger.get_next_fire_time(first, first)
+
+    assert first == start + timedelta(minutes=10, seconds=-30)
+    assert second == start + timedelta(minutes=20, seconds=-30)
+
+
+def test_scheduler_adds_prewarm_job_and_reports_next_fire():
+    scheduler = SchedulerService(AsyncMock(), pool_manager=AsyncMock(), prewarm_lead_seconds=30)
+    scheduler.load_schedules({"fn": {"events": [{"schedule": {"rate": "rate(1 hour)"}}]}})
+
+    job_ids = {job.id for job in scheduler.scheduler.get_jobs()}
+    assert job_ids == {"fn_sched_0", "fn_sched_0_prewarm"}
+
+    due_at = scheduler.next_fire_time("fn")
+    assert due_at is not None
+    assert 3500 < due_at - time.time() <= 3600
+    assert scheduler.next_fire_time("other") is None
+
+
+def test_scheduler_without_pool_manager_adds_no_prewarm_job():
+    scheduler = SchedulerService(AsyncMock(), prewarm_lead_seconds=30)
+    scheduler.load_schedules({"fn": {"events": [{"schedule": {"rate": "rate(1 hour)"}}]}})
+
+    assert [job.id for job in scheduler.scheduler.get_jobs()] == ["fn_sched_0"]
+
+
+@pytest.mark.asyncio
+async def test_prewarm_provisions_when_pool_is_empty():
+    client = AsyncMock()
+    client.provision.return_value = [_worker("c1")]
+    manager = _manager(client)
+
+    assert await manager.prewarm_for_schedule("fn") == "provisioned"
+    assert await manager.prewarm_for_schedule("fn") == "warm"
+    client.provision.assert_awaited_once_with("fn")
+
+
+@pytest.mark.asyncio
+async def test_prewarm_resumes_paused_worker():
+    client = AsyncMock()
+    manager = _manager(client, pause_enabled=True)
+    pool = await manager.get_pool("fn")
+    worker = _worker("c1", last_used_at=time.time())
+    await pool.adopt(worker)
+    manager._mark_paused(pool, worker.id, True)
+
+    assert await manager.prewarm_for_schedule("fn") == "resumed"
+    client.resume_container.assert_awaited_once_with("fn", worker)
+    assert worker.id not in manager._paused_ids
+    client.provision.assert_not_called()
+    # The resumed worker gets its pause deadline back.
+    assert ("pause", worker.id) in manager.timers
+    await manager.shutdown_all()
+
+
+@pytest.mark.asyncio
+async def test_prune_keeps_one_worker_for_upcoming_schedule():
+    client = AsyncMock()
+    manager = _manager(client)
+    pool = await manager.get_pool("fn")
+    old = time.time() - 1000
+    for i in range(2):
+        await pool.adopt(_worker(f"c{i}", last_used_at=old))
+
+    manager.schedule_lookup = lambda name: time.time() + 30
+    pruned = await manager.prune_all_pools(idle_timeout=60.0)
+    assert [w.id for w in pruned["fn"]] == ["c0"]
+    assert pool.size == 1
+
+    # Next run is beyond the idle timeout: prune as usual.
+    manager.schedule_lookup = lambda name: time.time() + 3600
+    pruned = await manager.prune_all_pools(idle_timeout=60.0)
+    assert [w.id for w in pruned["fn"]] == ["c1"]
+    assert pool.size == 0
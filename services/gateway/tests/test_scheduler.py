@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock
 import pytest
 from apscheduler.triggers.interval import IntervalTrigger
 
+from services.gateway.core.invocation_context import InvocationPriority
 from services.gateway.services.scheduler import AWSCronTrigger, SchedulerService
 
 
@@ -83,4 +84,6 @@ async def test_job_execution(scheduler_service, mock_invoker):
     # The actual function is wrapped in an async function in _add_schedule_job
     await job.func()
 
-    mock_invoker.invoke_function.assert_called_once_with("my-func", b'{"foo": "bar"}')
+    mock_invoker.invoke_function.assert_called_once_with(
+        "my-func", b'{"foo": "bar"}', priority=InvocationPriority.SCHEDULED
+    )
@@ -0,0 +1,101 @@
+"""
+Tests for resuming paused workers ahead of demand.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.core.timer_wheel import TimerWheel
+from services.gateway.models.function import FunctionEntity, ScalingConfig
+from services.gateway.services.pool_manager import PoolManager
+
+
+async def _manager_with_paused(paused: list, running: tuple = (), **kwargs) -> tuple:
+    client = AsyncMock()
+    entity = FunctionEntity(name="fn", scaling=ScalingConfig(max_capacity=4))
+    manager = PoolManager(
+        client, lambda _: entity, pause_enabled=True, pause_idle_seconds=60, **kwargs
+    )
+    pool = await manager.get_pool("fn")
+    now = time.time()
+    # Adopted in release order: the last one is the most recently used.
+    for n, worker_id in enumerate([*running, *paused]):
+        await pool.adopt(
+            WorkerInfo(id=worker_id, name=worker_id, ip_address="10.0.0.1", last_used_at=now + n)
+        )
+    for worker_id in paused:
+        manager._mark_paused(pool, worker_id, True)
+    return client, manager, pool
+
+
+@pytest.mark.asyncio
+async def test_running_idle_worker_is_preferred_over_paused():
+    # c1 was released before the paused ones: MRU alone would pick c3.
+    client, manager, _ = await _manager_with_paused(["c2", "c3"], running=("c1",))
+
+    worker = await manager.acquire_worker("fn")
+
+    assert worker.id == "c1"
+    client.resume_container.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_acquiring_a_paused_worker_resumes_the_next_one():
+    client, manager, _ = await _manager_with_paused(["c1", "c2"])
+
+    first = await manager.acquire_worker("fn")
+    await asyncio.sleep(0)
+    second = await manager.acquire_worker("fn")
+
+    resumed = {call.args[1].id for call in client.resume_container.await_args_list}
+    assert resumed == {first.id, second.id}
+    assert client.resume_container.await_count == 2
+    assert manager.resume_stats == {
+        "inline": 1,
+        "speculative": 1,
+        "hits": 1,
+        "repaused": 0,
+        "speculative_idle": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_unused_speculative_resume_is_paused_again():
+    client, manager, _ = await _manager_with_paused(
+        ["c1", "c2"], speculative_resume_linger=0.05, timers=TimerWheel(tick_seconds=0.01)
+    )
+
+    worker = await manager.acquire_worker("fn")
+    await asyncio.sleep(0.15)
+
+    client.pause_container.assert_awaited_once()
+    assert client.pause_container.await_args.args[1].id != worker.id
+    assert manager.resume_stats["repaused"] == 1
+    await manager.shutdown_all()
+
+
+@pytest.mark.asyncio
+async def test_scale_ahead_resumes_paused_workers_for_forecast_demand():
+    client, manager, pool = await _manager_with_paused(["c1", "c2", "c3"])
+    pool.forecaster = MagicMock()
+    pool.forecaster.forecast_concurrency.return_value = 2.0
+
+    await manager.scale_ahead()
+    await asyncio.sleep(0.01)
+
+    assert client.resume_container.await_count == 2
+    client.provision.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_no_speculative_resume_when_linger_is_zero():
+    client, manager, _ = await _manager_with_paused(["c1", "c2"], speculative_resume_linger=0)
+
+    await manager.acquire_worker("fn")
+    await asyncio.sleep(0)
+
+    assert client.resume_container.await_count == 1
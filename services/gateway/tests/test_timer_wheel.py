@@ -0,0 +1,92 @@
+"""
+Tests for the hierarchical timer wheel and per-worker idle deadlines.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.core.timer_wheel import TimerWheel
+from services.gateway.models.function import FunctionEntity, ScalingConfig
+from services.gateway.services.pool_manager import PoolManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _fired(wheel: TimerWheel, now: float) -> list:
+    return [callback() for callback in wheel.advance(now)]
+
+
+def test_timers_fire_at_their_tick_in_order():
+    clock = FakeClock()
+    wheel = TimerWheel(tick_seconds=1.0, wheel_size=4, levels=2, clock=clock)
+    wheel.schedule("b", 2.0, lambda: "b")
+    wheel.schedule("a", 1.0, lambda: "a")
+
+    assert _fired(wheel, 0.5) == []
+    assert _fired(wheel, 1.0) == ["a"]
+    assert _fired(wheel, 2.0) == ["b"]
+    assert len(wheel) == 0
+
+
+def test_far_timers_cascade_through_levels_and_overflow():
+    clock = FakeClock()
+    wheel = TimerWheel(tick_seconds=1.0, wheel_size=4, levels=2, clock=clock)
+    # Level 0 spans 4 ticks, level 1 spans 16; 37 only fits after two overflow passes.
+    for delay in (3, 6, 15, 37):
+        wheel.schedule(delay, float(delay), lambda d=delay: d)
+
+    fired_at = {}
+    for tick in range(1, 40):
+        for value in _fired(wheel, float(tick)):
+            fired_at[value] = tick
+
+    assert fired_at == {3: 3, 6: 6, 15: 15, 37: 37}
+
+
+def test_reschedule_and_cancel_replace_the_timer():
+    clock = FakeClock()
+    wheel = TimerWheel(tick_seconds=1.0, wheel_size=4, levels=2, clock=clock)
+    wheel.schedule("w", 2.0, lambda: "first")
+    wheel.schedule("w", 5.0, lambda: "second")
+    wheel.schedule("x", 1.0, lambda: "x")
+    assert wheel.cancel("x") is True
+
+    assert _fired(wheel, 4.0) == []
+    assert _fired(wheel, 5.0) == ["second"]
+    assert wheel.cancel("w") is False
+
+
+@pytest.mark.asyncio
+async def test_idle_worker_is_pruned_at_its_deadline():
+    client = AsyncMock()
+    client.provision.return_value = [WorkerInfo(id="c1", name="c1", ip_address="10.0.0.1")]
+    entity = FunctionEntity(name="fn", scaling=ScalingConfig(max_capacity=1))
+    manager = PoolManager(
+        client,
+        lambda _: entity,
+        idle_timeout_seconds=0.2,
+        timers=TimerWheel(tick_seconds=0.01),
+    )
+    worker = await manager.acquire_worker("fn")
+    await manager.release_worker("fn", worker)
+
+    # Re-arming on each release moves the deadline.
+    await asyncio.sleep(0.1)
+    worker = await manager.acquire_worker("fn")
+    await manager.release_worker("fn", worker)
+    await asyncio.sleep(0.15)
+    client.delete_container.assert_not_awaited()
+
+    await asyncio.sleep(0.15)
+    client.delete_container.assert_awaited_once_with("c1")
+    assert (await manager.get_pool("fn")).stats["total_workers"] == 0
+    await manager.shutdown_all()
@@ -0,0 +1,244 @@
+"""
+Tests for min_capacity maintenance and the warm-up API.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.api.deps import (
+    get_cluster_router,
+    get_function_registry,
+    get_pool_manager,
+    verify_authorization,
+)
+from services.gateway.core.exceptions import ContainerStartError
+from services.gateway.models.function import FunctionEntity, ScalingConfig
+from services.gateway.services.container_pool import ContainerPool
+from services.gateway.services.pool_manager import PoolManager
+from services.gateway.services.warm_pool import WarmPoolMaintainer
+
+
+def _worker(worker_id: str, last_used_at: float = 0.0) -> WorkerInfo:
+    return WorkerInfo(
+        id=worker_id, name=worker_id, ip_address="10.0.0.1", last_used_at=last_used_at
+    )
+
+
+class _CountingProvisioner:
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def provision(self, function_name: str):
+        self.calls += 1
+        worker_id = f"{function_name}-{self.calls}"
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return [_worker(worker_id)]
+        finally:
+            self.in_flight -= 1
+
+
+def _manager(provisioner, entities, warm_parallelism=2) -> PoolManager:
+    return PoolManager(
+        provisioner, lambda name: entities.get(name), warm_parallelism=warm_parallelism
+    )
+
+
+@pytest.mark.asyncio
+async def test_prune_keeps_min_capacity_floor():
+    pool = ContainerPool("fn", max_capacity=5, min_capacity=2)
+    old = time.time() - 1000
+    for i in range(4):
+        await pool.adopt(_worker(f"c{i}", last_used_at=old))
+
+    pruned = await pool.prune_idle_workers(idle_timeout=60.0)
+
+    assert [w.id for w in pruned] == ["c0", "c1"]
+    assert pool.size == 2
+
+
+@pytest.mark.asyncio
+async def test_warm_up_is_bounded_and_capped_by_max_capacity():
+    provisioner = _CountingProvisioner()
+    entities = {"fn": FunctionEntity(name="fn", scaling=ScalingConfig(max_capacity=4))}
+    manager = _manager(provisioner, entities, warm_parallelism=2)
+
+    provisioned = await manager.warm_up("fn", 10)
+
+    assert provisioned == 4
+    assert provisioner.max_in_flight == 2
+    assert (await manager.get_pool("fn")).stats["idle"] == 4
+    # Already warm: nothing to do.
+    assert await manager.warm_up("fn", 4) == 0
+
+
+@pytest.mark.asyncio
+async def test_maintainer_tops_up_only_functions_with_min_capacity():
+    provisioner = _CountingProvisioner()
+    entities = {
+        "warm": FunctionEntity(name="warm", scaling=ScalingConfig(max_capacity=3, min_capacity=2)),
+        "cold": FunctionEntity(name="cold", scaling=ScalingConfig(max_capacity=3)),
+    }
+    manager = _manager(provisioner, entities)
+    maintainer = WarmPoolMaintainer(manager, lambda: list(entities))
+
+    assert await maintainer.run_once() == {"warm": 2}
+    assert await maintainer.run_once() == {}
+
+    # A busy worker does not count toward the idle floor.
+    worker = await manager.acquire_worker("warm")
+    assert await maintainer.run_once() == {"warm": 1}
+    await manager.release_worker("warm", worker)
+    assert "cold" not in [s["function_name"] for s in await manager.get_pool_stats()]
+
+
+@pytest.mark.asyncio
+async def test_prewarmed_worker_is_handed_to_waiter():
+    pool = ContainerPool("fn", max_capacity=2, acquire_timeout=1.0)
+    busy = await pool.acquire(AsyncMock(return_value=[_worker("c1")]))
+    pool.max_capacity = 1  # Waiter cannot provision on its own.
+    waiter = asyncio.create_task(pool.acquire(AsyncMock()))
+    await asyncio.sleep(0.01)
+    pool.max_capacity = 2
+
+    await pool.prewarm(AsyncMock(return_value=[_worker("c2")]))
+
+    assert (await asyncio.wait_for(waiter, timeout=1.0)).id == "c2"
+    assert busy.id == "c1"
+
+
+class _BatchProvisioner:
+    def __init__(self, short_by: int = 0):
+        self.short_by = short_by
+        self.counts = []
+
+    async def provision(self, function_name: str, count: int = 1):
+        start = sum(self.counts)
+        self.counts.append(count)
+        await asyncio.sleep(0.01)
+        return [_worker(f"{function_name}-{start + i}") for i in range(count - self.short_by)]
+
+
+@pytest.mark.asyncio
+async def test_warm_up_requests_containers_in_batches():
+    provisioner = _BatchProvisioner()
+    entities = {"fn": FunctionEntity(name="fn", scaling=ScalingConfig(max_capacity=10))}
+    manager = PoolManager(provisioner, entities.get, provision_batch_size=4)
+
+    assert await manager.warm_up("fn", 10) == 10
+
+    assert sorted(provisioner.counts) == [2, 4, 4]
+    assert (await manager.get_pool("fn")).stats["idle"] == 10
+
+
+@pytest.mark.asyncio
+async def test_short_batch_frees_the_rest_of_its_reservation():
+    pool = ContainerPool("fn", max_capacity=5)
+    provisioner = _BatchProvisioner(short_by=1)
+
+    workers = await pool.prewarm(provisioner.provision, count=3)
+
+    assert len(workers) == 2
+    assert pool.stats["idle"] == 2
+    assert pool.provisioning_count == 0
+
+
+@pytest.mark.asyncio
+async def test_extra_workers_of_a_provision_go_to_the_idle_set():
+    pool = ContainerPool("fn", max_capacity=2)
+    provision = AsyncMock(return_value=[_worker("c1"), _worker("c2"), _worker("c3")])
+
+    worker = await pool.acquire(provision)
+
+    assert worker.id == "c1"
+    # Only what fits under max_capacity is adopted; c3 is left to orphan reconciliation.
+    assert [w.id for w in pool.get_idle_workers()] == ["c2"]
+    assert pool.size == 2
+
+
+@pytest.mark.asyncio
+async def test_warm_endpoint(main_app, async_client):
+    registry = Mock()
+    registry.get_function_config.side_effect = lambda name: {} if name == "fn" else None
+    pool_manager = MagicMock()
+    pool_manager.warm_up = AsyncMock(return_value=3)
+    pool_manager.get_pool = AsyncMock(return_value=ContainerPool("fn", max_capacity=5))
+
+    main_app.dependency_overrides[get_function_registry] = lambda: registry
+    main_app.dependency_overrides[get_pool_manager] = lambda: pool_manager
+    main_app.dependency_overrides[verify_authorization] = lambda: "user"
+    try:
+        response = await async_client.post("/functions/fn/warm?count=3")
+        missing = await async_client.post("/functions/missing/warm")
+        invalid = await async_client.post("/functions/fn/warm?count=0")
+    finally:
+        main_app.dependency_overrides = {}
+
+    assert response.status_code == 200
+    assert response.json()["provisioned"] == 3
+    pool_manager.warm_up.assert_awaited_once_with("fn", 3)
+    assert missing.status_code == 404
+    assert invalid.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_warm_endpoint_normalizes_name_and_maps_start_errors(main_app, async_client):
+    registry = Mock()
+    registry.get_function_config.side_effect = lambda name: {} if name == "fn" else None
+    pool_manager = MagicMock()
+    pool_manager.warm_up = AsyncMock(side_effect=ContainerStartError("fn", "agent down"))
+
+    main_app.dependency_overrides[get_function_registry] = lambda: registry
+    main_app.dependency_overrides[get_pool_manager] = lambda: pool_manager
+    main_app.dependency_overrides[verify_authorization] = lambda: "user"
+    try:
+        arn = "arn:aws:lambda:ap-northeast-1:123456789012:function:fn:prod"
+        response = await async_client.post(f"/functions/{arn}/warm")
+    finally:
+        main_app.dependency_overrides = {}
+
+    assert response.status_code == 503
+    pool_manager.warm_up.assert_awaited_once_with("fn", 1)
+
+
+@pytest.mark.asyncio
+async def test_warm_endpoint_rejects_functions_owned_by_another_replica(main_app, async_client):
+    registry = Mock()
+    registry.get_function_config.return_value = {}
+    pool_manager = MagicMock()
+    pool_manager.warm_up = AsyncMock(return_value=1)
+    cluster = Mock()
+    cluster.owns.return_value = False
+    cluster.owner_of.return_value = "gw-b"
+
+    main_app.dependency_overrides[get_function_registry] = lambda: registry
+    main_app.dependency_overrides[get_pool_manager] = lambda: pool_manager
+    main_app.dependency_overrides[get_cluster_router] = lambda: cluster
+    main_app.dependency_overrides[verify_authorization] = lambda: "user"
+    try:
+        response = await async_client.post("/functions/fn/warm")
+    finally:
+        main_app.dependency_overrides = {}
+
+    assert response.status_code == 409
+    assert response.json()["owner"] == "gw-b"
+    pool_manager.warm_up.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_wraps_provision_errors():
+    provisioner = AsyncMock()
+    provisioner.provision.side_effect = RuntimeError("rpc failed")
+    manager = _manager(provisioner, {"fn": FunctionEntity(name="fn")})
+
+    with pytest.raises(ContainerStartError):
+        await manager.warm_up("fn", 1)
@@ -0,0 +1,101 @@
+"""
+Tests for sticky worker affinity (consistent-hash ring over pool workers).
+"""
+
+from unittest.mock import AsyncMock, Mock, mock_open, patch
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.core.hash_ring import ConsistentHashRing
+from services.gateway.models.target_function import RouteAffinity
+from services.gateway.services.container_pool import ContainerPool
+from services.gateway.services.route_matcher import RouteMatcher
+
+
+def _worker(worker_id: str) -> WorkerInfo:
+    return WorkerInfo(id=worker_id, name=worker_id, ip_address="10.0.0.1")
+
+
+def test_ring_moves_only_keys_of_removed_node():
+    ring = ConsistentHashRing()
+    ring.sync(["w1", "w2", "w3", "w4"])
+    keys = [f"tenant-{i}" for i in range(500)]
+    before = {key: next(ring.walk(key)) for key in keys}
+
+    ring.remove("w2")
+    after = {key: next(ring.walk(key)) for key in keys}
+
+    moved = [key for key in keys if before[key] != after[key]]
+    assert moved and all(before[key] == "w2" for key in moved)
+    assert list(ring.walk("tenant-0")) and set(ring.walk("tenant-0")) == {"w1", "w3", "w4"}
+
+
+@pytest.mark.asyncio
+async def test_same_key_prefers_same_worker():
+    pool = ContainerPool("fn", max_capacity=4)
+    for i in range(4):
+        await pool.adopt(_worker(f"c{i}"))
+    provision = AsyncMock()
+
+    chosen = set()
+    for _ in range(5):
+        worker = await pool.acquire(provision, affinity_key="tenant-a")
+        chosen.add(worker.id)
+        await pool.release(worker)
+
+    assert len(chosen) == 1
+    assert pool.stats["affinity_hits"] == 5
+    provision.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_busy_preferred_worker_falls_back_to_idle_worker():
+    pool = ContainerPool("fn", max_capacity=2)
+    await pool.adopt(_worker("c0"))
+    await pool.adopt(_worker("c1"))
+    provision = AsyncMock()
+
+    first = await pool.acquire(provision, affinity_key="tenant-a")
+    second = await pool.acquire(provision, affinity_key="tenant-a")
+
+    # The key's worker is busy: the next ring successor is used instead.
+    assert {first.id, second.id} == {"c0", "c1"}
+    provision.assert_not_called()
+
+
+def test_route_matcher_exposes_affinity():
+    routes_yaml = """
+routes:
+  - path: "/tenants/{tenant_id}/items"
+    method: "GET"
+    function: "fn"
+    affinity:
+      path_param: tenant_id
+  - path: "/broken"
+    method: "GET"
+    function: "fn"
+    affinity:
+      header: X-Tenant
+      jwt_subject: true
+"""
+    registry = Mock()
+    registry.get_function_config.return_value = {}
+    with patch("builtins.open", mock_open(read_data=routes_yaml)):
+        with patch("services.gateway.config.config.ROUTING_CONFIG_PATH", "dummy/routes.yml"):
+            matcher = RouteMatcher(registry)
+            matcher.load_routing_config()
+
+    affinity = matcher.get_route_affinity("/tenants/{tenant_id}/items", "get")
+    assert affinity == RouteAffinity(path_param="tenant_id")
+    assert affinity.resolve_key({}, {"tenant_id": "t1"}, "user") == "t1"
+    # Invalid affinity is ignored; the route itself still matches.
+    assert matcher.get_route_affinity("/broken", "GET") is None
+    assert matcher.match_route("/broken", "GET")[0] == "fn"
+
+
+def test_affinity_key_sources():
+    headers = {"x-tenant": "acme"}
+    assert RouteAffinity(header="X-Tenant").resolve_key(headers, {}, None) == "acme"
+    assert RouteAffinity(jwt_subject=True).resolve_key({}, {}, "alice") == "alice"
+    assert RouteAffinity(header="X-Missing").resolve_key(headers, {}, "alice") is None
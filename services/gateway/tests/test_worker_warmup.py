@@ -0,0 +1,99 @@
+"""
+Tests for the synthetic warm-up invocation of new workers.
+"""
+
+import itertools
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.core.exceptions import ContainerStartError
+from services.gateway.models.function import FunctionEntity, ScalingConfig, WarmupConfig
+from services.gateway.services.pool_manager import PoolManager
+from services.gateway.services.worker_warmup import WorkerWarmer
+
+
+def _entity(warmup=None) -> FunctionEntity:
+    return FunctionEntity(name="fn", scaling=ScalingConfig(max_capacity=4), warmup=warmup)
+
+
+def _setup(warmer):
+    ids = itertools.count(1)
+    client = AsyncMock()
+
+    async def provision(function_name, count=1):
+        return [
+            WorkerInfo(id=f"c{n}", name=f"c{n}", ip_address="10.0.0.1")
+            for n in itertools.islice(ids, count)
+        ]
+
+    client.provision.side_effect = provision
+    return client, PoolManager(client, lambda _: _entity(WarmupConfig()), warmer=warmer)
+
+
+def test_warmup_is_parsed_from_functions_yml():
+    entity = FunctionEntity.from_dict(
+        "fn", {"image": "fn:latest", "warmup": {"payload": {"warmup": True}, "timeout": 5}}
+    )
+
+    assert entity.warmup == WarmupConfig(payload={"warmup": True}, timeout=5)
+    assert FunctionEntity.from_dict("fn", {"image": "fn:latest"}).warmup is None
+
+
+@pytest.mark.asyncio
+async def test_warm_posts_the_event_to_the_worker():
+    http = AsyncMock()
+    http.post.return_value = httpx.Response(200)
+    warmer = WorkerWarmer(http, lambda _: _entity(WarmupConfig(payload={"warmup": True})))
+    worker = WorkerInfo(id="c1", name="c1", ip_address="10.0.0.1", port=8080)
+
+    await warmer.warm("fn", worker)
+
+    url = http.post.await_args.args[0]
+    assert url == "http://10.0.0.1:8080/2015-03-31/functions/function/invocations"
+    assert http.post.await_args.kwargs["content"] == b'{"warmup": true}'
+    assert warmer.stats == {"warmed": 1, "failed": 0}
+
+
+@pytest.mark.asyncio
+async def test_function_error_fails_the_warmup():
+    http = AsyncMock()
+    http.post.return_value = httpx.Response(200, headers={"X-Amz-Function-Error": "Unhandled"})
+    warmer = WorkerWarmer(http, lambda _: _entity(WarmupConfig()))
+
+    with pytest.raises(ContainerStartError):
+        await warmer.warm("fn", WorkerInfo(id="c1", name="c1", ip_address="10.0.0.1"))
+    assert warmer.stats == {"warmed": 0, "failed": 1}
+
+
+@pytest.mark.asyncio
+async def test_warm_up_adds_only_successfully_warmed_workers():
+    warmer = MagicMock()
+    warmer.config_for.return_value = WarmupConfig()
+
+    async def warm(function_name, worker):
+        if worker.id == "c2":
+            raise ContainerStartError(function_name, "boom")
+
+    warmer.warm.side_effect = warm
+    client, manager = _setup(warmer)
+
+    assert await manager.warm_up("fn", 3) == 2
+
+    pool = await manager.get_pool("fn")
+    assert sorted(w.id for w in pool.get_idle_workers()) == ["c1", "c3"]
+    client.delete_container.assert_awaited_once_with("c2")
+
+
+@pytest.mark.asyncio
+async def test_demand_cold_start_is_not_warmed():
+    warmer = MagicMock()
+    warmer.config_for.return_value = WarmupConfig()
+    warmer.warm = AsyncMock()
+    _, manager = _setup(warmer)
+
+    await manager.acquire_worker("fn")
+
+    warmer.warm.assert_not_awaited()